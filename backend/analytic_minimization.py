@@ -0,0 +1,285 @@
+from functools import lru_cache, wraps
+from multiprocessing import get_context
+from threading import Lock
+from typing import Callable
+import numpy as np
+from backend.one_dimension_minimization import BOUNDS_NUMBER, CONSTANT_ZERO
+from backend.expression_compiler import ExpressionCompiler
+
+ANALYTIC_CACHE_SIZE = 128  # number of last functions whose critical points are kept
+SOLVING_TIME_BUDGET = 0.5  # seconds given to sympy for solving the equation of the critical points
+MAX_SOLVED_OPERATIONS = 40  # larger non-polynomial functions go straight to the iterative method
+SOLVER_START_TIMEOUT = 30.  # seconds given to the solving process to import sympy (not counted in the budget)
+SPAWN_CONTEXT = "spawn"  # forking the process with running Qt threads is not safe
+NON_SMOOTH_FUNCTIONS = {"Abs", "sign", "Piecewise", "Heaviside", "floor", "ceiling", "Min", "Max", "frac",
+                        "Derivative"}  # the critical points of such functions are not only the roots of the derivative
+
+
+def serve_solving_requests(connection):
+
+    """
+    Function answering the requests for the critical points in the solving process (it is terminated by the main
+     process when sympy does not solve the equation in time)
+
+    Parameters:
+    ----------
+    connection: Connection
+        End of the pipe receiving the function and the interval and sending its critical points back
+    """
+
+    import sympy  # the process reports that it is ready after the import, the import is not counted in the budget
+
+    connection.send(None)
+    while True:
+        try:
+            func, left, right = connection.recv()
+        except EOFError:  # the main process stopped
+            return
+        try:
+            connection.send(AnalyticMinimization.solved_critical_points(func, left, right))
+        except Exception:  # sympy raises different errors on the equations it can not solve
+            connection.send(None)
+
+
+class AnalyticMinimization:
+
+    """
+    Class with methods for finding the minimum of the one-dimensional function exactly: the candidates are the
+     roots of the derivative in the interval and the ends of the interval
+
+    Parameters:
+    ----------
+    solved: dict
+        Critical points of the non-polynomial functions by the functions and intervals (None if they were not found)
+    solver: tuple
+        Solving process and the end of its pipe (None until the first request and after the process is terminated)
+    """
+
+    solved = {}
+    solver = None
+    solver_lock = Lock()  # one request is solved at a time
+
+    @staticmethod
+    @lru_cache(maxsize=ANALYTIC_CACHE_SIZE)
+    def polynomial_critical_points(func):
+
+        """
+        Method for finding the critical points of the polynomial by the roots of its derivative (numpy.roots); the
+         repeated roots are removed first, because numpy finds them inaccurately (the results are cached)
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of one variable
+
+        Returns:
+        -------
+            Tuple of the real parts of all roots (the complex roots only add needless candidates, while the real
+             roots found with small imaginary parts are kept), None if the function is not a polynomial with
+             numeric coefficients
+        """
+
+        from sympy import Poly
+
+        variable = next(iter(func.free_symbols))
+        if not func.is_polynomial(variable):
+            return None
+        derivative = Poly(func.diff(variable), variable)
+        if derivative.domain.is_Exact:
+            derivative = derivative.sqf_part()
+        try:
+            coefficients = [float(coefficient) for coefficient in derivative.all_coeffs()]
+        except TypeError:  # symbolic coefficients
+            return None
+        return tuple(np.roots(coefficients).real.tolist()) if len(coefficients) > 1 else ()
+
+    @staticmethod
+    def solved_critical_points(func, left: float, right: float):
+
+        """
+        Method for finding the critical points of the smooth function in the interval by sympy.solveset
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of one variable
+        left: float
+            Left end of the interval
+        right: float
+            Right end of the interval
+
+        Returns:
+        -------
+            Tuple of the critical points, None if the function is not smooth and continuous in the interval or
+             its critical points are not a finite set of numbers
+        """
+
+        from sympy import Symbol, Interval, FiniteSet, Function, Derivative, solveset
+        from sympy.calculus.util import continuous_domain
+
+        variable = next(iter(func.free_symbols))
+        real_variable = Symbol(variable.name, real=True)
+        real_func = func.subs(variable, real_variable)
+        derivative = real_func.diff(real_variable)
+        functions = {type(function).__name__ for function in real_func.atoms(Function, Derivative) |
+                     derivative.atoms(Function, Derivative)}
+        if functions & NON_SMOOTH_FUNCTIONS:
+            return None
+        interval = Interval(left, right)
+        if continuous_domain(real_func, real_variable, interval) != interval:  # poles, for example 1/x on [-1, 1]
+            return None
+        points = solveset(derivative, real_variable, interval)
+        if not isinstance(points, FiniteSet) or not all(point.is_number for point in points):
+            return None
+        return tuple(float(point) for point in points)
+
+    @staticmethod
+    def solve_in_time(func, left: float, right: float):
+
+        """
+        Method for finding the critical points by sympy in the solving process not longer than SOLVING_TIME_BUDGET,
+         the process is terminated if it does not answer in time (sympy can not be interrupted in a thread)
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of one variable
+        left: float
+            Left end of the interval
+        right: float
+            Right end of the interval
+
+        Returns:
+        -------
+            Tuple of the critical points, None if they were not found in time (or at all)
+        """
+
+        from sympy import count_ops
+
+        key = (func, left, right)
+        if key in AnalyticMinimization.solved:
+            return AnalyticMinimization.solved[key]
+        if len(AnalyticMinimization.solved) >= ANALYTIC_CACHE_SIZE:
+            AnalyticMinimization.solved.clear()
+        points = None
+        if count_ops(func) <= MAX_SOLVED_OPERATIONS:
+            with AnalyticMinimization.solver_lock:
+                try:
+                    connection = AnalyticMinimization.solving_connection()
+                    if connection is not None:
+                        connection.send(key)
+                        if connection.poll(SOLVING_TIME_BUDGET):
+                            points = connection.recv()
+                        else:
+                            AnalyticMinimization.stop_solver()
+                except (OSError, EOFError):  # the solving process died
+                    AnalyticMinimization.stop_solver()
+        AnalyticMinimization.solved[key] = points
+        return points
+
+    @staticmethod
+    def solving_connection():
+
+        """
+        Method for getting the pipe to the solving process, the process is started if it is not running
+
+        Returns:
+        -------
+            End of the pipe of the process, None if the process did not start in time
+        """
+
+        if AnalyticMinimization.solver is None:
+            context = get_context(SPAWN_CONTEXT)
+            connection, process_connection = context.Pipe()
+            process = context.Process(target=serve_solving_requests, args=(process_connection,), daemon=True)
+            process.start()
+            process_connection.close()
+            AnalyticMinimization.solver = process, connection
+            if not connection.poll(SOLVER_START_TIMEOUT):
+                AnalyticMinimization.stop_solver()
+                return None
+            connection.recv()
+        return AnalyticMinimization.solver[1]
+
+    @staticmethod
+    def stop_solver():
+        if AnalyticMinimization.solver is not None:
+            process, connection = AnalyticMinimization.solver
+            AnalyticMinimization.solver = None
+            process.terminate()
+            process.join()
+            connection.close()
+
+    @staticmethod
+    @lru_cache(maxsize=ANALYTIC_CACHE_SIZE)
+    def numeric_function(func) -> Callable:
+        return ExpressionCompiler.lambdify(tuple(func.free_symbols), func)
+
+    @staticmethod
+    def minimize(func, interval: list):
+
+        """
+        Method for finding the minimum of the function in the interval without iterations
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of one variable
+        interval: list
+            Segment where the minimum is being searched for
+
+        Returns:
+        -------
+            Result in the format of the one-dimensional methods with the metrics (iterations, analytic and
+             critical_points), None if the function is not solved analytically
+        """
+
+        left, right = float(interval[0]), float(interval[1])
+        points = AnalyticMinimization.polynomial_critical_points(func)
+        if points is None:
+            points = AnalyticMinimization.solve_in_time(func, left, right)
+        if points is None:
+            return None
+
+        critical_points = [point for point in points if left < point < right]
+        candidates = np.array([left, right] + critical_points)
+        with np.errstate(all="ignore"):
+            values = np.broadcast_to(np.asarray(AnalyticMinimization.numeric_function(func)(candidates), dtype=float),
+                                     candidates.shape)
+        if not np.all(np.isfinite(values)):
+            return None
+        best = int(np.argmin(values))
+        res = CONSTANT_ZERO if abs(candidates[best]) < np.finfo(float).eps else float(candidates[best])
+        return [res, float(values[best]), {0: (interval[0], interval[1])},
+                {"iterations": 0, "analytic": True, "critical_points": len(critical_points)}]
+
+    @staticmethod
+    def analytic_first(method: Callable) -> Callable:
+
+        """
+        Method for making the version of the one-dimensional minimization method which first tries to find the
+         minimum analytically and runs the iterations only if it fails
+
+        Parameters:
+        ----------
+        method: Callable
+            Method of OneDimMinimization
+
+        Returns:
+        -------
+            Method with the same arguments
+        """
+
+        from sympy import Expr
+
+        @wraps(method)
+        def analytic_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
+            # incorrect problems, constants and black-box objectives are processed by the method itself
+            if isinstance(func, Expr) and len(interval) == BOUNDS_NUMBER and interval[0] < interval[1] and \
+                    len(func.free_symbols) == 1:
+                results = AnalyticMinimization.minimize(func, interval)
+                if results is not None:
+                    return results
+            return method(func, interval, eps, on_iteration=on_iteration)
+
+        return analytic_method
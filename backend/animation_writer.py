@@ -0,0 +1,193 @@
+import importlib.util
+import numpy as np
+import imageio.v2 as imageio
+from enum import Enum
+from dataclasses import dataclass
+from PIL import Image
+
+PALETTE_COLORS = 255  # colors of the global palette, the last palette index is reserved for transparency
+TRANSPARENT_INDEX = 255  # palette index of pixels that did not change since the previous frame
+PALETTE_SIZE = 256 * 3  # number of RGB components in the full GIF palette
+PALETTE_SAMPLE_STEP = 4  # every n-th pixel of every frame takes part in building the global palette
+MILLISECONDS_IN_SECOND = 1000
+GIF_DISPOSAL_KEEP = 1  # frame is drawn over the previous one, which makes the transparent pixels of delta frames work
+WEBP_QUALITY = 80
+MP4_PLUGIN = "imageio_ffmpeg"  # optional dependency of imageio for writing videos
+RGB_CHANNELS = 3
+
+
+class AnimationFormat(Enum):
+
+    """
+    Class with all formats of the minimization animation, the value is the file extension
+    """
+
+    GIF = ".gif"
+    WEBP = ".webp"
+    MP4 = ".mp4"
+
+
+@dataclass
+class RenderPreset:
+
+    """
+    Class of the resolution settings of the animation frames
+
+    Parameters:
+    ----------
+    figure_size: tuple
+        Width and height of the frame in inches
+    dpi: int
+        Number of pixels per inch
+    """
+
+    figure_size: tuple
+    dpi: int
+
+
+RENDER_PRESETS = {"draft": RenderPreset((4.8, 3.6), 60),  # fast encoding and small files
+                  "standard": RenderPreset((6.4, 4.8), 100),  # default size of matplotlib figures
+                  "high": RenderPreset((8., 6.), 150)}
+DEFAULT_RENDER_PRESET = "standard"
+
+
+class AnimationWriter:
+
+    """
+    Class with methods for encoding the frames of the minimization process into an animation file
+    """
+
+    @staticmethod
+    def write_animation(frames: list, path: str, animation_format: AnimationFormat = AnimationFormat.GIF,
+                        frame_duration: float = 1.) -> str:
+
+        """
+        Method for writing the frames into an animation of the chosen format
+
+        Parameters:
+        ----------
+        frames: list
+            Frames of the animation as arrays of pixels
+        path: str
+            Path of the result file without extension
+        animation_format: AnimationFormat
+            Format of the result file
+        frame_duration: float
+            Time of showing one frame in seconds
+
+        Returns:
+        -------
+            Path of the result file
+        """
+
+        frames = [AnimationWriter.to_rgb(frame) for frame in frames]
+        result_path = path + animation_format.value
+        if animation_format == AnimationFormat.GIF:
+            AnimationWriter.write_optimized_gif(frames, result_path, frame_duration)
+        elif animation_format == AnimationFormat.WEBP:
+            imageio.mimsave(result_path, frames, format="WEBP", duration=frame_duration * MILLISECONDS_IN_SECOND,
+                            loop=0, quality=WEBP_QUALITY)
+        else:
+            if importlib.util.find_spec(MP4_PLUGIN) is None:
+                raise ImportError("Package <" + MP4_PLUGIN + "> is required to write animations in the format <" +
+                                  animation_format.value + ">")
+            imageio.mimsave(result_path, frames, format="FFMPEG", fps=1. / frame_duration)
+        return result_path
+
+    @staticmethod
+    def write_optimized_gif(frames: list, path: str, frame_duration: float = 1.):
+
+        """
+        Method for writing the GIF animation with one palette for all frames,
+         in every frame after the first one only the changed pixels are stored
+
+        Parameters:
+        ----------
+        frames: list
+            RGB frames of the animation of the same size
+        path: str
+            Path of the result file
+        frame_duration: float
+            Time of showing one frame in seconds
+        """
+
+        palette = AnimationWriter.build_global_palette(frames)
+        indexed_frames = [np.asarray(Image.fromarray(frame).quantize(palette=palette, dither=Image.Dither.NONE))
+                          for frame in frames]
+
+        gif_frames = []
+        for previous, current in zip([None] + indexed_frames[:-1], indexed_frames):
+            gif_frames.append(AnimationWriter.delta_frame(previous, current, palette))
+
+        gif_frames[0].save(path, save_all=True, append_images=gif_frames[1:], optimize=False, loop=0,
+                           duration=int(frame_duration * MILLISECONDS_IN_SECOND), disposal=GIF_DISPOSAL_KEEP,
+                           transparency=TRANSPARENT_INDEX)
+
+    @staticmethod
+    def build_global_palette(frames: list) -> Image.Image:
+
+        """
+        Method for building one palette from the pixels of all frames of the animation
+
+        Parameters:
+        ----------
+        frames: list
+            RGB frames of the animation
+
+        Returns:
+        -------
+            Image in palette mode, whose palette is used for quantizing all frames
+        """
+
+        sample = np.concatenate([frame[::PALETTE_SAMPLE_STEP, ::PALETTE_SAMPLE_STEP] for frame in frames])
+        palette_image = Image.fromarray(sample).quantize(colors=PALETTE_COLORS, method=Image.Quantize.MEDIANCUT,
+                                                         dither=Image.Dither.NONE)
+        palette = palette_image.getpalette()
+        palette_image.putpalette(palette + [0] * (PALETTE_SIZE - len(palette)))
+        return palette_image
+
+    @staticmethod
+    def delta_frame(previous: np.ndarray, current: np.ndarray, palette: Image.Image) -> Image.Image:
+
+        """
+        Method for making the frame in which the pixels equal to the previous frame are transparent
+
+        Parameters:
+        ----------
+        previous: np.ndarray
+            Palette indices of the previous frame (None for the first frame)
+        current: np.ndarray
+            Palette indices of the current frame
+        palette: Image.Image
+            Image with the global palette of the animation
+
+        Returns:
+        -------
+            Frame in palette mode
+        """
+
+        indices = current.copy()
+        if previous is not None:
+            indices[indices == previous] = TRANSPARENT_INDEX
+        frame = Image.fromarray(indices, mode="P")
+        frame.putpalette(palette.getpalette())
+        frame.info["transparency"] = TRANSPARENT_INDEX
+        return frame
+
+    @staticmethod
+    def to_rgb(frame: np.ndarray) -> np.ndarray:
+
+        """
+        Method for dropping the alpha channel of the frame
+
+        Parameters:
+        ----------
+        frame: np.ndarray
+            Frame of the animation in RGB or RGBA format
+
+        Returns:
+        -------
+            Frame in RGB format
+        """
+
+        return np.ascontiguousarray(np.asarray(frame)[:, :, :RGB_CHANNELS])
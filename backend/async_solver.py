@@ -0,0 +1,368 @@
+import asyncio
+import importlib
+import os
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from inspect import signature
+from typing import Callable
+from multiprocessing import get_context
+from backend.one_dimension_minimization import OneDimMinimization, ONE_DIM_MINIMIZATION_METHODS, EMPTY_STR
+from backend.multi_dimension_minimization import MultiDimMinimization, MULTI_DIM_MINIMIZATION_METHODS
+from backend.global_minimization import GLOBAL_MINIMIZATION_METHODS
+from backend.constrained_minimization import CONSTRAINED_MINIMIZATION_METHODS
+from backend.expression_compiler import ExpressionCompiler
+
+SOLVER_METHODS = {**ONE_DIM_MINIMIZATION_METHODS, **MULTI_DIM_MINIMIZATION_METHODS, **GLOBAL_MINIMIZATION_METHODS,
+                  **CONSTRAINED_MINIMIZATION_METHODS}  # all minimization methods by their names
+MAX_DIMENSION = 3  # largest number of variables of the target function
+SPAWN_CONTEXT = "spawn"  # processes are spawned, forking the process with the running event loop is not safe
+CANCEL_CHECK_PERIOD = 0.05  # seconds between the checks of the cancellation in the solving process
+ITERATIONS_QUEUE_SIZE = 256  # iterations sent ahead of the reader, the solver waits when the queue is full
+QUEUE_POLL_INTERVAL = 0.1  # seconds of waiting for the next iteration before checking that the solve has finished
+END_OF_ITERATIONS = None  # last element of the queue of iterations
+OVERLOADED_MESSAGE = "Too many minimization requests are waiting: {}"
+UNKNOWN_METHOD_MESSAGE = "Unknown minimization method: {}"
+WARM_UP_FUNCTION = "x**2 + y**2"  # function compiled by every process of the pool before the first request
+
+
+class SolveCancelled(Exception):
+
+    """
+    Exception raised inside the solving process when the request is cancelled
+    """
+
+
+class SolverOverloaded(Exception):
+
+    """
+    Exception raised by AsyncSolver when the limit of the waiting requests is reached
+    """
+
+
+class CancellationCheck:
+
+    """
+    Class of the iteration callback of the solving process: it sends the iterations to the queue and raises
+     SolveCancelled when the request is cancelled (the shared event is checked not more often than every
+     CANCEL_CHECK_PERIOD seconds, because every check is a call to the manager process)
+
+    Parameters:
+    ----------
+    cancel_event: Event
+        Event of the manager set when the request is cancelled
+    iterations: Queue
+        Queue of the manager receiving the iterations (None if nobody reads them)
+    """
+
+    def __init__(self, cancel_event, iterations=None):
+        self.cancel_event = cancel_event
+        self.iterations = iterations
+        self.last_check = time.monotonic()
+
+    def __call__(self, iter_num: int, bounds: tuple):
+        if time.monotonic() - self.last_check >= CANCEL_CHECK_PERIOD:
+            self.check()
+        if self.iterations is None:
+            return
+        while True:  # the solver waits for the slow reader, but it still can be cancelled
+            try:
+                self.iterations.put((iter_num, bounds), timeout=CANCEL_CHECK_PERIOD)
+                return
+            except queue.Full:
+                self.check()
+
+    def check(self):
+        self.last_check = time.monotonic()
+        if self.cancel_event.is_set():
+            raise SolveCancelled()
+
+
+def prepare_process(modules: tuple = ()):
+
+    """
+    Function preparing the new process of the pool: the heavy modules are imported and sympy compiles the first
+     expression before the process receives the requests
+
+    Parameters:
+    ----------
+    modules: tuple
+        Names of the modules imported in addition to the solvers (for example, the rendering stack)
+    """
+
+    for module_name in modules:
+        importlib.import_module(module_name)
+    ExpressionCompiler.compile(WARM_UP_FUNCTION, MAX_DIMENSION)
+
+
+def solve_request(function: str, interval: list, eps: float, method: str, constraints: str, cancel_event,
+                  iterations=None) -> list:
+
+    """
+    Function solving one minimization problem (executed in a process of the pool, so the problem is sent as text)
+
+    Parameters:
+    ----------
+    function: str
+        Target function
+    interval: list
+        Initial uncertainty interval (interval of every variable for functions of several variables)
+    eps: float
+        Accuracy of the minimum search
+    method: str
+        Name of the minimization method (key of SOLVER_METHODS)
+    constraints: str
+        Inequality constraints separated by semicolons (only for the constrained methods)
+    cancel_event: Event
+        Event of the manager set when the request is cancelled
+    iterations: Queue
+        Queue of the manager receiving the iterations (None if nobody reads them)
+
+    Returns:
+    -------
+        Result of the minimization method, ValueError is raised if the problem is incorrect
+    """
+
+    # the process solves many problems one after another
+    OneDimMinimization.error_msg, MultiDimMinimization.error_msg = EMPTY_STR, EMPTY_STR
+    solve = SOLVER_METHODS[method]
+    try:
+        compiled_function = ExpressionCompiler.compile(function.strip(), MAX_DIMENSION)
+        parsed_constraints = ExpressionCompiler.parse_constraints(constraints.strip(), MAX_DIMENSION)
+        if parsed_constraints:
+            solve = partial(solve, constraints=parsed_constraints)
+        results = solve(compiled_function.expr, interval, eps,
+                        on_iteration=CancellationCheck(cancel_event, iterations))
+        error_msg = OneDimMinimization.error_msg or MultiDimMinimization.error_msg
+        if error_msg:
+            raise ValueError(error_msg)
+    finally:
+        if iterations is not None:
+            try:  # the queue of the cancelled request stays full, its reader finishes when the request is done
+                iterations.put(END_OF_ITERATIONS, timeout=CANCEL_CHECK_PERIOD)
+            except queue.Full:
+                pass
+    if results and not isinstance(results[0], tuple):  # optimum of the one-dimensional methods may be sympy number
+        results[0], results[1] = float(results[0]), float(results[1])
+    return results
+
+
+class AsyncSolver:
+
+    """
+    Class solving minimization problems for the asyncio code: the problems are solved in a pool of processes, not
+     more than "max_workers" at once, the other requests wait for their turn in the order of arrival
+
+    Parameters:
+    ----------
+    max_workers: int
+        Number of processes solving the problems (number of processors if None)
+    max_pending: int
+        Limit of the requests waiting for a free process, SolverOverloaded is raised beyond it (no limit if None)
+    warm_up_modules: tuple
+        Names of the modules imported by every process of the pool when it starts
+    executor: ProcessPoolExecutor
+        Pool of the solving processes (it is started by the first request)
+    manager: SyncManager
+        Manager of the events and queues shared with the solving processes
+    pending: int
+        Number of the requests waiting for a free process
+    """
+
+    def __init__(self, max_workers: int = None, max_pending: int = None, warm_up_modules: tuple = ()):
+        self.max_workers = max_workers or os.cpu_count()
+        self.max_pending = max_pending
+        self.warm_up_modules = tuple(warm_up_modules)
+        self.executor = None
+        self.manager = None
+        self.slots = None  # semaphore of the event loop in which the requests are awaited
+        self.loop = None
+        self.pending = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+
+        """
+        Method for stopping the solving processes, the solver can be used again after it
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.manager.shutdown()
+            self.executor, self.manager = None, None
+
+    def start(self):
+        if self.executor is None:
+            context = get_context(SPAWN_CONTEXT)
+            self.manager = context.Manager()
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context,
+                                                initializer=prepare_process, initargs=(self.warm_up_modules,))
+        if self.loop is not asyncio.get_running_loop():  # semaphore can be awaited only in one event loop
+            self.slots, self.loop = asyncio.Semaphore(self.max_workers), asyncio.get_running_loop()
+
+    async def solve(self, function: str, interval: list, eps: float, method: str, constraints: str = EMPTY_STR,
+                    iterations=None) -> list:
+
+        """
+        Method for solving the minimization problem without blocking the event loop; if the awaiting task is
+         cancelled, the solving process stops at the next iteration
+
+        Parameters:
+        ----------
+        function: str
+            Target function
+        interval: list
+            Initial uncertainty interval (interval of every variable for functions of several variables)
+        eps: float
+            Accuracy of the minimum search
+        method: str
+            Name of the minimization method (key of SOLVER_METHODS)
+        constraints: str
+            Inequality constraints separated by semicolons (only for the constrained methods)
+        iterations: Queue
+            Queue of the manager receiving the iterations (see iterate)
+
+        Returns:
+        -------
+            Result of the minimization method, ValueError is raised if the problem is incorrect
+        """
+
+        if method not in SOLVER_METHODS:
+            raise ValueError(UNKNOWN_METHOD_MESSAGE.format(method))
+        return await self.run(solve_request, function, interval, eps, method, constraints, iterations=iterations)
+
+    async def warm_up(self):
+
+        """
+        Method for starting all processes of the pool at once, so the first requests do not wait for them
+        """
+
+        await asyncio.gather(*(self.run(prepare_process, self.warm_up_modules) for _ in range(self.max_workers)))
+
+    async def run(self, task: Callable, *args, **kwargs):
+
+        """
+        Method for executing the function in the pool with the same limits as the minimization problems
+
+        Parameters:
+        ----------
+        task: Callable
+            Function defined at the module level (it is sent to another process), it receives the event of the
+             cancellation as the keyword argument "cancel_event" if it has such parameter
+        args, kwargs:
+            Arguments of the function
+
+        Returns:
+        -------
+            Result of the function
+        """
+
+        self.start()
+        if self.max_pending is not None and self.pending >= self.max_pending:
+            raise SolverOverloaded(OVERLOADED_MESSAGE.format(self.pending))
+        self.pending += 1
+        try:
+            await self.slots.acquire()
+        finally:
+            self.pending -= 1
+        try:
+            cancel_event = self.manager.Event()
+            if "cancel_event" in signature(task).parameters:
+                kwargs["cancel_event"] = cancel_event
+            future = asyncio.get_running_loop().run_in_executor(self.executor, partial(task, *args, **kwargs))
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # the process is free for the next request only when the solver has noticed the cancellation
+                cancel_event.set()
+                try:
+                    await future
+                except Exception:  # SolveCancelled or the result which is not needed anymore
+                    pass
+                raise
+        finally:
+            self.slots.release()
+
+    def iterate(self, function: str, interval: list, eps: float, method: str,
+                constraints: str = EMPTY_STR) -> "SolveStream":
+
+        """
+        Method for solving the minimization problem and reading its iterations while it is solved
+
+        Parameters:
+        ----------
+        function: str
+            Target function
+        interval: list
+            Initial uncertainty interval (interval of every variable for functions of several variables)
+        eps: float
+            Accuracy of the minimum search
+        method: str
+            Name of the minimization method (key of SOLVER_METHODS)
+        constraints: str
+            Inequality constraints separated by semicolons (only for the constrained methods)
+
+        Returns:
+        -------
+            Asynchronous iterator over the numbers and uncertainty intervals of the iterations, the result of the
+             method is got by awaiting it
+        """
+
+        self.start()
+        iterations = self.manager.Queue(ITERATIONS_QUEUE_SIZE)
+        task = asyncio.ensure_future(self.solve(function, interval, eps, method, constraints, iterations))
+        return SolveStream(task, iterations)
+
+
+class SolveStream:
+
+    """
+    Class of the iterations of the problem solved by AsyncSolver:
+
+        async for iter_num, bounds in stream: ...
+        results = await stream
+
+    the solve is stopped by cancel() (for example, when the reader leaves the loop before the end)
+
+    Parameters:
+    ----------
+    task: asyncio.Task
+        Task of the solve
+    iterations: Queue
+        Queue of the manager receiving the iterations
+    """
+
+    def __init__(self, task: asyncio.Task, iterations):
+        self.task = task
+        self.iterations = iterations
+        self.finished = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> tuple:
+        loop = asyncio.get_running_loop()
+        while not self.finished:
+            try:
+                iteration = await loop.run_in_executor(None, self.iterations.get, True, QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                # the request cancelled before it got a process never puts the end of the iterations
+                self.finished = self.task.done()
+                continue
+            if iteration is END_OF_ITERATIONS:
+                self.finished = True
+            else:
+                return iteration
+        raise StopAsyncIteration
+
+    def __await__(self):
+        return self.task.__await__()
+
+    def cancel(self):
+        self.task.cancel()
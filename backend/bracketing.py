@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+from functools import wraps
+from math import isfinite, copysign
+from typing import Callable
+import numpy as np
+from backend.one_dimension_minimization import OneDimMinimization, CONSTANT_TAO, BOUNDS_NUMBER
+from backend.multi_dimension_minimization import METRICS_INDEX
+from backend.objective import Objective
+from backend.error_message import ErrorMessage
+
+GOLDEN_GROWTH = 1 + CONSTANT_TAO  # magnification of the step between two points of the bracket search
+PARABOLIC_GROWTH_LIMIT = 100.  # largest magnification of the step taken by the parabolic extrapolation
+MIN_PARABOLA_DENOMINATOR = 1e-20  # protects the extrapolation from the division by zero on the collinear points
+INITIAL_STEP = 1.  # distance to the second point when the search starts from a single point
+MAX_BRACKETING_EVALUATIONS = 200  # the function is considered unbounded below if the bracket is not found before
+
+
+@dataclass(frozen=True)
+class Bracket:
+
+    """
+    Class of the triple of points bracketing the minimum: the value at the middle point is not greater than
+     the values at the ends
+
+    Parameters:
+    ----------
+    left: float
+        Left end of the bracket
+    middle: float
+        Point with the smallest value
+    right: float
+        Right end of the bracket
+    evaluations: int
+        Number of the function evaluations spent on the search
+    """
+
+    left: float
+    middle: float
+    right: float
+    evaluations: int
+
+    @property
+    def interval(self) -> list:
+        return [self.left, self.right]
+
+
+class Bracketing:
+
+    """
+    Class with methods for finding the interval containing the minimum of the one-dimensional function when
+     the entered interval is only a rough guess or a single starting point
+    """
+
+    @staticmethod
+    def find_bracket(numeric_func: Callable, first: float, second: float):
+
+        """
+        Method for expanding the search from two points downhill with the golden ratio steps and the parabolic
+         extrapolation until the function grows again
+
+        Parameters:
+        ----------
+        numeric_func: Callable
+            Function of one float argument
+        first: float
+            First starting point
+        second: float
+            Second starting point (the search moves from the point with the larger value to the smaller one)
+
+        Returns:
+        -------
+            Bracket of the minimum (None if the function decreases for MAX_BRACKETING_EVALUATIONS evaluations or
+             its values are not finite)
+        """
+
+        evaluations = 0
+
+        def value(point: float) -> float:
+            nonlocal evaluations
+            evaluations += 1
+            with np.errstate(all="ignore"):  # the values outside the domain of the function are nan
+                return float(numeric_func(point))
+
+        a, b = first, second
+        f_a, f_b = value(a), value(b)
+        if f_b > f_a:  # the search goes downhill from a to b
+            a, b, f_a, f_b = b, a, f_b, f_a
+        c = b + GOLDEN_GROWTH * (b - a)
+        f_c = value(c)
+        while f_b > f_c:
+            if evaluations >= MAX_BRACKETING_EVALUATIONS:
+                return None
+            # minimum of the parabola through a, b, c and the farthest point the extrapolation may reach
+            r, q = (b - a) * (f_b - f_c), (b - c) * (f_b - f_a)
+            u = b - ((b - c) * q - (b - a) * r) / (2 * copysign(max(abs(q - r), MIN_PARABOLA_DENOMINATOR), q - r))
+            u_limit = b + PARABOLIC_GROWTH_LIMIT * (c - b)
+            if (b - u) * (u - c) > 0:  # the parabolic point is between b and c
+                f_u = value(u)
+                if f_u < f_c:
+                    return Bracketing.make_bracket(b, u, c, evaluations)
+                if f_u > f_b:
+                    return Bracketing.make_bracket(a, b, u, evaluations)
+                u = c + GOLDEN_GROWTH * (c - b)  # the parabola did not help, the golden ratio step is taken
+                f_u = value(u)
+            elif (c - u) * (u - u_limit) > 0:  # the parabolic point is between c and the limit
+                f_u = value(u)
+                if f_u < f_c:
+                    b, c, u = c, u, u + GOLDEN_GROWTH * (u - c)
+                    f_b, f_c, f_u = f_c, f_u, value(u)
+            elif (u - u_limit) * (u_limit - c) >= 0:  # the parabolic point is beyond the limit
+                u = u_limit
+                f_u = value(u)
+            else:  # the parabola opens downwards
+                u = c + GOLDEN_GROWTH * (c - b)
+                f_u = value(u)
+            a, b, c = b, c, u
+            f_a, f_b, f_c = f_b, f_c, f_u
+        if not all(isfinite(f) for f in (f_a, f_b, f_c)):
+            return None
+        return Bracketing.make_bracket(a, b, c, evaluations)
+
+    @staticmethod
+    def make_bracket(a: float, b: float, c: float, evaluations: int) -> Bracket:
+        return Bracket(min(a, c), b, max(a, c), evaluations)
+
+    @staticmethod
+    def starting_points(interval: list) -> tuple:
+
+        """
+        Method for getting the starting points of the search from the entered interval
+
+        Parameters:
+        ----------
+        interval: list
+            Rough interval of the minimum or a single starting point
+
+        Returns:
+        -------
+            Two different starting points
+        """
+
+        if len(interval) == 1 or interval[0] == interval[1]:
+            return interval[0], interval[0] + INITIAL_STEP
+        return interval[0], interval[1]
+
+    @staticmethod
+    def bracketed(method: Callable) -> Callable:
+
+        """
+        Method for making the version of the one-dimensional minimization method which finds the bracket of the
+         minimum first and then searches for the minimum in it
+
+        Parameters:
+        ----------
+        method: Callable
+            Method of OneDimMinimization
+
+        Returns:
+        -------
+            Method with the same arguments, its interval can be a rough guess or a single point; the result has
+             the metrics: number of iterations, number of the evaluations of the bracket search and the bracket
+        """
+
+        @wraps(method)
+        def bracketed_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
+            if not 0 < len(interval) <= BOUNDS_NUMBER:
+                OneDimMinimization.logger.error(ErrorMessage.ERROR_TOO_MUCH_BOUNDS.value)
+                OneDimMinimization.error_msg = ErrorMessage.ERROR_TOO_MUCH_BOUNDS.value
+                return []
+            if len(func.free_symbols) > 1:
+                OneDimMinimization.logger.error(ErrorMessage.ERROR_WRONG_DIMENSION.value)
+                OneDimMinimization.error_msg = ErrorMessage.ERROR_WRONG_DIMENSION.value
+                return []
+
+            first, second = Bracketing.starting_points(interval)
+            if len(func.free_symbols) == 0:  # any interval contains the minimum of the constant
+                bracket = Bracket(min(first, second), (first + second) / 2, max(first, second), 0)
+            else:
+                objective, variable = Objective.from_function(func), next(iter(func.free_symbols))
+                bracket = Bracketing.find_bracket(lambda point: objective.subs(variable, point), first, second)
+            if bracket is None:
+                OneDimMinimization.logger.error(ErrorMessage.ERROR_BRACKET_NOT_FOUND.value)
+                OneDimMinimization.error_msg = ErrorMessage.ERROR_BRACKET_NOT_FOUND.value
+                return []
+
+            results = method(func, bracket.interval, eps, on_iteration=on_iteration)
+            if results:  # the metrics of the method (if it has them) are kept
+                metrics = results[METRICS_INDEX] if len(results) > METRICS_INDEX else {}
+                results[METRICS_INDEX:] = [{**metrics, "iterations": max(results[2].keys()),
+                                            "bracketing_evaluations": bracket.evaluations,
+                                            "bracket": tuple(bracket.interval)}]
+            return results
+
+        return bracketed_method
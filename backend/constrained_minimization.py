@@ -0,0 +1,314 @@
+from functools import lru_cache
+from typing import Callable
+import numpy as np
+from backend.multi_dimension_minimization import MultiDimMinimization, METRICS_INDEX
+from backend.vectorized_evaluation import VectorizedObjective, VECTORIZED_FUNCTIONS_CACHE_SIZE
+from backend.expression_compiler import ExpressionCompiler
+
+MAX_OUTER_ITERATIONS = 20  # limit of the unconstrained problems solved by one constrained method
+INITIAL_PENALTY = 1.  # coefficient of the violation in the first unconstrained problem of the penalty methods
+PENALTY_GROWTH = 10.  # increase of the penalty coefficient between the unconstrained problems
+INITIAL_BARRIER = 1.  # coefficient of the logarithmic barrier in the first unconstrained problem
+BARRIER_REDUCTION = 0.1  # decrease of the barrier coefficient between the unconstrained problems
+VIOLATION_DECREASE = 0.25  # the penalty of the augmented Lagrangian grows if the violation decreased slower
+INNER_METRICS = ["iterations", "evaluations", "gradient_evaluations"]  # metrics summed over unconstrained problems
+LESS_OPERATORS = ("<", "<=")
+
+
+@lru_cache(maxsize=VECTORIZED_FUNCTIONS_CACHE_SIZE)
+def compile_problem(func, constraints: tuple) -> tuple:
+
+    """
+    Function for compiling the target function and the constraints together into one function of the array of
+     points and its jacobian (the results are cached); every constraint is turned into the form "g(x) <= 0"
+
+    Parameters:
+    ----------
+    func: sympy.Expr
+        Target function of finding the minimum
+    constraints: tuple
+        Inequality constraints in sympy format
+
+    Returns:
+    -------
+        Variables of the problem ordered by their names, function calculating the target function and all
+         constraints at the points given as rows of the array (one row of the result for each of them) and the
+         function calculating their gradients (the array of the shape: functions, points, variables)
+    """
+
+    from sympy import Matrix  # sympy is imported on the first compilation, it slows the start down
+
+    functions = [func] + [constraint.lhs - constraint.rhs if constraint.rel_op in LESS_OPERATORS else
+                          constraint.rhs - constraint.lhs for constraint in constraints]
+    variables = tuple(sorted(set().union(*(function.free_symbols for function in functions)), key=str))
+    compiled_values = ExpressionCompiler.lambdify(variables, functions)
+    # the constant problem without variables has no jacobian, it is not minimized (see solve_sequence)
+    compiled_jacobian = ExpressionCompiler.lambdify(variables, Matrix(functions).jacobian(variables).tolist()) \
+        if variables else None
+
+    def problem_values(points: np.ndarray) -> np.ndarray:
+        # constant parts are calculated as scalars, so every row is broadcast to all points
+        return np.vstack([np.broadcast_to(np.asarray(values, dtype=float), (len(points),))
+                          for values in compiled_values(*points.T)])
+
+    def problem_jacobian(points: np.ndarray) -> np.ndarray:
+        return np.array([[np.broadcast_to(np.asarray(derivative, dtype=float), (len(points),))
+                          for derivative in row] for row in compiled_jacobian(*points.T)]).transpose(0, 2, 1)
+
+    return variables, problem_values, problem_jacobian
+
+
+class MeritFunction(VectorizedObjective):
+
+    """
+    Class of the unconstrained function "f(x) + sum of terms(g(x))" minimized by the constrained methods instead of
+     the target function, the target function and the constraints are calculated by one call at every point
+
+    Parameters:
+    ----------
+    problem: tuple
+        Compiled problem (see compile_problem)
+    terms: Callable
+        Function of the values of the constraints giving the added terms (of the same shape)
+    slopes: Callable
+        Derivatives of the terms by the values of the constraints
+    """
+
+    def __init__(self, problem: tuple, terms: Callable, slopes: Callable):
+        variables, self.problem_values, self.problem_jacobian = problem
+        VectorizedObjective.__init__(self, variables, self.merit_values, self.merit_gradients)
+        self.terms, self.slopes = terms, slopes
+
+    def merit_values(self, points: np.ndarray) -> np.ndarray:
+        values = self.problem_values(points)
+        return values[0] + self.terms(values[1:]).sum(axis=0)
+
+    def merit_gradients(self, points: np.ndarray) -> np.ndarray:
+        values, jacobian = self.problem_values(points), self.problem_jacobian(points)
+        return jacobian[0] + np.einsum("cp,cpv->pv", self.slopes(values[1:]), jacobian[1:])
+
+
+class ConstrainedMinimization:
+
+    """
+    Class uniting the methods of minimizing functions of several variables in the box with the inequality
+     constraints; every method solves a sequence of unconstrained problems by the multivariate method, the results
+     have the same structure as the results of MultiDimMinimization, the boxes of all unconstrained problems are
+     numbered one after another and the metrics include the violations of the constraints at the found point
+    """
+
+    @staticmethod
+    def penalty_method(func, interval: list = [], eps: float = 0., on_iteration=None, constraints: tuple = (),
+                       inner_method: Callable = MultiDimMinimization.bfgs_method) -> list:
+
+        """
+        Method for minimizing a function with the constraints by the quadratic penalty of their violation,
+         the penalty coefficient grows until the violation becomes less than the accuracy
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search and of the constraints
+        on_iteration: Callable
+            Function called after each iteration of the unconstrained method with its number and box
+        constraints: tuple
+            Inequality constraints in sympy format
+        inner_method: Callable
+            Method of MultiDimMinimization solving the unconstrained problems
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes of the iterations and the metrics with the violations of the constraints
+        """
+
+        def make_merit(problem: tuple, penalty: float) -> MeritFunction:
+            return MeritFunction(problem, lambda g: penalty * np.maximum(g, 0.) ** 2,
+                                 lambda g: 2 * penalty * np.maximum(g, 0.))
+
+        def update(penalty: float, violations: np.ndarray, previous_violation: float) -> tuple:
+            return penalty * PENALTY_GROWTH, np.max(violations, initial=0.) <= eps
+
+        return ConstrainedMinimization.solve_sequence(func, interval, eps, on_iteration, constraints, inner_method,
+                                                      INITIAL_PENALTY, make_merit, update)
+
+    @staticmethod
+    def log_barrier_method(func, interval: list = [], eps: float = 0., on_iteration=None, constraints: tuple = (),
+                           inner_method: Callable = MultiDimMinimization.bfgs_method) -> list:
+
+        """
+        Method for minimizing a function with the constraints by the logarithmic barrier "-mu * log(-g(x))",
+         the barrier coefficient decreases until the bound of the error "mu * number of constraints" and the
+         violation become less than the accuracy; near the border the barrier is continued by the parabola,
+         so the unconstrained methods may start outside of the feasible set
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search and of the constraints
+        on_iteration: Callable
+            Function called after each iteration of the unconstrained method with its number and box
+        constraints: tuple
+            Inequality constraints in sympy format
+        inner_method: Callable
+            Method of MultiDimMinimization solving the unconstrained problems
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes of the iterations and the metrics with the violations of the constraints
+        """
+
+        def make_merit(problem: tuple, barrier: float) -> MeritFunction:
+            # the logarithm is used while the constraint is farther than "barrier" from the border, the parabola
+            # beyond it has the same value, slope and curvature at the junction
+            def terms(g: np.ndarray) -> np.ndarray:
+                shift = np.maximum(g + barrier, 0.) / barrier
+                return -barrier * np.log(np.maximum(-g, barrier)) + barrier * (shift + shift ** 2 / 2)
+
+            def slopes(g: np.ndarray) -> np.ndarray:
+                return barrier / np.maximum(-g, barrier) + np.maximum(g + barrier, 0.) / barrier
+
+            return MeritFunction(problem, terms, slopes)
+
+        def update(barrier: float, violations: np.ndarray, previous_violation: float) -> tuple:
+            return barrier * BARRIER_REDUCTION, np.max(violations, initial=0.) <= eps and \
+                barrier * len(violations) <= eps
+
+        return ConstrainedMinimization.solve_sequence(func, interval, eps, on_iteration, constraints, inner_method,
+                                                      INITIAL_BARRIER, make_merit, update)
+
+    @staticmethod
+    def augmented_lagrangian_method(func, interval: list = [], eps: float = 0., on_iteration=None,
+                                    constraints: tuple = (),
+                                    inner_method: Callable = MultiDimMinimization.bfgs_method) -> list:
+
+        """
+        Method for minimizing a function with the constraints by the augmented Lagrangian method: the multipliers
+         of the constraints are updated after every unconstrained problem, so the penalty coefficient stays moderate
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search and of the constraints
+        on_iteration: Callable
+            Function called after each iteration of the unconstrained method with its number and box
+        constraints: tuple
+            Inequality constraints in sympy format
+        inner_method: Callable
+            Method of MultiDimMinimization solving the unconstrained problems
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes of the iterations and the metrics with the violations of the constraints
+             and the multipliers ("multipliers")
+        """
+
+        multipliers = np.zeros((len(constraints), 1))  # column of the multipliers is broadcast to all points
+
+        def make_merit(problem: tuple, penalty: float) -> MeritFunction:
+            return MeritFunction(problem,
+                                 lambda g: (np.maximum(multipliers + penalty * g, 0.) ** 2 - multipliers ** 2) /
+                                 (2 * penalty),
+                                 lambda g: np.maximum(multipliers + penalty * g, 0.))
+
+        def update(penalty: float, violations: np.ndarray, previous_violation: float) -> tuple:
+            multipliers[:, 0] = np.maximum(multipliers[:, 0] + penalty * violations, 0.)
+            violation = np.max(violations, initial=0.)
+            if violation > VIOLATION_DECREASE * previous_violation:
+                penalty *= PENALTY_GROWTH
+            return penalty, violation <= eps
+
+        result = ConstrainedMinimization.solve_sequence(func, interval, eps, on_iteration, constraints, inner_method,
+                                                        INITIAL_PENALTY, make_merit, update)
+        if result:
+            result[METRICS_INDEX]["multipliers"] = multipliers[:, 0].tolist()
+        return result
+
+    @staticmethod
+    def solve_sequence(func, interval: list, eps: float, on_iteration, constraints: tuple, inner_method: Callable,
+                       parameter: float, make_merit: Callable, update: Callable) -> list:
+
+        """
+        Method for solving the sequence of the unconstrained problems of the constrained method
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search and of the constraints
+        on_iteration: Callable
+            Function called after each iteration of the unconstrained method with its number and box
+        constraints: tuple
+            Inequality constraints in sympy format
+        inner_method: Callable
+            Method of MultiDimMinimization solving the unconstrained problems
+        parameter: float
+            Penalty or barrier coefficient of the first unconstrained problem
+        make_merit: Callable
+            Function making the merit function of the problem for the coefficient
+        update: Callable
+            Function of the coefficient and the violations of the constraints (positive parts of g(x)) at the found
+             point and the largest violation of the previous problem, which gives the next coefficient and
+             whether the found point is the solution
+
+        Returns:
+        -------
+            Result of the method (see MultiDimMinimization.make_result) with the metrics summed over the
+             unconstrained problems, the number of the problems ("outer_iterations"), the coefficient of the last
+             problem ("parameter"), the violations of the constraints and the largest of them ("max_violation")
+        """
+
+        if not MultiDimMinimization.check_problem(func, interval):
+            return []
+        problem = compile_problem(func, tuple(constraints))
+        if not problem[0]:
+            return MultiDimMinimization.const_minimization(func, interval)
+
+        borders_list, metrics = {}, dict.fromkeys(INNER_METRICS, 0)
+        violation = np.inf
+        for outer_iteration in range(1, MAX_OUTER_ITERATIONS + 1):
+            offset = len(borders_list)  # boxes of the next problem are numbered after the boxes of the previous ones
+            report = (lambda iter_num, box: on_iteration(offset + iter_num, box)) if on_iteration else None
+            result = inner_method(make_merit(problem, parameter), interval, eps, on_iteration=report)
+            if not result:
+                return []
+            borders_list.update({offset + iter_num: box for iter_num, box in result[2].items()})
+            for name in INNER_METRICS:
+                metrics[name] += result[METRICS_INDEX][name]
+
+            values = problem[1](np.array([result[0]]))[:, 0]
+            violations = np.maximum(values[1:], 0.)
+            metrics["parameter"] = parameter
+            parameter, solved = update(parameter, violations, violation)
+            violation = np.max(violations, initial=0.)
+            if solved:
+                break
+        else:
+            MultiDimMinimization.logger.warning("Constraints are violated by {} at the found point".format(violation))
+
+        metrics.update({"outer_iterations": outer_iteration, "violations": violations.tolist(),
+                        "max_violation": float(violation)})
+        return [result[0], float(values[0]), borders_list, metrics]
+
+
+CONSTRAINED_MINIMIZATION_METHODS = {"Penalty Method": ConstrainedMinimization.penalty_method,
+                                    "Log-Barrier Method": ConstrainedMinimization.log_barrier_method,
+                                    "Augmented Lagrangian Method":
+                                        ConstrainedMinimization.augmented_lagrangian_method}  # methods by their names
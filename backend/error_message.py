@@ -1,4 +1,28 @@
 from enum import Enum
+from threading import local
+
+EMPTY_STR = ""
+
+
+class ThreadErrorMessage(type):
+
+    """
+    Metaclass of the classes of methods reporting their errors in the class attribute error_msg: every thread has its
+     own error_msg, so the methods solving problems in different threads at once (the methods comparison, the job
+     of the window and the parameter sweep) do not overwrite or report the errors of each other
+    """
+
+    def __init__(cls, name: str, bases: tuple, namespace: dict):
+        super().__init__(name, bases, namespace)
+        cls.thread_errors = local()
+
+    @property
+    def error_msg(cls) -> str:
+        return getattr(cls.thread_errors, "error_msg", EMPTY_STR)
+
+    @error_msg.setter
+    def error_msg(cls, message: str):
+        cls.thread_errors.error_msg = message
 
 
 class ErrorMessage(Enum):
@@ -14,4 +38,9 @@ class ErrorMessage(Enum):
     ERROR_INVALID_VALUE = "Incorrect input of numerical values"
     ERROR_INCORRECT_TARGET_FUNCTION = "Objective function entered incorrectly"
     ERROR_WRONG_DIMENSION = "Incorrect number of minimization measurements selected"
-
+    ERROR_INCORRECT_HISTORY_FILE = "File of the results history is damaged or has unknown format"
+    ERROR_INCORRECT_CONSTRAINTS = "Constraints entered incorrectly, they must be inequalities separated by semicolons"
+    ERROR_CONSTRAINTS_NOT_SUPPORTED = "Constraints are taken into account only by the constrained minimization methods"
+    ERROR_BRACKET_NOT_FOUND = "Minimum was not bracketed, the function decreases without limit or is not finite"
+    ERROR_UNKNOWN_VARIABLES = "Variables of the objective function are not known from its parameters"
+    ERROR_OBJECTIVE_EVALUATION_FAILED = "Objective command failed or did not print the value"
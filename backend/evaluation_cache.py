@@ -0,0 +1,87 @@
+from threading import Lock
+from backend.expression_compiler import CompiledExpression
+
+
+class SharedEvaluationCache:
+
+    """
+    Class of the thread-safe cache of the target function values, one cache is shared by all methods solving
+     the same problem, so a point computed by one method is not computed again by the others
+
+    Parameters:
+    ----------
+    compiled_function: CompiledExpression
+        Target function of the problem
+    values: dict
+        Computed values of the function by the points
+    computations: int
+        Number of the real calls of the compiled function
+    """
+
+    def __init__(self, compiled_function: CompiledExpression):
+        self.compiled_function = compiled_function
+        self.values = {}
+        self.computations = 0
+        self.lock = Lock()
+
+    def value(self, point: float) -> float:
+
+        """
+        Method for getting the value of the target function at the point (it is computed only on the first request)
+
+        Parameters:
+        ----------
+        point: float
+            Point of the optimization variable
+
+        Returns:
+        -------
+            Value of the target function
+        """
+
+        point = float(point)
+        with self.lock:
+            if point in self.values:
+                return self.values[point]
+        value = float(self.compiled_function.numeric_func(point))  # computed without lock, other threads go on
+        with self.lock:
+            if point not in self.values:
+                self.computations += 1
+                self.values[point] = value
+        return value
+
+    def objective(self) -> "CachedObjective":
+        return CachedObjective(self)
+
+
+class CachedObjective:
+
+    """
+    Class of the target function for one minimization method: it is passed to the method instead of the sympy
+     expression (the methods use only "free_symbols", "subs" and "float") and counts the evaluations of the method
+
+    Parameters:
+    ----------
+    cache: SharedEvaluationCache
+        Cache of the problem shared with the other methods
+    evaluations: int
+        Number of the function values requested by the method
+    """
+
+    def __init__(self, cache: SharedEvaluationCache):
+        self.cache = cache
+        self.evaluations = 0
+
+    @property
+    def free_symbols(self) -> set:
+        return set(self.cache.compiled_function.variables)
+
+    def subs(self, variable, point: float) -> float:
+        self.evaluations += 1
+        return self.cache.value(point)
+
+    def __float__(self) -> float:
+        return float(self.cache.compiled_function.expr)
+
+    def __str__(self) -> str:
+        return str(self.cache.compiled_function.expr)
@@ -0,0 +1,235 @@
+import io
+import re
+import tokenize
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Any
+from backend.error_message import ErrorMessage
+
+COMPILED_EXPRESSIONS_CACHE_SIZE = 128  # number of last compiled target functions kept ready for the solver
+CONSTRAINTS_DELIMITER = ";"  # separator of the inequalities in the constraints entered by the user
+SIMPLIFICATION_MAX_OPERATIONS = 150  # larger expressions are not simplified, sympy.simplify is too slow for them
+# functions and constants the user can write, any other name (except the variables) is rejected before parsing,
+# because sympy.parse_expr evaluates its input as python code
+ALLOWED_FUNCTIONS = ("sin", "cos", "tan", "cot", "sec", "csc", "asin", "acos", "atan", "acot", "sinh", "cosh", "tanh",
+                     "coth", "asinh", "acosh", "atanh", "exp", "log", "ln", "sqrt", "cbrt", "Abs", "abs", "sign",
+                     "floor", "ceiling", "Min", "Max", "min", "max", "erf", "gamma", "factorial")
+ALLOWED_CONSTANTS = ("pi", "E")
+ALLOWED_OPERATORS = {"+", "-", "*", "/", "**", "(", ")", ",", "<", ">", "<=", ">="}
+VARIABLE_PATTERN = r"[A-Za-z][0-9]*"  # a letter optionally followed by the digits, for example x or x1
+FORBIDDEN_ELEMENT_MESSAGE = "forbidden element {!r}"
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+
+    """
+    Class of the target function prepared for the minimization
+
+    Parameters:
+    ----------
+    text: str
+        Target function as it was entered by the user
+    expr: sympy.Expr
+        Parsed target function
+    variables: tuple
+        Variables of the function ordered by their names
+    numeric_func: Callable
+        Function calculating the target function on numpy arrays (arguments are given in the order of variables)
+    """
+
+    text: str
+    expr: Any
+    variables: tuple
+    numeric_func: Callable
+
+
+class ExpressionCompiler:
+
+    """
+    Class with methods for parsing and compiling of the target function entered by the user
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=COMPILED_EXPRESSIONS_CACHE_SIZE)
+    def compile(text: str, dimension: int = 1, simplify: bool = False) -> CompiledExpression:
+
+        """
+        Method for parsing the target function and making its numeric version (the results are cached by the text)
+
+        Parameters:
+        ----------
+        text: str
+            Target function entered by the user
+        dimension: int
+            Number of variables chosen by the user
+        simplify: bool
+            Whether the parsed function is simplified before the compilation (see simplify)
+
+        Returns:
+        -------
+            Compiled target function, ValueError with the message for the user is raised if the function is incorrect
+        """
+
+        from sympy import Expr  # sympy is imported on the first compilation, it slows the start down
+
+        expr = ExpressionCompiler.parse(text, ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION)
+        if not isinstance(expr, Expr):  # for example, relational or boolean expressions
+            raise ValueError(ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION.value)
+        variables = tuple(sorted(expr.free_symbols, key=str))
+        if len(variables) > dimension:
+            raise ValueError(ErrorMessage.ERROR_INCORRECT_DIMENSION.value)
+        if simplify:
+            expr = ExpressionCompiler.simplify(expr)
+        return CompiledExpression(text, expr, variables, ExpressionCompiler.lambdify(variables, expr))
+
+    @staticmethod
+    def parse(text: str, error: ErrorMessage):
+
+        """
+        Method for parsing the expression entered by the user or received by the service: sympy.parse_expr evaluates
+         its input, so only the numbers, the variables, the allowed functions and constants and the arithmetic and
+         comparison operators are accepted (no strings, attribute access, underscores or other names), and the
+         expression is evaluated with the names of only these functions
+
+        Parameters:
+        ----------
+        text: str
+            Expression to parse
+        error: ErrorMessage
+            Message of the ValueError raised if the expression is incorrect or forbidden
+
+        Returns:
+        -------
+            Parsed sympy expression
+        """
+
+        import sympy
+        from sympy.parsing.sympy_parser import parse_expr, standard_transformations
+
+        try:
+            tokens = list(tokenize.generate_tokens(io.StringIO(text).readline))
+        except (tokenize.TokenError, SyntaxError) as token_error:
+            raise ValueError(error.value + ": " + str(token_error)) from token_error
+        for token in tokens:
+            allowed = token.type in (tokenize.NUMBER, tokenize.NEWLINE, tokenize.NL, tokenize.ENDMARKER) or \
+                token.type == tokenize.OP and token.string in ALLOWED_OPERATORS or \
+                token.type == tokenize.NAME and (token.string in ALLOWED_FUNCTIONS + ALLOWED_CONSTANTS or
+                                                 re.fullmatch(VARIABLE_PATTERN, token.string) is not None)
+            if not allowed:
+                raise ValueError(error.value + ": " + FORBIDDEN_ELEMENT_MESSAGE.format(token.string))
+
+        global_dict = {"__builtins__": {}, "Integer": sympy.Integer, "Float": sympy.Float,
+                       "Rational": sympy.Rational, "Symbol": sympy.Symbol, "Function": sympy.Function,
+                       "ln": sympy.log, "abs": sympy.Abs, "min": sympy.Min, "max": sympy.Max}
+        global_dict.update({name: getattr(sympy, name) for name in ALLOWED_FUNCTIONS + ALLOWED_CONSTANTS
+                            if name not in global_dict})
+        try:
+            return parse_expr(text, global_dict=global_dict, transformations=standard_transformations)
+        except Exception as parse_error:  # sympy raises different errors on incorrect input (SyntaxError, ...)
+            raise ValueError(error.value + ": " + str(parse_error)) from parse_error
+
+    @staticmethod
+    def simplify(expr):
+
+        """
+        Method for simplifying the expression, the result is kept only if it has fewer operations than the original
+         (the large expressions are returned as they are, because simplification is too slow for them)
+
+        Parameters:
+        ----------
+        expr: sympy.Expr
+            Expression to simplify
+
+        Returns:
+        -------
+            Simplified or original expression
+        """
+
+        from sympy import count_ops, simplify
+
+        operations = count_ops(expr)
+        if operations > SIMPLIFICATION_MAX_OPERATIONS:
+            return expr
+        simplified = simplify(expr)
+        return simplified if count_ops(simplified) < operations else expr
+
+    @staticmethod
+    def lambdify(variables: tuple, expressions) -> Callable:
+
+        """
+        Method for compiling the expressions into the numpy function: the common subexpressions of all expressions
+         (for example, exp(-x**2) in "exp(-x**2)*sin(x) + exp(-x**2)*cos(x)" or the same factors of the derivatives)
+         are calculated once per call
+
+        Parameters:
+        ----------
+        variables: tuple
+            Arguments of the function
+        expressions: sympy.Expr or list
+            Expression or (nested) list of expressions calculated by the function
+
+        Returns:
+        -------
+            Function of numpy arrays returning the values in the same structure as the expressions
+        """
+
+        from sympy import lambdify
+
+        return lambdify(variables, expressions, "numpy", cse=True)
+
+    @staticmethod
+    @lru_cache(maxsize=COMPILED_EXPRESSIONS_CACHE_SIZE)
+    def parse_constraints(text: str, dimension: int = 1) -> tuple:
+
+        """
+        Method for parsing the inequality constraints separated by semicolons (the results are cached by the text)
+
+        Parameters:
+        ----------
+        text: str
+            Constraints entered by the user, for example "x + y >= 1; x**2 + y**2 <= 4"
+        dimension: int
+            Number of variables chosen by the user
+
+        Returns:
+        -------
+            Tuple of sympy inequalities (empty if there are no constraints), ValueError with the message for the user
+             is raised if the constraints are incorrect
+        """
+
+        from sympy.core.relational import Relational, Eq, Ne
+
+        constraints = []
+        for part in filter(None, (part.strip() for part in text.split(CONSTRAINTS_DELIMITER))):
+            constraint = ExpressionCompiler.parse(part, ErrorMessage.ERROR_INCORRECT_CONSTRAINTS)
+            # equalities and inequalities without variables (already evaluated to true or false) are not accepted
+            if not isinstance(constraint, Relational) or isinstance(constraint, (Eq, Ne)):
+                raise ValueError(ErrorMessage.ERROR_INCORRECT_CONSTRAINTS.value + ": " + part)
+            constraints.append(constraint)
+        if len(set().union(*(constraint.free_symbols for constraint in constraints))) > dimension:
+            raise ValueError(ErrorMessage.ERROR_INCORRECT_DIMENSION.value)
+        return tuple(constraints)
+
+    @staticmethod
+    def check(text: str, dimension: int = 1) -> tuple:
+
+        """
+        Method for compiling the target function without raising errors
+
+        Parameters:
+        ----------
+        text: str
+            Target function entered by the user
+        dimension: int
+            Number of variables chosen by the user
+
+        Returns:
+        -------
+            Compiled function (None if it is incorrect) and the error message (empty string if it is correct)
+        """
+
+        try:
+            return ExpressionCompiler.compile(text.strip(), dimension), ""
+        except ValueError as error:
+            return None, str(error)
@@ -1,5 +1,6 @@
 from enum import Enum
 from logging import Logger
+from backend.error_message import ThreadErrorMessage
 
 
 class ErrorFibonacci(Enum):
@@ -22,7 +23,7 @@ FIBONACCI_INIT_MATRIX = [[1, 1],
 # we use matrices, in particular, [[1, 1], [1, 0]]
 
 
-class FibonacciMethods:
+class FibonacciMethods(metaclass=ThreadErrorMessage):
 
     """
     Class that combines methods of working with fibonacci numbers
@@ -30,10 +31,9 @@ class FibonacciMethods:
     Parameters:
     ----------
     error_msg: str
-
+        String to store the error message of the current thread, if any
     """
 
-    error_msg = EMPTY_STR
     logger = Logger(EMPTY_STR)
 
     @staticmethod
@@ -0,0 +1,83 @@
+from threading import Lock
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+FIGURE_POOL_SIZE = 4  # number of idle figures kept for reuse, the rest are dropped on release
+
+
+class FigurePool:
+
+    """
+    Class of a small thread-safe pool of matplotlib figures, which lets drawers reuse figures between runs
+     instead of creating a new one for each minimization problem
+
+    Parameters:
+    ----------
+    max_size: int
+        Maximum number of idle figures kept in the pool
+    figures: list
+        Idle figures ready for reuse
+    """
+
+    def __init__(self, max_size: int = FIGURE_POOL_SIZE):
+        self.max_size = max_size
+        self.figures = []
+        self.lock = Lock()
+
+    def acquire(self, figure_size: tuple = None, dpi: int = None) -> Figure:
+
+        """
+        Method for getting an empty figure from the pool (a new one is created if the pool is empty)
+
+        Parameters:
+        ----------
+        figure_size: tuple
+            Width and height of the figure in inches (default matplotlib size if None)
+        dpi: int
+            Resolution of the figure (default matplotlib resolution if None)
+
+        Returns:
+        -------
+            Empty figure attached to the Agg canvas
+        """
+
+        figure = None
+        with self.lock:
+            if self.figures:
+                figure = self.figures.pop()
+        if figure is None:
+            figure = Figure()
+            FigureCanvasAgg(figure)
+        if figure_size:
+            figure.set_size_inches(figure_size)
+        if dpi:
+            figure.set_dpi(dpi)
+        return figure
+
+    def release(self, figure: Figure):
+
+        """
+        Method for returning a figure to the pool after drawing
+
+        Parameters:
+        ----------
+        figure: Figure
+            Figure that is not used by its drawer anymore
+        """
+
+        figure.clear()  # all artists are deleted, so the figure does not hold any memory of the previous drawing
+        with self.lock:
+            if len(self.figures) < self.max_size:
+                self.figures.append(figure)
+
+    def clear(self):
+
+        """
+        Method for dropping all idle figures
+        """
+
+        with self.lock:
+            self.figures.clear()
+
+
+FIGURE_POOL = FigurePool()  # pool shared by all drawers of the application
@@ -0,0 +1,144 @@
+from enum import Enum
+import numpy as np
+
+FIRST_FRAME_INDEX = 0
+MIN_FRAMES_NUMBER = 2  # first and last iterations are always kept in the animation
+
+
+class FrameSelectionPolicy(Enum):
+
+    """
+    Class with all policies of choosing the iterations of the minimization process that are rendered as frames
+    """
+
+    ALL = "all"  # every iteration becomes a frame
+    MAX_FRAMES = "max_frames"  # iterations evenly spaced over the whole process, no more than the given number
+    LOGARITHMIC = "logarithmic"  # dense at the start of the process, sparse at the end
+    PIXEL_CHANGE = "pixel_change"  # skipping iterations whose borders moved less than one pixel
+
+
+class FrameSelector:
+
+    """
+    Class with methods for choosing the iterations of the minimization process to draw,
+     so that the cost of the animation does not depend on the number of iterations
+    """
+
+    @staticmethod
+    def select_frames(borders: dict, policy: FrameSelectionPolicy = FrameSelectionPolicy.ALL,
+                      max_frames: int = None, pixel_size: float = 0.) -> list:
+
+        """
+        Method for choosing the iterations that will be rendered as animation frames
+
+        Parameters:
+        ----------
+        borders: dict
+            Dictionary with all intervals of uncertainty in the minimization process, numbered by the iteration index
+        policy: FrameSelectionPolicy
+            Rule by which the frames are chosen
+        max_frames: int
+            Upper limit of the number of frames (applied after the policy, ignored if None)
+        pixel_size: float
+            Width of one pixel of the graph in the units of the optimization variable
+             (used only by the PIXEL_CHANGE policy)
+
+        Returns:
+        -------
+            Sorted list of iteration numbers (keys of "borders") to draw
+        """
+
+        iterations = sorted(borders.keys())
+        if len(iterations) <= MIN_FRAMES_NUMBER:
+            return iterations
+
+        if policy == FrameSelectionPolicy.LOGARITHMIC:
+            frames_number = max_frames if max_frames else int(np.ceil(np.log2(len(iterations)))) + 1
+            selected = FrameSelector.logarithmic_indices(len(iterations), frames_number)
+        elif policy == FrameSelectionPolicy.PIXEL_CHANGE:
+            selected = FrameSelector.pixel_change_indices(iterations, borders, pixel_size)
+        elif policy == FrameSelectionPolicy.MAX_FRAMES and not max_frames:
+            raise ValueError("Frame limit must be set for the policy <" + policy.value + ">")
+        else:
+            selected = list(range(len(iterations)))
+
+        if max_frames and len(selected) > max_frames:
+            selected = [selected[i] for i in FrameSelector.uniform_indices(len(selected), max_frames)]
+
+        return [iterations[i] for i in selected]
+
+    @staticmethod
+    def uniform_indices(length: int, frames_number: int) -> list:
+
+        """
+        Method for choosing evenly spaced indices of a sequence, including its first and last elements
+
+        Parameters:
+        ----------
+        length: int
+            Length of the sequence
+        frames_number: int
+            Number of indices to choose
+
+        Returns:
+        -------
+            Sorted list of unique indices
+        """
+
+        frames_number = max(frames_number, MIN_FRAMES_NUMBER)
+        return sorted(set(np.linspace(FIRST_FRAME_INDEX, length - 1, frames_number).round().astype(int).tolist()))
+
+    @staticmethod
+    def logarithmic_indices(length: int, frames_number: int) -> list:
+
+        """
+        Method for choosing logarithmically spaced indices of a sequence (the beginning of the sequence is denser)
+
+        Parameters:
+        ----------
+        length: int
+            Length of the sequence
+        frames_number: int
+            Number of indices to choose
+
+        Returns:
+        -------
+            Sorted list of unique indices
+        """
+
+        frames_number = max(frames_number, MIN_FRAMES_NUMBER)
+        indices = np.geomspace(1, length, frames_number).round().astype(int) - 1
+        return sorted(set(indices.tolist()) | {FIRST_FRAME_INDEX, length - 1})
+
+    @staticmethod
+    def pixel_change_indices(iterations: list, borders: dict, pixel_size: float) -> list:
+
+        """
+        Method for choosing the iterations on which at least one border of the uncertainty interval
+         moved by a pixel or more relative to the last chosen one
+
+        Parameters:
+        ----------
+        iterations: list
+            Sorted iteration numbers
+        borders: dict
+            Dictionary with all intervals of uncertainty, numbered by the iteration index
+        pixel_size: float
+            Width of one pixel of the graph in the units of the optimization variable
+
+        Returns:
+        -------
+            Sorted list of indices in "iterations"
+        """
+
+        selected = [FIRST_FRAME_INDEX]
+        last_left, last_right = borders[iterations[FIRST_FRAME_INDEX]]
+        for index in range(1, len(iterations) - 1):
+            left, right = borders[iterations[index]]
+            # bounds of the multivariate methods are the corners of the boxes, the largest coordinate move counts
+            if max(np.max(np.abs(np.subtract(left, last_left))), np.max(np.abs(np.subtract(right, last_right)))) >= \
+                    pixel_size:
+                selected.append(index)
+                last_left, last_right = left, right
+        selected.append(len(iterations) - 1)
+        return selected
@@ -1,6 +1,7 @@
-import imageio
+import imageio.v2 as imageio
 import os
 import datetime
+from backend.animation_writer import AnimationWriter, AnimationFormat
 
 RES_GIF_NAME = "graphic_gif"
 RES_IMAGE_PREFIX = "image_for_gif_"
@@ -42,7 +43,9 @@ class GifMaker:
         return result_idx
 
     @staticmethod
-    def create_gif_result(filenames: list = [], dir_name: str = EMPTY_STR) -> str:
+    def create_gif_result(filenames: list = [], dir_name: str = EMPTY_STR,
+                          animation_format: AnimationFormat = AnimationFormat.GIF,
+                          frame_duration: float = GIF_OPTIONS['duration'], result_name: str = RES_GIF_NAME) -> str:
 
         """
         Method for creating GIF animation from a set of images with recording the result in the required directory
@@ -53,6 +56,12 @@ class GifMaker:
             List of images used to build the animation
         dir_name: str
             Name of the directory, the result is saved
+        animation_format: AnimationFormat
+            Format of the result animation (GIF, animated WebP or MP4 video)
+        frame_duration: float
+            Time of showing one frame in seconds
+        result_name: str
+            Name of the result file without extension
 
         Returns:
         -------
@@ -63,15 +72,12 @@ class GifMaker:
         for filename in filenames:
             images.append(imageio.imread(filename))
         # check, that there is no test with such number
-        result_path = dir_name + PATH_DELIMITER + RES_GIF_NAME
+        result_path = dir_name + PATH_DELIMITER + result_name
         if not os.path.isdir(result_path):
             # save it to the working directory and send it back to the program
-            imageio.mimsave(result_path + GIF_FORMAT, images,
-                            'GIF', **GIF_OPTIONS)
+            return AnimationWriter.write_animation(images, result_path, animation_format, frame_duration)
         else:
-            raise NameError("such gif-file named <" + RES_GIF_NAME + "> already exists")  ####
-
-        return result_path + GIF_FORMAT
+            raise NameError("such gif-file named <" + result_name + "> already exists")
 
     @staticmethod
     def clear_temp_images(folder_name: str = EMPTY_STR):
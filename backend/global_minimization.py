@@ -0,0 +1,175 @@
+from itertools import count
+import numpy as np
+from backend.multi_dimension_minimization import MultiDimMinimization
+from backend.vectorized_evaluation import VectorizedEvaluation
+
+DEFAULT_SEED = 0  # seed of the random generator, the same seed gives the same result
+MAX_GENERATIONS = 1000  # generations limit of the population methods
+POPULATION_SIZE_FACTOR = 15  # population size of the differential evolution as a multiple of the dimension
+MUTATION = 0.8  # coefficients of the differential evolution
+CROSSOVER = 0.9
+DONORS_NUMBER = 3  # points of the population taking part in the mutation of one point
+CHAINS_NUMBER = 32  # number of the independent chains of the simulated annealing
+COOLING = 0.95  # decrease of the temperature after every generation of the annealing
+INITIAL_STEP_SCALE = 0.1  # initial step of the annealing as a part of the side of the box
+
+
+class GlobalMinimization:
+
+    """
+    Class uniting the population methods of the global minimization of functions of several variables in the box;
+     the whole population is evaluated by one vectorized call (or by one call for every process of the pool), the
+     results have the same structure as the results of MultiDimMinimization, and the boxes of the iterations are
+     the boxes around the population
+    """
+
+    @staticmethod
+    def differential_evolution_method(func, interval: list = [], eps: float = 0., on_iteration=None,
+                                      seed: int = DEFAULT_SEED, workers: int = 0) -> list:
+
+        """
+        Method for minimizing a function of several variables by the differential evolution (rand/1/bin scheme)
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search (the largest side of the box around the population)
+        on_iteration: Callable
+            Function called after each generation with its number and the box around the population
+        seed: int
+            Seed of the random generator
+        workers: int
+            Number of processes evaluating the generations (evaluated in this process if 0)
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes around the population and the metrics with the best value of every
+             generation ("convergence")
+        """
+
+        if not MultiDimMinimization.check_problem(func, interval):
+            return []
+        variables, numeric_func = VectorizedEvaluation.vectorize(func)
+        if not variables:
+            return MultiDimMinimization.const_minimization(func, interval)
+
+        left_bound, right_bound = interval[0], interval[1]
+        dimension = len(variables)
+        size = POPULATION_SIZE_FACTOR * dimension
+        rng = np.random.default_rng(seed)
+        population = rng.uniform(left_bound, right_bound, (size, dimension))
+        indices = np.arange(size)
+
+        with VectorizedEvaluation.population_evaluator(func, numeric_func, workers) as objective:
+            values = np.array(objective(population))
+            convergence = [float(values.min())]
+            iter_counter = count()  # generations counter
+            borders_list = {next(iter_counter): MultiDimMinimization.bounding_box(population)}
+
+            for iter_num in iter_counter:
+                if np.max(np.ptp(population, axis=0)) <= eps or iter_num > MAX_GENERATIONS:
+                    break
+                # three different donors for every point, none of them is the point itself
+                donors = rng.permuted(np.tile(np.arange(size - 1), (size, 1)), axis=1)[:, :DONORS_NUMBER]
+                donors += donors >= indices[:, np.newaxis]
+                mutants = population[donors[:, 0]] + MUTATION * (population[donors[:, 1]] - population[donors[:, 2]])
+                crossover = rng.random((size, dimension)) < CROSSOVER
+                crossover[indices, rng.integers(dimension, size=size)] = True  # at least one coordinate is changed
+                trials = np.clip(np.where(crossover, mutants, population), left_bound, right_bound)
+
+                trial_values = np.array(objective(trials))  # whole generation is evaluated by one call
+                improved = trial_values <= values
+                population[improved], values[improved] = trials[improved], trial_values[improved]
+                convergence.append(float(values.min()))
+
+                borders_list.update({iter_num: MultiDimMinimization.bounding_box(population)})
+                if on_iteration:
+                    on_iteration(iter_num, borders_list[iter_num])
+
+        best = int(np.argmin(values))
+        result = MultiDimMinimization.make_result(population[best], values[best], borders_list, objective)
+        result[-1]["convergence"] = convergence
+        return result
+
+    @staticmethod
+    def simulated_annealing_method(func, interval: list = [], eps: float = 0., on_iteration=None,
+                                   seed: int = DEFAULT_SEED, workers: int = 0) -> list:
+
+        """
+        Method for minimizing a function of several variables by the simulated annealing: independent chains make
+         random steps together, the worse points are accepted with the probability decreasing with the temperature
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search (the length of the random step at which the annealing stops)
+        on_iteration: Callable
+            Function called after each generation with its number and the box around the chains
+        seed: int
+            Seed of the random generator
+        workers: int
+            Number of processes evaluating the generations (evaluated in this process if 0)
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes around the chains and the metrics with the best value found by every
+             generation ("convergence")
+        """
+
+        if not MultiDimMinimization.check_problem(func, interval):
+            return []
+        variables, numeric_func = VectorizedEvaluation.vectorize(func)
+        if not variables:
+            return MultiDimMinimization.const_minimization(func, interval)
+
+        left_bound, right_bound = interval[0], interval[1]
+        rng = np.random.default_rng(seed)
+        points = rng.uniform(left_bound, right_bound, (CHAINS_NUMBER, len(variables)))
+
+        with VectorizedEvaluation.population_evaluator(func, numeric_func, workers) as objective:
+            values = np.array(objective(points))
+            best = int(np.argmin(values))
+            best_point, best_value = points[best].copy(), values[best]
+            convergence = [float(best_value)]
+            temperature = initial_temperature = max(float(np.std(values)), np.finfo(float).eps)
+            iter_counter = count()  # generations counter
+            borders_list = {next(iter_counter): MultiDimMinimization.bounding_box(points)}
+
+            for iter_num in iter_counter:
+                # the step shrinks with the temperature, so the chains settle in the found minima
+                step = INITIAL_STEP_SCALE * (right_bound - left_bound) * np.sqrt(temperature / initial_temperature)
+                if step <= eps or iter_num > MAX_GENERATIONS:
+                    break
+                candidates = np.clip(points + rng.normal(scale=step, size=points.shape), left_bound, right_bound)
+                candidate_values = np.array(objective(candidates))  # all chains are evaluated by one call
+                with np.errstate(over="ignore"):
+                    accepted = rng.random(len(points)) < np.exp((values - candidate_values) / temperature)
+                points[accepted], values[accepted] = candidates[accepted], candidate_values[accepted]
+                best = int(np.argmin(values))
+                if values[best] < best_value:
+                    best_point, best_value = points[best].copy(), values[best]
+                convergence.append(float(best_value))
+                temperature *= COOLING
+
+                borders_list.update({iter_num: MultiDimMinimization.bounding_box(points)})
+                if on_iteration:
+                    on_iteration(iter_num, borders_list[iter_num])
+
+        result = MultiDimMinimization.make_result(best_point, best_value, borders_list, objective)
+        result[-1]["convergence"] = convergence
+        return result
+
+
+GLOBAL_MINIMIZATION_METHODS = {"Differential Evolution Method": GlobalMinimization.differential_evolution_method,
+                               "Simulated Annealing Method":
+                                   GlobalMinimization.simulated_annealing_method}  # methods by their names
@@ -0,0 +1,158 @@
+import csv
+import json
+import os
+from dataclasses import dataclass
+from typing import List
+from pure_protobuf.dataclasses_ import field, message
+from pure_protobuf.types import double, uint
+from backend.results_history import ResultRecord, STORE_COLUMNS
+from backend.error_message import ErrorMessage
+
+CSV_EXTENSION = ".csv"
+JSONL_EXTENSION = ".jsonl"
+BINARY_EXTENSION = ".pb"  # protocol buffers message with all records of the history
+HISTORY_FILE_FILTER = "CSV (*.csv);;JSON lines (*.jsonl);;Binary (*.pb)"  # filter of the file dialogs
+SCALAR_BOUNDS_DIMENSION = 0  # dimension of the trajectory of the one-dimensional methods (bounds are numbers)
+FILE_ENCODING = "utf-8"
+
+
+@message
+@dataclass
+class ResultMessage:
+
+    """
+    Class of one result of the history in the binary format (trajectory is kept as the flat packed array of
+     iterations and bounds, the bounds of the multivariate methods take "dimension" numbers each)
+    """
+
+    function: str = field(1, default="")
+    interval: str = field(2, default="")
+    eps: double = field(3, default=0.)
+    result: double = field(4, default=0.)
+    method: str = field(5, default="")
+    wall_time: double = field(6, default=0.)
+    trajectory: List[double] = field(7, default_factory=list, packed=True)
+    dimension: uint = field(8, default=SCALAR_BOUNDS_DIMENSION)
+
+
+@message
+@dataclass
+class HistoryMessage:
+
+    """
+    Class of the whole history in the binary format
+    """
+
+    records: List[ResultMessage] = field(1, default_factory=list)
+
+
+class HistoryIO:
+
+    """
+    Class with methods for saving the history of results to CSV, JSON lines or binary files and loading it back,
+     the format is chosen by the extension of the file
+    """
+
+    @staticmethod
+    def export_records(records: list, path: str):
+
+        """
+        Method for saving the results with their trajectories and solving times
+
+        Parameters:
+        ----------
+        records: list
+            Results to save (ResultRecord objects)
+        path: str
+            Path of the file, its extension defines the format
+        """
+
+        extension = HistoryIO.file_extension(path)
+        if extension == BINARY_EXTENSION:
+            with open(path, "wb") as file:
+                HistoryMessage([HistoryIO.to_message(record) for record in records]).dump(file)
+            return
+        with open(path, "w", encoding=FILE_ENCODING, newline="") as file:
+            if extension == CSV_EXTENSION:
+                writer = csv.writer(file)
+                writer.writerow(STORE_COLUMNS)
+                # trajectory is written to one cell as the json array
+                writer.writerows([record.function, record.interval, repr(record.eps), repr(record.result),
+                                  record.method, repr(record.wall_time), json.dumps(record.trajectory)]
+                                 for record in records)
+            else:
+                file.writelines(json.dumps(record.__dict__) + "\n" for record in records)
+
+    @staticmethod
+    def import_records(path: str) -> list:
+
+        """
+        Method for loading the results saved by export_records
+
+        Parameters:
+        ----------
+        path: str
+            Path of the file, its extension defines the format
+
+        Returns:
+        -------
+            Loaded results (ResultRecord objects), ValueError is raised if the file is incorrect
+        """
+
+        extension = HistoryIO.file_extension(path)
+        try:
+            if extension == BINARY_EXTENSION:
+                with open(path, "rb") as file:
+                    return [HistoryIO.from_message(record) for record in HistoryMessage.load(file).records]
+            with open(path, "r", encoding=FILE_ENCODING, newline="") as file:
+                if extension == CSV_EXTENSION:
+                    return [ResultRecord(row["function"], row["interval"], float(row["eps"]), float(row["result"]),
+                                         row["method"], float(row["wall_time"]),
+                                         [HistoryIO.trajectory_point(point) for point in json.loads(row["trajectory"])])
+                            for row in csv.DictReader(file)]
+                return [HistoryIO.from_json(line) for line in file if line.strip()]
+        except (KeyError, TypeError, ValueError) as error:  # json and protobuf errors are subclasses of ValueError
+            raise ValueError(ErrorMessage.ERROR_INCORRECT_HISTORY_FILE.value + ": " + path) from error
+
+    @staticmethod
+    def file_extension(path: str) -> str:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in (CSV_EXTENSION, JSONL_EXTENSION, BINARY_EXTENSION):
+            raise ValueError(ErrorMessage.ERROR_INCORRECT_HISTORY_FILE.value + ": " + path)
+        return extension
+
+    @staticmethod
+    def to_message(record: ResultRecord) -> ResultMessage:
+        dimension = SCALAR_BOUNDS_DIMENSION
+        if record.trajectory and isinstance(record.trajectory[0][1], tuple):
+            dimension = len(record.trajectory[0][1])
+        values = []
+        for iteration, left, right in record.trajectory:
+            values.append(float(iteration))
+            values.extend(left + right if dimension else (left, right))
+        return ResultMessage(record.function, record.interval, record.eps, record.result, record.method,
+                             record.wall_time, values, dimension)
+
+    @staticmethod
+    def from_message(record: ResultMessage) -> ResultRecord:
+        values, dimension = record.trajectory, record.dimension
+        bound_size = max(dimension, 1)
+        trajectory = []
+        for index in range(0, len(values), 1 + 2 * bound_size):
+            left = values[index + 1: index + 1 + bound_size]
+            right = values[index + 1 + bound_size: index + 1 + 2 * bound_size]
+            trajectory.append((int(values[index]), tuple(left), tuple(right)) if dimension else
+                              (int(values[index]), left[0], right[0]))
+        return ResultRecord(record.function, record.interval, record.eps, record.result, record.method,
+                            record.wall_time, trajectory)
+
+    @staticmethod
+    def from_json(line: str) -> ResultRecord:
+        values = json.loads(line)
+        values["trajectory"] = [HistoryIO.trajectory_point(point) for point in values["trajectory"]]
+        return ResultRecord(**values)
+
+    @staticmethod
+    def trajectory_point(point: list) -> tuple:
+        iteration, left, right = point
+        return int(iteration), ResultRecord.bound_value(left), ResultRecord.bound_value(right)
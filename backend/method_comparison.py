@@ -0,0 +1,184 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from backend.one_dimension_minimization import OneDimMinimization, ONE_DIM_MINIMIZATION_METHODS, EMPTY_STR
+from backend.expression_compiler import CompiledExpression
+from backend.evaluation_cache import SharedEvaluationCache
+
+REFERENCE_ACCURACY = 1e-10  # accuracy of the reference solution by which the errors of the methods are measured
+
+
+@dataclass
+class MethodReport:
+
+    """
+    Class of the results of one method in the comparison
+
+    Parameters:
+    ----------
+    method: str
+        Name of the minimization method
+    x_opt: float
+        Found point of minimum
+    f_opt: float
+        Value of the function at the found point
+    borders: dict
+        Sequence of the uncertainty intervals by the iteration numbers
+    iterations: int
+        Number of iterations of the method
+    evaluations: int
+        Number of the function values requested by the method
+    wall_time: float
+        Time of the method work in seconds
+    error: float
+        Distance from the found point to the reference solution
+    error_msg: str
+        Error of the method (empty string if the problem is solved)
+    """
+
+    method: str
+    x_opt: float = 0.
+    f_opt: float = 0.
+    borders: dict = field(default_factory=dict)
+    iterations: int = 0
+    evaluations: int = 0
+    wall_time: float = 0.
+    error: float = 0.
+    error_msg: str = EMPTY_STR
+
+
+@dataclass
+class ComparisonReport:
+
+    """
+    Class of the results of all methods on one problem
+
+    Parameters:
+    ----------
+    compiled_function: CompiledExpression
+        Target function of the problem
+    interval: list
+        Initial uncertainty interval
+    eps: float
+        Accuracy of the minimum search
+    reference_x: float
+        Reference point of minimum
+    methods: list
+        Reports of the methods (MethodReport objects) in the order of the registry
+    computations: int
+        Number of the real calls of the function made by all methods together (thanks to the shared cache)
+    """
+
+    compiled_function: CompiledExpression
+    interval: list
+    eps: float
+    reference_x: float = 0.
+    methods: list = field(default_factory=list)
+    computations: int = 0
+
+
+class MethodComparison:
+
+    """
+    Class with methods for running all minimization methods on one problem and measuring them
+    """
+
+    @staticmethod
+    def compare(compiled_function: CompiledExpression, interval: list, eps: float,
+                methods: dict = None) -> ComparisonReport:
+
+        """
+        Method for solving the problem by every method concurrently with one cache of the function values
+
+        Parameters:
+        ----------
+        compiled_function: CompiledExpression
+            Target function of the problem
+        interval: list
+            Initial uncertainty interval
+        eps: float
+            Accuracy of the minimum search
+        methods: dict
+            Minimization methods by their names (all registered methods if None)
+
+        Returns:
+        -------
+            Report with the results of all methods
+        """
+
+        methods = methods if methods is not None else ONE_DIM_MINIMIZATION_METHODS
+        cache = SharedEvaluationCache(compiled_function)
+        report = ComparisonReport(compiled_function, interval, eps,
+                                  MethodComparison.reference_solution(compiled_function, interval))
+
+        with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+            futures = [executor.submit(MethodComparison.run_method, name, method, cache, interval, eps)
+                       for name, method in methods.items()]
+            report.methods = [future.result() for future in futures]
+        for method_report in report.methods:
+            if not method_report.error_msg:
+                method_report.error = abs(method_report.x_opt - report.reference_x)
+        report.computations = cache.computations
+        return report
+
+    @staticmethod
+    def run_method(name: str, method, cache: SharedEvaluationCache, interval: list, eps: float) -> MethodReport:
+
+        """
+        Method for solving the problem by one method and measuring its work (executed in a thread of the comparison)
+
+        Parameters:
+        ----------
+        name: str
+            Name of the minimization method
+        method: Callable
+            Minimization method of OneDimMinimization
+        cache: SharedEvaluationCache
+            Cache of the function values shared by all methods
+        interval: list
+            Initial uncertainty interval
+        eps: float
+            Accuracy of the minimum search
+
+        Returns:
+        -------
+            Report of the method
+        """
+
+        objective = cache.objective()
+        # error_msg belongs to this thread, so the errors of the methods running at once are not mixed up
+        OneDimMinimization.error_msg = EMPTY_STR
+        start = time.perf_counter()
+        try:
+            results = method(objective, list(interval), eps)
+        except Exception as error:  # one failed method must not break the comparison of the others
+            return MethodReport(name, error_msg=str(error))
+        wall_time = time.perf_counter() - start
+        if not results:
+            return MethodReport(name, error_msg=OneDimMinimization.error_msg)
+        return MethodReport(name, float(results[0]), float(results[1]), results[2], max(results[2].keys()),
+                            objective.evaluations, wall_time)
+
+    @staticmethod
+    def reference_solution(compiled_function: CompiledExpression, interval: list) -> float:
+
+        """
+        Method for finding the point of minimum with high accuracy by the scipy bounded method
+
+        Parameters:
+        ----------
+        compiled_function: CompiledExpression
+            Target function of the problem
+        interval: list
+            Initial uncertainty interval
+
+        Returns:
+        -------
+            Reference point of minimum
+        """
+
+        if not compiled_function.variables:  # every point is the minimum of the constant
+            return (interval[0] + interval[1]) / 2
+        from scipy.optimize import minimize_scalar  # scipy is needed only by the comparison, so it is loaded here
+        return float(minimize_scalar(lambda x: float(compiled_function.numeric_func(x)), bounds=interval,
+                                     method="bounded", options={"xatol": REFERENCE_ACCURACY}).x)
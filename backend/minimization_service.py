@@ -0,0 +1,358 @@
+import asyncio
+import json
+import logging
+import tempfile
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from backend.async_solver import AsyncSolver, SolverOverloaded, solve_request, EMPTY_STR, MAX_DIMENSION
+from backend.results_history import ResultRecord
+from backend.error_message import ErrorMessage
+from backend.frame_selection import FrameSelectionPolicy
+
+DEFAULT_HOST = "127.0.0.1"  # service is local, it is not exposed to other machines by default
+RESULTS_CACHE_SIZE = 1024  # number of last solved problems whose results are returned without solving
+RENDER_FRAME_POLICY = FrameSelectionPolicy.PIXEL_CHANGE  # iterations invisible on the graph are not drawn
+RENDER_MAX_FRAMES = 30  # upper limit of frames of the rendered animation
+RENDERING_MODULES = ("backend.plane_minimization_drawer", "backend.space_minimization_drawer", "backend.gif_maker")
+PROBLEM_FIELDS = ["function", "interval", "eps", "method"]  # required fields of the problem of the request
+JSON_CONTENT_TYPE = "application/json"
+GIF_CONTENT_TYPE = "image/gif"
+HEALTH_PATH = "/health"
+SOLVE_PATH = "/solve"
+BATCH_PATH = "/batch"
+RENDER_PATH = "/render"
+UNKNOWN_PATH_MESSAGE = "Unknown path: {}"
+INCORRECT_REQUEST_MESSAGE = "Request must be a JSON object with the fields: " + ", ".join(PROBLEM_FIELDS)
+CONTENT_TYPE_MESSAGE = "Body of the request must have the content type " + JSON_CONTENT_TYPE
+# browsers add the header to the cross-origin requests (including the DNS rebinding ones), the clients of the service
+# do not send it, so the requests of the web pages are rejected
+CROSS_ORIGIN_MESSAGE = "Cross-origin requests are not accepted"
+
+
+def render_request(function: str, interval: list, eps: float, method: str, constraints: str, surface: bool,
+                   cancel_event) -> bytes:
+
+    """
+    Function solving the problem and rendering its minimization into the gif (executed in a process of the pool)
+
+    Parameters:
+    ----------
+    function: str
+        Target function
+    interval: list
+        Initial uncertainty interval (interval of every variable for functions of several variables)
+    eps: float
+        Accuracy of the minimum search
+    method: str
+        Name of the minimization method
+    constraints: str
+        Inequality constraints separated by semicolons (only for the constrained methods)
+    surface: bool
+        Whether the function of several variables is drawn as the surface instead of the contour map
+    cancel_event: Event
+        Event of the manager set when the request is cancelled
+
+    Returns:
+    -------
+        Content of the gif file
+    """
+
+    from backend.plane_minimization_drawer import PlaneMinimizationDrawer
+    from backend.space_minimization_drawer import SpaceMinimizationDrawer
+    from backend.expression_compiler import ExpressionCompiler
+    from backend.gif_maker import GifMaker
+
+    results = solve_request(function, interval, eps, method, constraints, cancel_event)
+    func = ExpressionCompiler.compile(function.strip(), MAX_DIMENSION).expr
+    with tempfile.TemporaryDirectory() as folder:  # frames of the parallel requests do not overwrite each other
+        drawer = SpaceMinimizationDrawer(func, interval, surface=surface, images_folder=folder) if \
+            isinstance(results[0], tuple) else PlaneMinimizationDrawer(func, interval, images_folder=folder)
+        with drawer:
+            images = drawer.draw_minimization(*results[:3], frame_policy=RENDER_FRAME_POLICY,
+                                              max_frames=RENDER_MAX_FRAMES)
+            with open(GifMaker.create_gif_result(images, folder), "rb") as gif:
+                return gif.read()
+
+
+class MinimizationService:
+
+    """
+    Class answering the requests of the service: the problems are solved by the pool of AsyncSolver whose event
+     loop runs in a separate thread, the results of the last problems are kept in the cache shared by all requests
+
+    Parameters:
+    ----------
+    solver: AsyncSolver
+        Solver of the problems
+    results_cache: OrderedDict
+        Results of the last solved problems by their parameters (it is used only in the thread of the event loop)
+    loop: asyncio.AbstractEventLoop
+        Event loop awaiting the solver
+    """
+
+    def __init__(self, solver: AsyncSolver, cache_size: int = RESULTS_CACHE_SIZE):
+        self.solver = solver
+        self.cache_size = cache_size
+        self.results_cache = OrderedDict()
+        self.loop = asyncio.new_event_loop()
+        Thread(target=self.loop.run_forever, daemon=True).start()
+
+    def call(self, coroutine):
+
+        """
+        Method for awaiting the coroutine of the service in the thread of the event loop (called by the threads
+         of the HTTP server)
+
+        Parameters:
+        ----------
+        coroutine: Coroutine
+            Coroutine to await
+
+        Returns:
+        -------
+            Result of the coroutine
+        """
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def close(self):
+        self.call(self.close_solver())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    async def close_solver(self):
+        self.solver.close()
+
+    async def solve(self, problem: dict) -> dict:
+
+        """
+        Method for solving the problem of the request (the result of the same problem is taken from the cache)
+
+        Parameters:
+        ----------
+        problem: dict
+            Problem of the request: function, interval, eps, method and optionally constraints and "trajectory"
+             (whether the uncertainty intervals of the iterations are returned)
+
+        Returns:
+        -------
+            Optimum, its value, number of iterations, metrics of the method, whether the result was cached and
+             the trajectory (if it was requested)
+        """
+
+        arguments = MinimizationService.problem_arguments(problem)
+        key = json.dumps(arguments)
+        cached = key in self.results_cache
+        if cached:
+            self.results_cache.move_to_end(key)
+            results = self.results_cache[key]
+        else:
+            results = await self.solver.solve(*arguments)
+            self.results_cache[key] = results
+            if len(self.results_cache) > self.cache_size:
+                self.results_cache.popitem(last=False)
+
+        answer = {"point": results[0], "value": results[1], "iterations": max(results[2].keys()),
+                  "metrics": results[3] if len(results) > 3 else {}, "cached": cached}
+        if problem.get("trajectory"):
+            answer["trajectory"] = ResultRecord.trajectory_from_borders(results[2])
+        return answer
+
+    async def batch(self, problems: list) -> list:
+
+        """
+        Method for solving the problems of the request at once, the error of one problem does not stop the others
+
+        Parameters:
+        ----------
+        problems: list
+            Problems of the request (see solve)
+
+        Returns:
+        -------
+            Answers of the problems in the same order, the failed problems are answered by {"error": message}
+        """
+
+        if not isinstance(problems, list):
+            raise ValueError(INCORRECT_REQUEST_MESSAGE)
+        answers = await asyncio.gather(*(self.solve(problem) for problem in problems), return_exceptions=True)
+        return [{"error": str(answer)} if isinstance(answer, Exception) else answer for answer in answers]
+
+    async def render(self, problem: dict) -> bytes:
+
+        """
+        Method for rendering the minimization of the problem of the request into the gif
+
+        Parameters:
+        ----------
+        problem: dict
+            Problem of the request (see solve) with the optional field "surface"
+
+        Returns:
+        -------
+            Content of the gif file
+        """
+
+        return await self.solver.run(render_request, *MinimizationService.problem_arguments(problem),
+                                     bool(problem.get("surface")))
+
+    @staticmethod
+    def problem_arguments(problem: dict) -> list:
+
+        """
+        Method for checking the problem of the request and making the arguments of the solver
+
+        Parameters:
+        ----------
+        problem: dict
+            Problem of the request
+
+        Returns:
+        -------
+            Function, interval, accuracy, method and constraints, ValueError is raised if the problem is incorrect
+        """
+
+        if not isinstance(problem, dict) or any(field not in problem for field in PROBLEM_FIELDS):
+            raise ValueError(INCORRECT_REQUEST_MESSAGE)
+        try:
+            interval, eps = [float(bound) for bound in problem["interval"]], float(problem["eps"])
+        except (TypeError, ValueError) as error:
+            raise ValueError(ErrorMessage.ERROR_INVALID_VALUE.value) from error
+        if eps <= 0:
+            raise ValueError(ErrorMessage.ERROR_NOT_APPLICABLE_ACCURACY.value)
+        return [str(problem["function"]), interval, eps, str(problem["method"]),
+                str(problem.get("constraints", EMPTY_STR))]
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+
+    """
+    Class handling one HTTP request of the service:
+
+        GET /health - state of the service
+        POST /solve - problem of the request (see MinimizationService.solve) in the JSON body
+        POST /batch - {"problems": [...]}
+        POST /render - problem of the request, the answer is the gif animation of the minimization
+
+    The POST requests must have the JSON content type and no Origin header (the requests of the web pages are
+     rejected, because the expressions of the problems are parsed by sympy)
+    """
+
+    server_version = "MinimizationService"
+
+    def do_GET(self):
+        if self.path != HEALTH_PATH:
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": UNKNOWN_PATH_MESSAGE.format(self.path)})
+            return
+        solver = self.server.service.solver
+        self.send_json(HTTPStatus.OK, {"status": "ok", "workers": solver.max_workers, "pending": solver.pending})
+
+    def do_POST(self):
+        service = self.server.service
+        if self.headers.get("Origin") is not None:
+            self.send_json(HTTPStatus.FORBIDDEN, {"error": CROSS_ORIGIN_MESSAGE})
+            return
+        if self.headers.get_content_type() != JSON_CONTENT_TYPE:  # simple requests of browsers are not JSON
+            self.send_json(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, {"error": CONTENT_TYPE_MESSAGE})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or "null")
+            if self.path == SOLVE_PATH:
+                self.send_json(HTTPStatus.OK, service.call(service.solve(request)))
+            elif self.path == BATCH_PATH:
+                problems = request.get("problems") if isinstance(request, dict) else None
+                self.send_json(HTTPStatus.OK, {"results": service.call(service.batch(problems))})
+            elif self.path == RENDER_PATH:
+                self.send_content(HTTPStatus.OK, service.call(service.render(request)), GIF_CONTENT_TYPE)
+            else:
+                self.send_json(HTTPStatus.NOT_FOUND, {"error": UNKNOWN_PATH_MESSAGE.format(self.path)})
+        except SolverOverloaded as error:  # the client should repeat the request later
+            self.send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(error)})
+        except ValueError as error:  # incorrect JSON or problem (json errors are subclasses of ValueError)
+            self.send_json(HTTPStatus.BAD_REQUEST, {"error": str(error)})
+        except Exception as error:  # the service must answer even if the solver failed unexpectedly
+            logging.error("Request {} failed: {}".format(self.path, error))
+            self.send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error)})
+
+    def send_json(self, status: HTTPStatus, answer):
+        self.send_content(status, json.dumps(answer).encode(), JSON_CONTENT_TYPE)
+
+    def send_content(self, status: HTTPStatus, content: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args):
+        logging.info("%s - " + format, self.address_string(), *args)
+
+
+def make_server(port: int, workers: int = None, host: str = DEFAULT_HOST, max_pending: int = None,
+                cache_size: int = RESULTS_CACHE_SIZE) -> ThreadingHTTPServer:
+
+    """
+    Function for making the HTTP server of the service with the warmed up pool of the solving processes
+
+    Parameters:
+    ----------
+    port: int
+        Port of the server (any free port if 0)
+    workers: int
+        Number of the solving processes (number of processors if None)
+    host: str
+        Address of the server
+    max_pending: int
+        Limit of the requests waiting for a free process, the others are answered with 503 (no limit if None)
+    cache_size: int
+        Number of last solved problems whose results are returned without solving
+
+    Returns:
+    -------
+        Server with the service in the attribute "service", it is closed by server_close()
+    """
+
+    service = MinimizationService(AsyncSolver(workers, max_pending, warm_up_modules=RENDERING_MODULES), cache_size)
+    service.call(service.solver.warm_up())
+
+    class ServiceServer(ThreadingHTTPServer):
+        daemon_threads = True
+
+        def server_close(self):
+            ThreadingHTTPServer.server_close(self)
+            self.service.close()
+
+    server = ServiceServer((host, port), ServiceRequestHandler)
+    server.service = service
+    return server
+
+
+def serve(port: int, workers: int = None, host: str = DEFAULT_HOST) -> int:
+
+    """
+    Function for running the service until it is interrupted
+
+    Parameters:
+    ----------
+    port: int
+        Port of the server
+    workers: int
+        Number of the solving processes (number of processors if None)
+    host: str
+        Address of the server
+
+    Returns:
+    -------
+        Exit code
+    """
+
+    server = make_server(port, workers, host)
+    print("Minimization service is listening on http://{}:{}".format(*server.server_address), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
@@ -0,0 +1,637 @@
+from itertools import count
+from logging import Logger
+from typing import Callable
+import numpy as np
+from backend.one_dimension_minimization import OneDimMinimization, BOUNDS_NUMBER, EMPTY_STR
+from backend.error_message import ErrorMessage, ThreadErrorMessage
+from backend.vectorized_evaluation import VectorizedEvaluation, CountedFunction
+
+MAX_ITERATIONS = 10000  # iterations limit of the multivariate methods (for functions without a minimum in the box)
+INITIAL_SIMPLEX_SCALE = 0.25  # size of the initial simplex as a part of the side of the search box
+REFLECTION = 1.  # coefficients of the Nelder-Mead method
+EXPANSION = 2.
+CONTRACTION = 0.5
+SHRINKAGE = 0.5
+LINE_VARIABLE = "t"  # variable of the one-dimensional objective of the line search
+LINE_SEARCH_ACCURACY = 1e-2  # accuracy of the line search of the gradient methods as a part of the problem accuracy
+SUFFICIENT_DECREASE = 1e-4  # constants of the strong Wolfe conditions
+CURVATURE_CONDITION = 0.9
+MAX_LINE_SEARCH_STEPS = 50  # limit of the trial steps of the Wolfe line search
+STEP_GROWTH = 2.  # increase of the trial step of the Wolfe line search until the minimum is bracketed
+METRICS_INDEX = 3  # index of the metrics (iterations and evaluations numbers) in the result of the method
+PERTURBATION_SCALE = 1e-2  # distance of the points probed around the stationary centre as a part of the box side
+PERTURBATION_PROBES = 4  # number of the probed points for every variable
+PERTURBATION_SEED = 0  # seed of the directions of the probed points, the same problem gives the same result
+
+
+class LineObjective:
+
+    """
+    Class of the target function restricted to the line "point + t * direction": it is passed to the one-dimensional
+     methods instead of the sympy expression (the methods use only "free_symbols", "subs" and "float")
+
+    Parameters:
+    ----------
+    numeric_func: CountedFunction
+        Vectorized target function
+    point: np.ndarray
+        Point through which the line goes (t = 0)
+    direction: np.ndarray
+        Direction of the line
+    """
+
+    def __init__(self, numeric_func: CountedFunction, point: np.ndarray, direction: np.ndarray):
+        self.numeric_func = numeric_func
+        self.point = point.copy()
+        self.direction = direction
+
+    @property
+    def free_symbols(self) -> set:
+        return {LINE_VARIABLE}
+
+    def subs(self, variable, step: float) -> float:
+        return float(self.numeric_func.at(self.point + step * self.direction))
+
+    def __float__(self) -> float:
+        return float(self.numeric_func.at(self.point))
+
+
+class MultiDimMinimization(metaclass=ThreadErrorMessage):
+
+    """
+    Class uniting a set of static methods for minimizing functions of several variables in the box where every
+     variable lies in the same interval; the results have the same structure as the results of OneDimMinimization,
+     but the point of minimum is a tuple and the uncertainty intervals are the boxes (lower corner, upper corner)
+
+    Parameters:
+    ----------
+    error_msg: str
+        String to store the error message of the current thread, if any
+    logger: Logger
+        Logger for monitoring program operation
+    """
+
+    logger = Logger(EMPTY_STR)
+
+    @staticmethod
+    def check_problem(func, interval: list) -> bool:
+
+        """
+        Method for checking the problem before the minimization, the error is saved to error_msg
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+
+        Returns:
+        -------
+            True if the problem can be solved
+        """
+
+        if len(interval) != BOUNDS_NUMBER:
+            MultiDimMinimization.logger.error(ErrorMessage.ERROR_TOO_MUCH_BOUNDS.value)
+            MultiDimMinimization.error_msg = ErrorMessage.ERROR_TOO_MUCH_BOUNDS.value
+            return False
+        return True
+
+    @staticmethod
+    def nelder_mead_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
+
+        """
+        Method for minimizing a function of several variables using the Nelder-Mead simplex method (the points
+         of the simplex are kept inside the box)
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search (the largest side of the box around the simplex)
+        on_iteration: Callable
+            Function called after each iteration with its number and the box around the simplex
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes around the simplex in the process of minimization and the metrics
+        """
+
+        if not MultiDimMinimization.check_problem(func, interval):
+            return []
+        variables, numeric_func = VectorizedEvaluation.vectorize(func)
+        if not variables:
+            return MultiDimMinimization.const_minimization(func, interval)
+        objective = CountedFunction(numeric_func)
+
+        left_bound, right_bound = interval[0], interval[1]
+        dimension = len(variables)
+        center = np.full(dimension, (left_bound + right_bound) / 2)
+        simplex = np.vstack([center, center + np.eye(dimension) * INITIAL_SIMPLEX_SCALE * (right_bound - left_bound)])
+        simplex = np.clip(simplex, left_bound, right_bound)
+        values = objective(simplex).copy()  # whole simplex is evaluated by one call
+
+        iter_counter = count()  # iterations counter
+        borders_list = {next(iter_counter): MultiDimMinimization.bounding_box(simplex)}
+
+        for iter_num in iter_counter:
+            if np.max(np.ptp(simplex, axis=0)) <= eps or iter_num > MAX_ITERATIONS:
+                break
+            order = np.argsort(values, kind="stable")
+            simplex, values = simplex[order], values[order]
+            centroid = simplex[:-1].mean(axis=0)
+
+            reflected = np.clip(centroid + REFLECTION * (centroid - simplex[-1]), left_bound, right_bound)
+            f_reflected = objective.at(reflected)
+            if values[0] <= f_reflected < values[-2]:
+                simplex[-1], values[-1] = reflected, f_reflected
+            elif f_reflected < values[0]:
+                expanded = np.clip(centroid + EXPANSION * (reflected - centroid), left_bound, right_bound)
+                f_expanded = objective.at(expanded)
+                if f_expanded < f_reflected:
+                    simplex[-1], values[-1] = expanded, f_expanded
+                else:
+                    simplex[-1], values[-1] = reflected, f_reflected
+            else:
+                contracted = centroid + CONTRACTION * (simplex[-1] - centroid)
+                f_contracted = objective.at(contracted)
+                if f_contracted < values[-1]:
+                    simplex[-1], values[-1] = contracted, f_contracted
+                else:  # all points except the best one are moved to it
+                    simplex[1:] = simplex[0] + SHRINKAGE * (simplex[1:] - simplex[0])
+                    values[1:] = objective(simplex[1:])
+
+            borders_list.update({iter_num: MultiDimMinimization.bounding_box(simplex)})
+            if on_iteration:
+                on_iteration(iter_num, borders_list[iter_num])
+
+        best = int(np.argmin(values))
+        return MultiDimMinimization.make_result(simplex[best], values[best], borders_list, objective)
+
+    @staticmethod
+    def coordinate_descent_method(func, interval: list = [], eps: float = 0., on_iteration=None,
+                                  line_search: Callable = OneDimMinimization.golden_ratio_method) -> list:
+
+        """
+        Method for minimizing a function of several variables by the coordinate descent: the function is minimized
+         along every coordinate in turn by the one-dimensional method until the point stops moving
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search (also the accuracy of the line searches)
+        on_iteration: Callable
+            Function called after each iteration with its number and the box between the old and the new points
+        line_search: Callable
+            Method of OneDimMinimization minimizing the function along the coordinate
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes between the points of the iterations and the metrics
+        """
+
+        if not MultiDimMinimization.check_problem(func, interval):
+            return []
+        variables, numeric_func = VectorizedEvaluation.vectorize(func)
+        if not variables:
+            return MultiDimMinimization.const_minimization(func, interval)
+        objective = CountedFunction(numeric_func)
+
+        left_bound, right_bound = interval[0], interval[1]
+        point = np.full(len(variables), (left_bound + right_bound) / 2)
+        axes = np.eye(len(variables))
+
+        iter_counter = count()  # iterations counter
+        borders_list = {next(iter_counter): MultiDimMinimization.bounding_box(np.vstack([point] * 2))}
+
+        for iter_num in iter_counter:
+            previous_point = point.copy()
+            for coordinate in range(len(variables)):
+                # the step along the axis is searched so that the point stays in the box
+                line_results = line_search(LineObjective(objective, point, axes[coordinate]),
+                                           [left_bound - point[coordinate], right_bound - point[coordinate]], eps)
+                if not line_results:
+                    MultiDimMinimization.error_msg = OneDimMinimization.error_msg
+                    return []
+                point[coordinate] += line_results[0]
+
+            borders_list.update({iter_num: MultiDimMinimization.bounding_box(np.vstack([previous_point, point]))})
+            if on_iteration:
+                on_iteration(iter_num, borders_list[iter_num])
+            if np.max(np.abs(point - previous_point)) <= eps or iter_num >= MAX_ITERATIONS:
+                break
+
+        return MultiDimMinimization.make_result(point, objective.at(point), borders_list, objective)
+
+    @staticmethod
+    def coordinate_descent_fibonacci_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
+        return MultiDimMinimization.coordinate_descent_method(func, interval, eps, on_iteration,
+                                                              OneDimMinimization.fibonacci_method)
+
+    @staticmethod
+    def steepest_descent_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
+
+        """
+        Method for minimizing a function of several variables by the steepest descent with the golden ratio
+         line search along the antigradient
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search (the largest component of the gradient at the minimum)
+        on_iteration: Callable
+            Function called after each iteration with its number and the box between the old and the new points
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes between the points of the iterations and the metrics
+        """
+
+        return MultiDimMinimization.conjugate_gradient_method(func, interval, eps, on_iteration, conjugate=False)
+
+    @staticmethod
+    def conjugate_gradient_method(func, interval: list = [], eps: float = 0., on_iteration=None,
+                                  conjugate: bool = True) -> list:
+
+        """
+        Method for minimizing a function of several variables by the nonlinear conjugate gradient method
+         (Polak-Ribiere formula with restarts) with the golden ratio line search
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search (the largest component of the gradient at the minimum)
+        on_iteration: Callable
+            Function called after each iteration with its number and the box between the old and the new points
+        conjugate: bool
+            Whether the directions are conjugated (the steepest descent if False)
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes between the points of the iterations and the metrics
+        """
+
+        if not MultiDimMinimization.check_problem(func, interval):
+            return []
+        variables, numeric_func = VectorizedEvaluation.vectorize(func)
+        if not variables:
+            return MultiDimMinimization.const_minimization(func, interval)
+        objective = CountedFunction(numeric_func)
+        gradient = CountedFunction(VectorizedEvaluation.gradient(func))
+
+        left_bound, right_bound = interval[0], interval[1]
+        point, grad = MultiDimMinimization.starting_point(objective, gradient, len(variables), interval, eps)
+        direction = MultiDimMinimization.feasible_direction(point, -grad, interval)
+
+        iter_counter = count()  # iterations counter
+        borders_list = {next(iter_counter): MultiDimMinimization.bounding_box(np.vstack([point] * 2))}
+
+        for iter_num in iter_counter:
+            antigradient = MultiDimMinimization.feasible_direction(point, -grad, interval)
+            if np.max(np.abs(antigradient)) <= eps or iter_num > MAX_ITERATIONS:
+                break
+            step = MultiDimMinimization.golden_line_search(objective, point, direction, interval, eps)
+            if step is None:
+                return []
+            new_point = np.clip(point + step * direction, left_bound, right_bound)
+            new_grad = gradient.at(new_point)
+
+            borders_list.update({iter_num: MultiDimMinimization.bounding_box(np.vstack([point, new_point]))})
+            if on_iteration:
+                on_iteration(iter_num, borders_list[iter_num])
+            if np.max(np.abs(new_point - point)) <= eps * LINE_SEARCH_ACCURACY:  # the point stopped moving
+                point, grad = new_point, new_grad
+                break
+
+            beta = max(0., new_grad @ (new_grad - grad) / (grad @ grad)) if conjugate else 0.
+            direction = -new_grad + beta * direction
+            if iter_num % len(variables) == 0 or direction @ new_grad >= 0:  # restart from the antigradient
+                direction = -new_grad
+            point, grad = new_point, new_grad
+            direction = MultiDimMinimization.feasible_direction(point, direction, interval)
+
+        return MultiDimMinimization.make_result(point, objective.at(point), borders_list, objective, gradient)
+
+    @staticmethod
+    def bfgs_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
+
+        """
+        Method for minimizing a function of several variables by the quasi-Newton BFGS method with the line search
+         satisfying the strong Wolfe conditions
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search (the largest component of the gradient at the minimum)
+        on_iteration: Callable
+            Function called after each iteration with its number and the box between the old and the new points
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinates of the optimum of the function and its value,
+             the sequence of the boxes between the points of the iterations and the metrics
+        """
+
+        if not MultiDimMinimization.check_problem(func, interval):
+            return []
+        variables, numeric_func = VectorizedEvaluation.vectorize(func)
+        if not variables:
+            return MultiDimMinimization.const_minimization(func, interval)
+        objective = CountedFunction(numeric_func)
+        gradient = CountedFunction(VectorizedEvaluation.gradient(func))
+
+        left_bound, right_bound = interval[0], interval[1]
+        identity = np.eye(len(variables))
+        inverse_hessian = identity
+        point, grad = MultiDimMinimization.starting_point(objective, gradient, len(variables), interval, eps)
+        value = objective.at(point)
+
+        iter_counter = count()  # iterations counter
+        borders_list = {next(iter_counter): MultiDimMinimization.bounding_box(np.vstack([point] * 2))}
+
+        for iter_num in iter_counter:
+            antigradient = MultiDimMinimization.feasible_direction(point, -grad, interval)
+            if np.max(np.abs(antigradient)) <= eps or iter_num > MAX_ITERATIONS:
+                break
+            direction = MultiDimMinimization.feasible_direction(point, -inverse_hessian @ grad, interval)
+            if direction @ grad >= 0:  # approximation of the hessian is spoiled by the bounds of the box
+                inverse_hessian, direction = identity, antigradient
+            step, new_value, new_grad = MultiDimMinimization.wolfe_line_search(
+                objective, gradient, point, direction, value, grad,
+                MultiDimMinimization.max_step(point, direction, interval))
+            new_point = np.clip(point + step * direction, left_bound, right_bound)
+
+            borders_list.update({iter_num: MultiDimMinimization.bounding_box(np.vstack([point, new_point]))})
+            if on_iteration:
+                on_iteration(iter_num, borders_list[iter_num])
+            shift, grad_change = new_point - point, new_grad - grad
+            point, value, grad = new_point, new_value, new_grad
+            if np.max(np.abs(shift)) <= eps * LINE_SEARCH_ACCURACY:  # the point stopped moving
+                break
+
+            curvature = shift @ grad_change
+            if curvature > 0:  # otherwise the update would make the approximation not positive definite
+                if iter_num == 1:  # scale of the initial approximation is taken from the first step
+                    inverse_hessian = identity * curvature / (grad_change @ grad_change)
+                rho = 1 / curvature
+                inverse_hessian = (identity - rho * np.outer(shift, grad_change)) @ inverse_hessian @ \
+                    (identity - rho * np.outer(grad_change, shift)) + rho * np.outer(shift, shift)
+
+        return MultiDimMinimization.make_result(point, value, borders_list, objective, gradient)
+
+    @staticmethod
+    def starting_point(objective: CountedFunction, gradient: CountedFunction, dimension: int, interval: list,
+                       eps: float) -> tuple:
+
+        """
+        Method for choosing the first point of the gradient methods: the centre of the box, or the lowest of the
+         random points around it if the gradient vanishes at the centre and some of them is lower (the centre is
+         a saddle point or a maximum, for example of x*y, and the descent from it would stop at once)
+
+        Parameters:
+        ----------
+        objective: CountedFunction
+            Target function
+        gradient: CountedFunction
+            Gradient of the target function
+        dimension: int
+            Number of variables
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search (the largest component of the gradient at the minimum)
+
+        Returns:
+        -------
+            First point and the gradient at it
+        """
+
+        left_bound, right_bound = interval[0], interval[1]
+        point = np.full(dimension, (left_bound + right_bound) / 2)
+        grad = gradient.at(point)
+        if np.max(np.abs(MultiDimMinimization.feasible_direction(point, -grad, interval))) > eps:
+            return point, grad
+
+        directions = np.random.default_rng(PERTURBATION_SEED).normal(size=(PERTURBATION_PROBES * dimension, dimension))
+        directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+        probes = np.clip(point + PERTURBATION_SCALE * (right_bound - left_bound) * directions, left_bound, right_bound)
+        values = np.asarray(objective(probes))
+        best = int(np.argmin(values))
+        if values[best] < objective.at(point):
+            return probes[best], gradient.at(probes[best])
+        return point, grad
+
+    @staticmethod
+    def golden_line_search(objective: CountedFunction, point: np.ndarray, direction: np.ndarray, interval: list,
+                           eps: float):
+
+        """
+        Method for minimizing the function along the direction by the golden ratio method of OneDimMinimization
+         (the step is limited by the box)
+
+        Parameters:
+        ----------
+        objective: CountedFunction
+            Vectorized target function
+        point: np.ndarray
+            Current point
+        direction: np.ndarray
+            Direction of the search
+        interval: list
+            Interval of every variable
+        eps: float
+            Required accuracy of the minimum search
+
+        Returns:
+        -------
+            Step along the direction (None if the line search failed, the error is saved to error_msg)
+        """
+
+        max_step = MultiDimMinimization.max_step(point, direction, interval)
+        line_objective = LineObjective(objective, point, direction)
+        line_results = OneDimMinimization.golden_ratio_method(line_objective, [0., max_step],
+                                                              eps * LINE_SEARCH_ACCURACY / np.max(np.abs(direction)))
+        if not line_results:
+            MultiDimMinimization.error_msg = OneDimMinimization.error_msg
+            return None
+        # the golden ratio method stops short of the end, the minimum on the bound of the box is taken exactly, so
+        # the next directions are blocked by this bound
+        if line_objective.subs(LINE_VARIABLE, max_step) <= line_objective.subs(LINE_VARIABLE, line_results[0]):
+            return max_step
+        return line_results[0]
+
+    @staticmethod
+    def wolfe_line_search(objective: CountedFunction, gradient: CountedFunction, point: np.ndarray,
+                          direction: np.ndarray, value: float, grad: np.ndarray, max_step: float) -> tuple:
+
+        """
+        Method for finding the step along the descent direction satisfying the strong Wolfe conditions
+         (the step is increased until the minimum is bracketed, then the bracket is bisected)
+
+        Parameters:
+        ----------
+        objective: CountedFunction
+            Vectorized target function
+        gradient: CountedFunction
+            Vectorized gradient of the target function
+        point: np.ndarray
+            Current point
+        direction: np.ndarray
+            Descent direction
+        value: float
+            Value of the function at the point
+        grad: np.ndarray
+            Gradient of the function at the point
+        max_step: float
+            Step to the bound of the box along the direction
+
+        Returns:
+        -------
+            Step, value and gradient of the function at the new point
+        """
+
+        slope = grad @ direction
+        low = (0., value, grad)  # step with the least value found so far, its value and gradient
+        high_step = None
+        step = min(1., max_step)
+        for trial in range(MAX_LINE_SEARCH_STEPS):
+            if high_step is not None:  # minimum is bracketed between the low and high steps
+                step = (low[0] + high_step) / 2
+            new_point = point + step * direction
+            new_value = objective.at(new_point)
+            if new_value > value + SUFFICIENT_DECREASE * step * slope or (trial and new_value >= low[1]):
+                high_step = step
+                continue
+            new_grad = gradient.at(new_point)
+            new_slope = new_grad @ direction
+            if abs(new_slope) <= -CURVATURE_CONDITION * slope:
+                return step, new_value, new_grad
+            if high_step is None and new_slope >= 0:
+                high_step = low[0]
+            elif high_step is not None and new_slope * (high_step - low[0]) >= 0:
+                high_step = low[0]
+            low = (step, new_value, new_grad)
+            if high_step is None:
+                if step >= max_step:  # the bound of the box is reached
+                    return low
+                step = min(STEP_GROWTH * step, max_step)
+        return low
+
+    @staticmethod
+    def max_step(point: np.ndarray, direction: np.ndarray, interval: list) -> float:
+
+        """
+        Method for finding the largest step along the direction with which the point stays in the box
+
+        Parameters:
+        ----------
+        point: np.ndarray
+            Current point
+        direction: np.ndarray
+            Direction of the search
+        interval: list
+            Interval of every variable
+
+        Returns:
+        -------
+            Largest step
+        """
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps = np.where(direction > 0, (interval[1] - point) / direction,
+                             np.where(direction < 0, (interval[0] - point) / direction, np.inf))
+        return float(np.min(steps))
+
+    @staticmethod
+    def feasible_direction(point: np.ndarray, direction: np.ndarray, interval: list) -> np.ndarray:
+
+        """
+        Method for removing the components of the direction which lead out of the box from the point on its bound
+
+        Parameters:
+        ----------
+        point: np.ndarray
+            Current point
+        direction: np.ndarray
+            Direction of the search
+        interval: list
+            Interval of every variable
+
+        Returns:
+        -------
+            Direction along which the point can move
+        """
+
+        blocked = (point <= interval[0]) & (direction < 0) | (point >= interval[1]) & (direction > 0)
+        return np.where(blocked, 0., direction)
+
+    @staticmethod
+    def make_result(point: np.ndarray, value: float, borders_list: dict, objective: CountedFunction,
+                    gradient: CountedFunction = None) -> list:
+
+        """
+        Method for making the result of the multivariate method
+
+        Parameters:
+        ----------
+        point: np.ndarray
+            Found point of minimum
+        value: float
+            Value of the function at the point
+        borders_list: dict
+            Boxes of the iterations by their numbers
+        objective: CountedFunction
+            Target function which counted its evaluations
+        gradient: CountedFunction
+            Gradient which counted its evaluations (None for the methods without derivatives)
+
+        Returns:
+        -------
+            Point, value, boxes and metrics (numbers of iterations, function and gradient evaluations)
+        """
+
+        metrics = {"iterations": max(borders_list.keys()), "evaluations": objective.evaluations,
+                   "gradient_evaluations": gradient.evaluations if gradient is not None else 0}
+        return [tuple(point.tolist()), float(value), borders_list, metrics]
+
+    @staticmethod
+    def bounding_box(points: np.ndarray) -> tuple:
+        return tuple(points.min(axis=0).tolist()), tuple(points.max(axis=0).tolist())
+
+    @staticmethod
+    def const_minimization(func, interval: list) -> list:
+        middle = ((interval[0] + interval[1]) / 2,)
+        return [middle, float(func), {0: ((interval[0],), (interval[1],))},
+                {"iterations": 0, "evaluations": 0, "gradient_evaluations": 0}]
+
+
+MULTI_DIM_MINIMIZATION_METHODS = {"Nelder-Mead Method": MultiDimMinimization.nelder_mead_method,
+                                  "Coordinate Descent Method": MultiDimMinimization.coordinate_descent_method,
+                                  "Coordinate Descent (Fibonacci) Method":
+                                      MultiDimMinimization.coordinate_descent_fibonacci_method,
+                                  "Steepest Descent Method": MultiDimMinimization.steepest_descent_method,
+                                  "Conjugate Gradient Method": MultiDimMinimization.conjugate_gradient_method,
+                                  "BFGS Method": MultiDimMinimization.bfgs_method}  # methods by their names
@@ -0,0 +1,327 @@
+import shlex
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from inspect import signature, Parameter
+from threading import Lock
+from typing import Callable
+import numpy as np
+from backend.error_message import ErrorMessage
+
+MEMO_CACHE_SIZE = 100000  # number of computed points kept by one objective, the cache is cleared when it is full
+FINITE_DIFFERENCE_STEP = np.finfo(float).eps ** (1 / 3)  # relative step of the central differences of the gradient
+COMMAND_TIMEOUT = 60.  # seconds given to the external command for one value
+POSITIONAL_PARAMETERS = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+
+
+class ObjectiveEvaluationError(Exception):
+
+    """
+    Exception raised when the black-box objective could not calculate the value at the point
+    """
+
+
+class Objective:
+
+    """
+    Class of the target function evaluated at the points of the methods: the values are memoized, and the objectives
+     which are not vectorized are evaluated point by point in this thread or, if they are thread-safe, by the pool
+     of threads; it is passed to the methods instead of the sympy expression (the one-dimensional methods use
+     "free_symbols", "subs" and "float", the multivariate methods use "variables", "numeric_func" and
+     "numeric_gradient")
+
+    Parameters:
+    ----------
+    variables: tuple
+        Variables of the function (sympy symbols) in the order of the coordinates of the points
+    vectorizable: bool
+        Whether all points are calculated by one call of the function
+    thread_safe: bool
+        Whether the function can be called by several threads at once
+    workers: int
+        Number of threads calculating the points of the function which is not vectorizable (in this thread if 0)
+    values: dict
+        Computed values of the function by the points
+    evaluations: int
+        Number of the function values requested by the methods
+    computations: int
+        Number of the points at which the function was really calculated
+    """
+
+    def __init__(self, variables: tuple, vectorizable: bool = False, thread_safe: bool = False, workers: int = 0,
+                 cache_size: int = MEMO_CACHE_SIZE):
+        self.variables = tuple(variables)
+        self.vectorizable = vectorizable
+        self.thread_safe = thread_safe
+        self.workers = workers
+        self.cache_size = cache_size
+        self.values = {}
+        self.evaluations = 0
+        self.computations = 0
+        self.lock = Lock()
+        self.evaluation_lock = Lock()  # the function which is not thread-safe is called by one thread at a time
+        self.executor = ThreadPoolExecutor(max_workers=workers) if workers and thread_safe and not vectorizable \
+            else None
+
+    @staticmethod
+    def from_function(func):
+
+        """
+        Method for getting the objective of the target function given to the method
+
+        Parameters:
+        ----------
+        func: Any
+            Sympy expression, objective or other target function with "free_symbols" and "subs" (for example, the
+             cached objective of the methods comparison)
+
+        Returns:
+        -------
+            SympyObjective for the sympy expression, other functions as they are
+        """
+
+        from sympy import Expr
+
+        return SympyObjective(func) if isinstance(func, Expr) else func
+
+    def evaluate_points(self, points: np.ndarray) -> np.ndarray:
+
+        """
+        Method calculating the vectorizable function at the points given as rows of the array (without the cache)
+        """
+
+        raise NotImplementedError
+
+    def evaluate_point(self, point: np.ndarray) -> float:
+
+        """
+        Method calculating the function at one point (without the cache)
+        """
+
+        raise NotImplementedError
+
+    def compute(self, points: np.ndarray) -> np.ndarray:
+        if self.vectorizable:
+            with np.errstate(all="ignore"):  # the values outside the domain of the function are nan
+                return np.broadcast_to(np.asarray(self.evaluate_points(points), dtype=float), (len(points),))
+        if self.executor is not None and len(points) > 1:
+            return np.array(list(self.executor.map(self.evaluate_point, points)), dtype=float)
+        if self.thread_safe:
+            return np.array([self.evaluate_point(point) for point in points], dtype=float)
+        with self.evaluation_lock:
+            return np.array([self.evaluate_point(point) for point in points], dtype=float)
+
+    def numeric_func(self, points: np.ndarray) -> np.ndarray:
+
+        """
+        Method calculating the function at the points given as rows of the array, only the points which were not
+         calculated before are computed (by one call if the function is vectorizable)
+
+        Parameters:
+        ----------
+        points: np.ndarray
+            Points given as rows of the array
+
+        Returns:
+        -------
+            Values of the function
+        """
+
+        points = np.asarray(points, dtype=float).reshape(len(points), len(self.variables))
+        keys = [tuple(point) for point in points.tolist()]
+        values = np.empty(len(keys))
+        missing = {}  # indices of the points which are not in the cache by the points (repeated points once)
+        with self.lock:
+            self.evaluations += len(keys)
+            for index, key in enumerate(keys):
+                if key in self.values:
+                    values[index] = self.values[key]
+                else:
+                    missing.setdefault(key, []).append(index)
+        if not missing:
+            return values
+
+        # computed without lock, other threads go on
+        new_values = self.compute(np.array(list(missing), dtype=float).reshape(len(missing), len(self.variables)))
+        with self.lock:
+            if len(self.values) + len(missing) > self.cache_size:
+                self.values.clear()
+            self.computations += len(missing)
+            self.values.update(zip(missing, new_values.tolist()))
+        for indices, value in zip(missing.values(), new_values):
+            values[indices] = value
+        return values
+
+    def numeric_gradient(self, points: np.ndarray) -> np.ndarray:
+
+        """
+        Method calculating the gradients at the points given as rows of the array by the central differences (all
+         shifted points are calculated by one call of numeric_func)
+
+        Parameters:
+        ----------
+        points: np.ndarray
+            Points given as rows of the array
+
+        Returns:
+        -------
+            Gradients at the points (one gradient in a row)
+        """
+
+        points = np.asarray(points, dtype=float)
+        dimension = len(self.variables)
+        steps = FINITE_DIFFERENCE_STEP * np.maximum(1., np.abs(points))
+        shifts = np.eye(dimension)[np.newaxis, :, :] * steps[:, :, np.newaxis]  # shifts of every coordinate
+        shifted = np.concatenate([(points[:, np.newaxis, :] + shifts).reshape(-1, dimension),
+                                  (points[:, np.newaxis, :] - shifts).reshape(-1, dimension)])
+        forward, backward = np.split(self.numeric_func(shifted), 2)
+        return (forward - backward).reshape(len(points), dimension) / (2 * steps)
+
+    @property
+    def free_symbols(self) -> set:
+        return set(self.variables)
+
+    def subs(self, variable, point: float) -> float:
+        return float(self.numeric_func(np.array([[float(point)]]))[0])
+
+    def __float__(self) -> float:
+        return float(self.numeric_func(np.empty((1, len(self.variables))))[0])
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def __enter__(self) -> "Objective":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SympyObjective(Objective):
+
+    """
+    Class of the objective of the sympy expression: it is compiled into the vectorized function, the gradient is
+     derived symbolically
+
+    Parameters:
+    ----------
+    expr: sympy.Expr
+        Target function
+    """
+
+    def __init__(self, expr, cache_size: int = MEMO_CACHE_SIZE):
+        from backend.vectorized_evaluation import VectorizedEvaluation
+
+        variables, self.compiled = VectorizedEvaluation.compile_function(expr)
+        super().__init__(variables, vectorizable=True, thread_safe=True, cache_size=cache_size)
+        self.expr = expr
+
+    def evaluate_points(self, points: np.ndarray) -> np.ndarray:
+        return self.compiled(points)
+
+    def numeric_gradient(self, points: np.ndarray) -> np.ndarray:
+        from backend.vectorized_evaluation import VectorizedEvaluation
+
+        return VectorizedEvaluation.compile_gradient(self.expr)(points)
+
+    def __float__(self) -> float:
+        return float(self.expr)
+
+    def __str__(self) -> str:
+        return str(self.expr)
+
+
+class CallableObjective(Objective):
+
+    """
+    Class of the objective of the Python function taking one argument for every variable: the plain function is
+     called with the floats of one point, the vectorized one with the arrays of the coordinates of all points
+     (like the functions made by sympy.lambdify)
+
+    Parameters:
+    ----------
+    function: Callable
+        Target function
+    """
+
+    def __init__(self, function: Callable, variables: tuple = None, vectorized: bool = False,
+                 thread_safe: bool = False, workers: int = 0, cache_size: int = MEMO_CACHE_SIZE):
+        super().__init__(CallableObjective.function_variables(function) if variables is None else
+                         CallableObjective.make_symbols(variables), vectorized, thread_safe, workers, cache_size)
+        self.function = function
+
+    @staticmethod
+    def make_symbols(names) -> tuple:
+        from sympy import Symbol
+
+        return tuple(name if isinstance(name, Symbol) else Symbol(str(name)) for name in names)
+
+    @staticmethod
+    def function_variables(function: Callable) -> tuple:
+
+        """
+        Method for getting the variables of the function by the names of its positional parameters
+
+        Parameters:
+        ----------
+        function: Callable
+            Target function
+
+        Returns:
+        -------
+            Variables of the function, ValueError is raised if they are not known (for example, "*args")
+        """
+
+        try:
+            parameters = signature(function).parameters.values()
+        except (TypeError, ValueError) as error:  # some built-in functions have no signature
+            raise ValueError(ErrorMessage.ERROR_UNKNOWN_VARIABLES.value) from error
+        if any(parameter.kind == Parameter.VAR_POSITIONAL for parameter in parameters):
+            raise ValueError(ErrorMessage.ERROR_UNKNOWN_VARIABLES.value)
+        return CallableObjective.make_symbols(parameter.name for parameter in parameters
+                                              if parameter.kind in POSITIONAL_PARAMETERS and
+                                              parameter.default is Parameter.empty)
+
+    def evaluate_points(self, points: np.ndarray) -> np.ndarray:
+        return self.function(*points.T)
+
+    def evaluate_point(self, point: np.ndarray) -> float:
+        return float(self.function(*point.tolist()))
+
+    def __str__(self) -> str:
+        return getattr(self.function, "__name__", repr(self.function))
+
+
+class CommandObjective(Objective):
+
+    """
+    Class of the objective calculated by the external command: it is run as a local subprocess with the coordinates
+     of the point appended to its arguments and must print the value as the last line of its output; the commands
+     are independent processes, so several of them are run at once by the threads of the objective
+
+    Parameters:
+    ----------
+    command: list
+        Command and its arguments (the string is split like in the shell)
+    timeout: float
+        Seconds given to the command for one value
+    """
+
+    def __init__(self, command, variables: tuple, workers: int = 0, timeout: float = COMMAND_TIMEOUT,
+                 cache_size: int = MEMO_CACHE_SIZE):
+        super().__init__(CallableObjective.make_symbols(variables), vectorizable=False, thread_safe=True,
+                         workers=workers, cache_size=cache_size)
+        self.command = shlex.split(command) if isinstance(command, str) else list(command)
+        self.timeout = timeout
+
+    def evaluate_point(self, point: np.ndarray) -> float:
+        arguments = self.command + [repr(coordinate) for coordinate in point.tolist()]
+        try:
+            completed = subprocess.run(arguments, capture_output=True, text=True, timeout=self.timeout, check=True)
+            return float(completed.stdout.strip().splitlines()[-1])
+        except (OSError, subprocess.SubprocessError, ValueError, IndexError) as error:
+            raise ObjectiveEvaluationError(ErrorMessage.ERROR_OBJECTIVE_EVALUATION_FAILED.value +
+                                           ": " + " ".join(arguments)) from error
+
+    def __str__(self) -> str:
+        return shlex.join(self.command)
@@ -1,19 +1,23 @@
 from math import sqrt
-from numpy import finfo
+from numpy import finfo, array, argmin, arange, empty
 from itertools import count
 from backend.fibonacci_processing import FibonacciMethods as fbn
 from logging import Logger
-from backend.error_message import ErrorMessage
+from backend.error_message import ErrorMessage, ThreadErrorMessage
+from backend.objective import Objective
+from backend.vectorized_evaluation import VectorizedEvaluation
 
 CONSTANT_TAO = (sqrt(5) - 1) / 2  # golden ratio constant
 CONSTANT_ZERO = 0.0  # to return a "neat" zero instead of a machine epsilon
 CONSTANTS_DELTA = 0.01  # delta for dichotomy method
 BOUNDS_NUMBER = 2  # number of boundaries of uncertainty interval for finding optimum
 # of function that the list should contain in corresponding variable
+K_SECTION_POINTS = 8  # number of the interior points evaluated at once by one iteration of the k-section method
+MIN_K_SECTION_POINTS = 2  # one new point next to the kept best one would not shrink the interval
 EMPTY_STR = ""
 
 
-class OneDimMinimization:
+class OneDimMinimization(metaclass=ThreadErrorMessage):
 
     """
     Class uniting a set of static methods for minimizing one-dimensional
@@ -22,16 +26,37 @@ class OneDimMinimization:
     Parameters:
     ----------
     error_msg: str
-        String to store the error message, if any
+        String to store the error message of the current thread, if any
     logger: Logger
         Logger for monitoring program operation
     """
 
-    error_msg = EMPTY_STR
     logger = Logger(EMPTY_STR)
 
     @staticmethod
-    def dichotomy_method(func, interval: list = [], eps: float = 0.) -> list:
+    def interval_centre(left_bound: float, right_bound: float) -> float:
+
+        """
+        Method for getting the found point of minimum as the centre of the final uncertainty interval
+
+        Parameters:
+        ----------
+        left_bound: float
+            Left bound of the interval
+        right_bound: float
+            Right bound of the interval
+
+        Returns:
+        -------
+            Centre of the interval, a "neat" zero if it is closer to zero than the machine epsilon (on both sides,
+             the negative centres are kept)
+        """
+
+        centre = (right_bound + left_bound) / 2
+        return CONSTANT_ZERO if abs(centre) < finfo(float).eps else centre
+
+    @staticmethod
+    def dichotomy_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
 
         """
         Method for minimizing a one-dimensional function using a dichotomy
@@ -44,6 +69,8 @@ class OneDimMinimization:
             Segment where the minimum is being searched for
         eps: float
             Required accuracy of the minimum search
+        on_iteration: Callable
+            Function called after each iteration with its number and the new uncertainty interval
 
         Returns:
         -------
@@ -66,6 +93,7 @@ class OneDimMinimization:
             return [(interval[0] + interval[1]) / 2, float(func), {0: (interval[0], interval[1])}]
 
         variable = next(iter(func.free_symbols))
+        func = Objective.from_function(func)  # compiled and memoized instead of the symbolic substitution
 
         left_bound, right_bound = interval[0], interval[1]
 
@@ -84,13 +112,16 @@ class OneDimMinimization:
             else:
                 right_bound = v
 
-            borders_list.update({next(iter_counter): (left_bound, right_bound)})
+            iter_num = next(iter_counter)
+            borders_list.update({iter_num: (left_bound, right_bound)})
+            if on_iteration:
+                on_iteration(iter_num, (left_bound, right_bound))
 
-        res = CONSTANT_ZERO if (right_bound + left_bound) / 2 < finfo(float).eps else (right_bound + left_bound) / 2
+        res = OneDimMinimization.interval_centre(left_bound, right_bound)
         return [res, func.subs(variable, res), borders_list]
 
     @staticmethod
-    def golden_ratio_method(func, interval: list = [], eps: float = 0.) -> list:
+    def golden_ratio_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
 
         """
         Method for minimizing a one-dimensional function using a golden ratio method
@@ -103,6 +134,8 @@ class OneDimMinimization:
             Segment where the minimum is being searched for
         eps: float
             Required accuracy of the minimum search
+        on_iteration: Callable
+            Function called after each iteration with its number and the new uncertainty interval
 
         Returns:
         -------
@@ -125,6 +158,7 @@ class OneDimMinimization:
             return [(interval[0] + interval[1]) / 2, float(func), {0: (interval[0], interval[1])}]
 
         variable = next(iter(func.free_symbols))
+        func = Objective.from_function(func)  # compiled and memoized instead of the symbolic substitution
 
         left_bound, right_bound = interval[0], interval[1]
 
@@ -140,13 +174,16 @@ class OneDimMinimization:
                 left_bound = lambda_k
             else:
                 right_bound = mu_k
-            borders_list.update({next(iter_counter): (left_bound, right_bound)})
+            iter_num = next(iter_counter)
+            borders_list.update({iter_num: (left_bound, right_bound)})
+            if on_iteration:
+                on_iteration(iter_num, (left_bound, right_bound))
 
-        res = CONSTANT_ZERO if (right_bound + left_bound) / 2 < finfo(float).eps else (right_bound + left_bound) / 2
+        res = OneDimMinimization.interval_centre(left_bound, right_bound)
         return [res, func.subs(variable, res), borders_list]
 
     @staticmethod
-    def bisection_method(func, interval: list = [], eps: float = 0.) -> list:
+    def bisection_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
 
         """
         Method for minimizing a one-dimensional function using a bisection method
@@ -159,6 +196,8 @@ class OneDimMinimization:
             Segment where the minimum is being searched for
         eps: float
             Required accuracy of the minimum search
+        on_iteration: Callable
+            Function called after each iteration with its number and the new uncertainty interval
 
         Returns:
         -------
@@ -181,6 +220,7 @@ class OneDimMinimization:
             return [(interval[0] + interval[1]) / 2, float(func), {0: (interval[0], interval[1])}]
 
         variable = next(iter(func.free_symbols))
+        func = Objective.from_function(func)  # compiled and memoized instead of the symbolic substitution
 
         left_bound, right_bound = interval[0], interval[1]
         x_center = (right_bound + left_bound) / 2
@@ -203,13 +243,16 @@ class OneDimMinimization:
                     left_bound = x_1
                     right_bound = x_2
 
-            borders_list.update({next(iter_counter): (left_bound, right_bound)})
+            iter_num = next(iter_counter)
+            borders_list.update({iter_num: (left_bound, right_bound)})
+            if on_iteration:
+                on_iteration(iter_num, (left_bound, right_bound))
 
-        res = CONSTANT_ZERO if (right_bound + left_bound) / 2 < finfo(float).eps else (right_bound + left_bound) / 2
+        res = OneDimMinimization.interval_centre(left_bound, right_bound)
         return [res, func.subs(variable, res), borders_list]
 
     @staticmethod
-    def fibonacci_method(func, interval: list = [], eps: float = 0.) -> list:
+    def fibonacci_method(func, interval: list = [], eps: float = 0., on_iteration=None) -> list:
 
         """
         Method for minimizing a one-dimensional function using fibonacci method
@@ -222,6 +265,8 @@ class OneDimMinimization:
             Segment where the minimum is being searched for
         eps: float
             Required accuracy of the minimum search
+        on_iteration: Callable
+            Function called after each iteration with its number and the new uncertainty interval
         draw: bool
             Boolean parameter responsible for disclosing / hiding rendering of the minimization process
 
@@ -246,6 +291,7 @@ class OneDimMinimization:
             return [(interval[0] + interval[1]) / 2, float(func), {0: (interval[0], interval[1])}]
 
         variable = next(iter(func.free_symbols))
+        func = Objective.from_function(func)  # compiled and memoized instead of the symbolic substitution
 
         left_bound, right_bound = interval[0], interval[1]
 
@@ -293,6 +339,104 @@ class OneDimMinimization:
                     return []  # in case of an error, return an empty list
 
             borders_list.update({k: (left_bound, right_bound)})
+            if on_iteration:
+                on_iteration(k, (left_bound, right_bound))
 
-        res = CONSTANT_ZERO if (right_bound + left_bound) / 2 < finfo(float).eps else (right_bound + left_bound) / 2
+        res = OneDimMinimization.interval_centre(left_bound, right_bound)
         return [res, func.subs(variable, res), borders_list]
+
+    @staticmethod
+    def k_section_method(func, interval: list = [], eps: float = 0., on_iteration=None,
+                         points_number: int = K_SECTION_POINTS, workers: int = 0) -> list:
+
+        """
+        Method for minimizing a one-dimensional function using k-section: every iteration evaluates the uniform
+         grid of interior points by one vectorized call (or by the pool of processes) and keeps the two steps
+         around the best point; the best point is the middle of the new interval, so it is a point of the next grid
+         and every iteration after the first one needs not more than points_number new values, while the interval
+         shrinks (points_number + 2) / 2 times for even points_number
+
+        Parameters:
+        ----------
+        func: Any
+            Target function of finding the minimum
+        interval: list
+            Segment where the minimum is being searched for
+        eps: float
+            Required accuracy of the minimum search
+        on_iteration: Callable
+            Function called after each iteration with its number and the new uncertainty interval
+        points_number: int
+            Number of the points evaluated at once
+        workers: int
+            Number of processes among which every grid is split (evaluated in this process if 0)
+
+        Returns:
+        -------
+            List of parameters, which includes the coordinate of the optimum of the function and its value,
+             the sequence of the boundaries of the uncertainty interval in the process of minimization and
+             the metrics (numbers of iterations and function evaluations)
+        """
+
+        from sympy import Expr
+
+        # processing exceptions, which can ruin work of one dimension minimization
+        if len(interval) != BOUNDS_NUMBER:
+            OneDimMinimization.logger.error(ErrorMessage.ERROR_TOO_MUCH_BOUNDS.value)
+            OneDimMinimization.error_msg = ErrorMessage.ERROR_TOO_MUCH_BOUNDS.value
+            return []  # in case of an error, return an empty list
+
+        if len(func.free_symbols) > 1:
+            OneDimMinimization.logger.error(ErrorMessage.ERROR_WRONG_DIMENSION.value)
+            OneDimMinimization.error_msg = ErrorMessage.ERROR_WRONG_DIMENSION.value
+            return []  # in case of an error, return an empty list
+
+        if len(func.free_symbols) == 0:
+            return [(interval[0] + interval[1]) / 2, float(func), {0: (interval[0], interval[1])},
+                    {"iterations": 0, "evaluations": 0, "gradient_evaluations": 0}]
+
+        variable = next(iter(func.free_symbols))
+        left_bound, right_bound = interval[0], interval[1]
+        iter_counter = count()  # iterations counter
+        borders_list = {next(iter_counter): (left_bound, right_bound)}
+        points_number = max(points_number, MIN_K_SECTION_POINTS)
+
+        # the sympy expression and the objectives are evaluated on the whole grid at once, other target functions
+        # (for example, the cached objective of the methods comparison) point by point
+        numeric_func = VectorizedEvaluation.vectorize(func)[1] if isinstance(func, (Expr, Objective)) else \
+            (lambda points: array([float(func.subs(variable, point)) for point in points[:, 0]]))
+        with VectorizedEvaluation.population_evaluator(func, numeric_func, workers if isinstance(func, Expr) else 0) \
+                as evaluate:
+            grid_size, best_index, best_value = points_number, None, None  # the first grid has no known points
+            while right_bound - left_bound > eps:
+                step = (right_bound - left_bound) / (grid_size + 1)
+                grid = left_bound + step * arange(1, grid_size + 1)
+                values = empty(grid_size)
+                new_points = arange(grid_size) != best_index
+                values[new_points] = evaluate(grid[new_points, None])
+                values[~new_points] = best_value
+                best_index = int(argmin(values))
+                best_value, previous_length = values[best_index], right_bound - left_bound
+                left_bound, right_bound = float(grid[best_index] - step), float(grid[best_index] + step)
+                # the odd grid of the next interval has the best point in the middle
+                grid_size = points_number + 1 - points_number % 2
+                best_index = grid_size // 2
+
+                iter_num = next(iter_counter)
+                borders_list.update({iter_num: (left_bound, right_bound)})
+                if on_iteration:
+                    on_iteration(iter_num, (left_bound, right_bound))
+                if not right_bound - left_bound < previous_length:  # the interval is as small as floats allow
+                    break
+
+        res = OneDimMinimization.interval_centre(left_bound, right_bound)
+        return [res, func.subs(variable, res), borders_list,
+                {"iterations": max(borders_list.keys()), "evaluations": evaluate.evaluations,
+                 "gradient_evaluations": 0}]
+
+
+ONE_DIM_MINIMIZATION_METHODS = {"Golden Ratio Method": OneDimMinimization.golden_ratio_method,
+                                "Dichotomy Method": OneDimMinimization.dichotomy_method,
+                                "Bisection Method": OneDimMinimization.bisection_method,
+                                "Fibonacci Method": OneDimMinimization.fibonacci_method,
+                                "K-Section Method": OneDimMinimization.k_section_method}  # methods by their names
@@ -0,0 +1,162 @@
+import re
+import time
+from dataclasses import dataclass, field
+from itertools import product
+import numpy as np
+from backend.one_dimension_minimization import OneDimMinimization, ONE_DIM_MINIMIZATION_METHODS, EMPTY_STR
+from backend.expression_compiler import ExpressionCompiler
+from backend.error_message import ErrorMessage
+
+VALUES_SEPARATORS = r"[,;\s]+"  # separators of the values in the list "0.1, 0.01; 0.001"
+RANGE_SEPARATOR = ":"  # range of values is written as "start:stop:count"
+RANGE_PARTS_NUMBER = 3
+
+
+@dataclass
+class SweepProblem:
+
+    """
+    Class of one minimization problem of the parameter sweep (it is sent to another process, so it keeps only text
+     and numbers)
+
+    Parameters:
+    ----------
+    function: str
+        Target function as it was entered by the user
+    interval: list
+        Initial uncertainty interval
+    eps: float
+        Accuracy of the minimum search
+    method: str
+        Name of the minimization method (key of ONE_DIM_MINIMIZATION_METHODS)
+    """
+
+    function: str
+    interval: list
+    eps: float
+    method: str
+
+
+@dataclass
+class SweepResult:
+
+    """
+    Class of the result of one problem of the parameter sweep
+
+    Parameters:
+    ----------
+    problem: SweepProblem
+        Solved problem
+    results: list
+        Result of the minimization method (optimum, its value and the sequence of intervals), empty if it failed
+    error_msg: str
+        Error of the minimization method (empty string if the problem is solved)
+    wall_time: float
+        Time of solving the problem in seconds
+    """
+
+    problem: SweepProblem
+    results: list = field(default_factory=list)
+    error_msg: str = EMPTY_STR
+    wall_time: float = 0.
+
+
+class ParameterSweep:
+
+    """
+    Class with methods for making the cartesian product of the minimization problem parameters and solving its problems
+    """
+
+    @staticmethod
+    def parse_values(text: str, logarithmic: bool = False) -> list:
+
+        """
+        Method for reading the values of the parameter as a list ("1, 2, 3") or as a range ("start:stop:count")
+
+        Parameters:
+        ----------
+        text: str
+            Values entered by the user
+        logarithmic: bool
+            Whether the values of the range are evenly spaced on the logarithmic scale (useful for accuracy)
+
+        Returns:
+        -------
+            Values of the parameter, ValueError is raised if the text is incorrect
+        """
+
+        text = text.strip()
+        try:
+            if RANGE_SEPARATOR in text:
+                parts = text.split(RANGE_SEPARATOR)
+                if len(parts) != RANGE_PARTS_NUMBER:
+                    raise ValueError(text)
+                start, stop, count = float(parts[0]), float(parts[1]), int(parts[2])
+                values = np.geomspace(start, stop, count) if logarithmic else np.linspace(start, stop, count)
+                return values.tolist()
+            values = [float(value) for value in re.split(VALUES_SEPARATORS, text) if value]
+        except ValueError as error:
+            raise ValueError(ErrorMessage.ERROR_INVALID_VALUE.value + ": " + text) from error
+        if not values:
+            raise ValueError(ErrorMessage.ERROR_INVALID_VALUE.value)
+        return values
+
+    @staticmethod
+    def make_problems(function: str, eps_values: list, left_bounds: list, right_bounds: list,
+                      methods: list) -> list:
+
+        """
+        Method for making all problems of the sweep, the intervals whose left bound is not less than the right one
+         are skipped
+
+        Parameters:
+        ----------
+        function: str
+            Target function
+        eps_values: list
+            Accuracies of the minimum search
+        left_bounds: list
+            Left bounds of the uncertainty intervals
+        right_bounds: list
+            Right bounds of the uncertainty intervals
+        methods: list
+            Names of the minimization methods
+
+        Returns:
+        -------
+            List of SweepProblem objects
+        """
+
+        return [SweepProblem(function, [left, right], eps, method)
+                for method, left, right, eps in product(methods, left_bounds, right_bounds, eps_values)
+                if left < right]
+
+    @staticmethod
+    def solve_problem(problem: SweepProblem) -> SweepResult:
+
+        """
+        Method for solving one problem of the sweep (executed in a process of the pool)
+
+        Parameters:
+        ----------
+        problem: SweepProblem
+            Problem to solve
+
+        Returns:
+        -------
+            Result of the problem
+        """
+
+        OneDimMinimization.error_msg = EMPTY_STR  # the process solves many problems one after another
+        start = time.perf_counter()
+        try:
+            compiled_function = ExpressionCompiler.compile(problem.function)
+            results = ONE_DIM_MINIMIZATION_METHODS[problem.method](compiled_function.expr, problem.interval,
+                                                                   problem.eps)
+        except Exception as error:  # error of one problem must not stop the whole sweep
+            return SweepResult(problem, error_msg=str(error))
+        if OneDimMinimization.error_msg:
+            return SweepResult(problem, error_msg=OneDimMinimization.error_msg)
+        # sequence of intervals is sent back for the animation and for the trajectory kept in the results history
+        return SweepResult(problem, [float(results[0]), float(results[1]), results[2]],
+                           wall_time=time.perf_counter() - start)
@@ -2,15 +2,21 @@ import numpy as np
 from math import fabs
 from sympy import Symbol, Expr
 from dataclasses import dataclass
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure, Axes
 from backend.drawer_interface import DrawerInterface
-from typing import List
+from typing import List, Callable
 from pure_protobuf.dataclasses_ import field, optional_field
 from backend.gif_maker import GifMaker
+from backend.frame_selection import FrameSelector, FrameSelectionPolicy
+from backend.figure_pool import FIGURE_POOL
+from backend.animation_writer import RENDER_PRESETS, DEFAULT_RENDER_PRESET
+from backend.expression_compiler import ExpressionCompiler
 
 # constants for minimization drawing and configuring plotting
 POINTS_NUMBER = 1000
+ZOOM_POINTS_NUMBER = 400  # fixed sampling budget of the function inside the current interval for zooming frames
+ZOOM_MARGIN = 0.25  # indent of the zooming view from the borders of the interval relative to its width
+MIN_VIEW_WIDTH = 1e-300  # lower bound of view width for degenerate (zero-width) intervals
 DOTS_NUMBER = 10  # number of points on the dotted border of the interval
 ARROW_COLOR = "green"  # color for annotation arrow
 ARROW_SHRINK = 0.01  # annotation arrow shrink
@@ -27,7 +33,7 @@ EMPTY_STR = ""
 
 IMAGES_FOLDER = "front/images_for_gif"
 RESULT_FILENAME = "minimization_image_"
-RES_POSTFIX = ".jpg"
+RES_POSTFIX = ".png"  # lossless frames, so the animation encoder does not quantize compression artifacts
 BOUNDS_LABEL_PREFIX = "iter #"
 PATH_DELIMITER = "/"
 
@@ -50,6 +56,17 @@ class PlaneMinimizationDrawer(DrawerInterface):
         Value of the function on the uncertainty interval
     variable: Symbol
         Variable for optimization
+    zoom: bool
+        Whether the view of each iteration follows the current uncertainty interval
+         instead of the initial one
+    numeric_func: Callable
+        Target function compiled into a vectorized numpy function
+    images_folder: str
+        Directory where the frames of the animation are saved
+    image_prefix: str
+        Beginning of the names of the frames (to render several animations into one directory at once)
+    render_preset: str
+        Name of the resolution preset of the frames (see RENDER_PRESETS)
     """
 
     func: Expr = field(1, default="")
@@ -59,6 +76,11 @@ class PlaneMinimizationDrawer(DrawerInterface):
     variable: Symbol = optional_field(5)
     fig: Figure = optional_field(6)
     axes: Axes = optional_field(7)
+    zoom: bool = field(8, default=False)
+    numeric_func: Callable = optional_field(9)
+    images_folder: str = field(10, default=IMAGES_FOLDER)
+    image_prefix: str = field(11, default=RESULT_FILENAME)
+    render_preset: str = field(12, default=DEFAULT_RENDER_PRESET)
 
     def __post_init__(self):
         try:
@@ -67,9 +89,29 @@ class PlaneMinimizationDrawer(DrawerInterface):
                 self.variable = next(iter(self.func.free_symbols))
         except SyntaxError:
             raise Exception("Error: invalid target function syntax")  ####
-        self.fig, self.axes = plt.subplots()
+        self.numeric_func = ExpressionCompiler.lambdify(self.variable if self.variable else [], self.func)
+        # figure is not registered in pyplot, so drawers do not share any global state and can work in threads
+        preset = RENDER_PRESETS[self.render_preset]
+        self.fig = FIGURE_POOL.acquire(preset.figure_size, preset.dpi)
+        self.axes = self.fig.add_subplot()
         self.calculate_function_graph()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+
+        """
+        Method for returning the figure of the drawer to the pool of figures, the drawer can not draw after it
+        """
+
+        if self.fig is not None:
+            FIGURE_POOL.release(self.fig)
+            self.fig, self.axes = None, None
+
     def render_optimization_image(self):
 
         """
@@ -85,10 +127,27 @@ class PlaneMinimizationDrawer(DrawerInterface):
         Method for plotting a function graph in an easy-to-draw format
         """
 
-        self.x_values = list(np.linspace(self.bounds[0], self.bounds[1], POINTS_NUMBER))
-        self.y_values = []
-        for component in self.x_values:
-            self.y_values.append(float(self.func.subs(self.variable, component)))
+        self.x_values = np.linspace(self.bounds[0], self.bounds[1], POINTS_NUMBER)
+        self.y_values = self.evaluate(self.x_values)
+
+    def evaluate(self, x_values: np.ndarray) -> np.ndarray:
+
+        """
+        Method for calculating the values of the target function on an array of points with one vectorized call
+
+        Parameters:
+        ----------
+        x_values: np.ndarray
+            Points of the optimization variable
+
+        Returns:
+        -------
+            Values of the function at the given points
+        """
+
+        if self.variable is None:  # constant function does not depend on the points
+            return np.full(np.shape(x_values), float(self.func))
+        return np.broadcast_to(np.asarray(self.numeric_func(x_values), dtype=float), np.shape(x_values))
 
     def draw_graph_of_function(self):
 
@@ -98,7 +157,6 @@ class PlaneMinimizationDrawer(DrawerInterface):
 
         self.axes.plot(self.x_values, self.y_values, "r", label="target function")
         self.axes.legend()
-        plt.draw()
 
     def draw_colored_axes(self):
 
@@ -106,8 +164,8 @@ class PlaneMinimizationDrawer(DrawerInterface):
         Method for drawing colored coordinate axes on the graph
         """
 
-        plt.xlabel(str(self.variable))
-        plt.ylabel("f({})".format(self.variable))
+        self.axes.set_xlabel(str(self.variable))
+        self.axes.set_ylabel("f({})".format(self.variable))
 
         right_bound = fabs(max(self.bounds)) if fabs(max(self.bounds)) > fabs(min(self.bounds)) \
             else fabs(min(self.bounds))
@@ -124,7 +182,6 @@ class PlaneMinimizationDrawer(DrawerInterface):
                         width=AXES_ARROW_WIDTH)
 
         self.axes.grid()
-        plt.draw()
 
     def draw_bounds(self, iteration: int = 1):
 
@@ -138,8 +195,8 @@ class PlaneMinimizationDrawer(DrawerInterface):
              of the uncertainty interval should be drawn
         """
 
-        f_left = self.func.subs(self.variable, self.bounds[0])  # consider the value of the function at the boundaries
-        f_right = self.func.subs(self.variable, self.bounds[1])  # of the uncertainty interval
+        f_left, f_right = self.evaluate(np.array(self.bounds[:2], dtype=float))  # values of the function
+        # at the boundaries of the uncertainty interval
 
         # drawing right bound
         self.draw_point(iteration=iteration,
@@ -200,9 +257,6 @@ class PlaneMinimizationDrawer(DrawerInterface):
         # making annotation of center point of interval
         self.annotate_point(point_x, point_y, annotation)
 
-        # self.axes.legend()
-        plt.draw()
-
     def annotate_point(self, x_point: float, y_point: float, text: str):
 
         """
@@ -221,10 +275,12 @@ class PlaneMinimizationDrawer(DrawerInterface):
         text_y: float
             Y-coordinate of text annotation to point
         """
-        annotation_indent = max(self.y_values) / ANNOTATION_INDENT
-        plt.annotate(text, xy=(x_point, y_point), xytext=(x_point, y_point + annotation_indent), color=ANNOTATION_COLOR,
-                     arrowprops=dict(facecolor=ARROW_COLOR, shrink=ARROW_SHRINK), fontsize="xx-small")
-        plt.draw()
+        # in the zooming view the graph can lie far from zero, so the indent is measured by its height
+        annotation_indent = (max(self.y_values) - min(self.y_values) if self.zoom else max(self.y_values)) / \
+            ANNOTATION_INDENT
+        self.axes.annotate(text, xy=(x_point, y_point), xytext=(x_point, y_point + annotation_indent),
+                           color=ANNOTATION_COLOR, arrowprops=dict(facecolor=ARROW_COLOR, shrink=ARROW_SHRINK),
+                           fontsize="xx-small")
 
     def get_fig(self):
         return self.fig
@@ -232,8 +288,11 @@ class PlaneMinimizationDrawer(DrawerInterface):
     def clear_figure(self):
         self.axes.cla()
 
-    def draw_minimization(self, x_optimum: float = 0., f_x_optimum: float = 0., borders: dict = {}) -> list:
+    def draw_minimization(self, x_optimum: float = 0., f_x_optimum: float = 0., borders: dict = None,
+                          frame_policy: FrameSelectionPolicy = FrameSelectionPolicy.ALL,
+                          max_frames: int = None) -> list:
         """
+        Method for drawing the whole minimization process, frames are chosen before any rendering
 
         Parameters:
         ----------
@@ -243,20 +302,50 @@ class PlaneMinimizationDrawer(DrawerInterface):
             Value of the function at the point at which the minimum of the function was found
         borders: dict
             Dictionary with all intervals of uncertainty in the minimization process, numbered by the iteration index
+             (only the result is drawn if there are no intervals)
+        frame_policy: FrameSelectionPolicy
+            Rule for choosing the iterations which become frames of the animation
+        max_frames: int
+            Upper limit of the number of iteration frames (without limit if None)
 
         Returns:
         -------
             List of paths to images for gif creation
         """
 
+        if not borders:
+            return [self.draw_result_image(0, result_x=x_optimum, result_y=f_x_optimum)]
         images_for_gif = []
         init_iter = 0
-        for iter_num in borders.keys():
+        # in the zooming view the borders of each next interval move by a noticeable part of the view
+        pixel_size = 0. if self.zoom else self.pixel_size(borders[init_iter])
+        frames = FrameSelector.select_frames(borders, frame_policy, max_frames, pixel_size)
+        for iter_num in frames:
             self.update_bounds(list(borders[iter_num]))
             images_for_gif.append(self.draw_current_iteration(iter_num, borders[init_iter]))
         images_for_gif.append(self.draw_result_image(len(borders.keys()), result_x=x_optimum, result_y=f_x_optimum))
         return images_for_gif
 
+    def pixel_size(self, init_interval: tuple = ()) -> float:
+
+        """
+        Method for estimating the width of one pixel of the graph in the units of the optimization variable
+
+        Parameters:
+        ----------
+        init_interval: tuple
+            Initial bounds of uncertainty interval, by which the coordinate axes of the graph are drawn
+
+        Returns:
+        -------
+            Width of one pixel along the abscissa axis
+        """
+
+        axes_width = self.axes.get_position().width * self.fig.get_figwidth() * self.fig.dpi  # in pixels
+        # horizontal axis is drawn symmetrically with respect to zero (see "draw_colored_axes")
+        view_width = AXES_BOUND_MULTIPLIER * max(fabs(init_interval[0]), fabs(init_interval[1]))
+        return view_width / axes_width
+
     def draw_current_iteration(self, iter_num: int = 0, init_interval: tuple = ()) -> str:
 
         """
@@ -280,14 +369,61 @@ class PlaneMinimizationDrawer(DrawerInterface):
             Path to result image
         """
 
-        self.draw_bounds(iter_num)
-        self.update_bounds([init_interval[0], init_interval[1]])
-        self.draw_colored_axes()
-        self.draw_graph_of_function()
-        image_path = PlaneMinimizationDrawer.save_iteration_img(iter_num)
+        if self.zoom:
+            self.draw_zoomed_iteration(iter_num)
+            self.update_bounds([init_interval[0], init_interval[1]])
+        else:
+            self.draw_bounds(iter_num)
+            self.update_bounds([init_interval[0], init_interval[1]])
+            self.draw_colored_axes()
+            self.draw_graph_of_function()
+        image_path = self.save_iteration_img(iter_num)
         self.clear_figure()
         return image_path
 
+    def zoom_interval(self) -> tuple:
+
+        """
+        Method for calculating the view of the graph which follows the current uncertainty interval
+
+        Returns:
+        -------
+            Left and right borders of the view
+        """
+
+        width = max(self.bounds[1] - self.bounds[0], MIN_VIEW_WIDTH)
+        return self.bounds[0] - ZOOM_MARGIN * width, self.bounds[1] + ZOOM_MARGIN * width
+
+    def draw_zoomed_iteration(self, iter_num: int = 0):
+
+        """
+        Method for drawing the current iteration in the view of the current uncertainty interval,
+         the function is resampled only inside this view with a fixed number of points
+
+        Parameters:
+        ----------
+        iter_num: int
+            Number of current iteration which drawing we draw
+        """
+
+        full_graph = self.x_values, self.y_values
+        view = self.zoom_interval()
+        self.x_values = np.linspace(view[0], view[1], ZOOM_POINTS_NUMBER)
+        self.y_values = self.evaluate(self.x_values)
+
+        self.axes.set_xlabel(str(self.variable))
+        self.axes.set_ylabel("f({})".format(self.variable))
+        self.axes.grid()
+        self.draw_graph_of_function()
+        self.draw_bounds(iter_num)
+
+        bottom, top = min(self.y_values), max(self.y_values)
+        indent = (top - bottom) / ANNOTATION_INDENT if top > bottom else max(fabs(top), 1.) * ZOOM_MARGIN
+        self.axes.set_xlim(*view)
+        self.axes.set_ylim(bottom - indent, top + 2 * indent)  # leaving a place for annotations above the graph
+
+        self.x_values, self.y_values = full_graph
+
     def draw_result_image(self, iter_num: int = 1, result_x: float = 0., result_y: float = 0.) -> str:
 
         """
@@ -314,7 +450,7 @@ class PlaneMinimizationDrawer(DrawerInterface):
         self.draw_graph_of_function()
         self.draw_colored_axes()
         self.draw_point(iter_num, "result point on iteration #{}".format(iter_num), result_x, result_y)
-        return PlaneMinimizationDrawer.save_iteration_img(iter_num)
+        return self.save_iteration_img(iter_num)
 
     def const_minimization(self, interval: list) -> str:
 
@@ -335,10 +471,9 @@ class PlaneMinimizationDrawer(DrawerInterface):
         result_x = (interval[0] + interval[1]) / 2
         result_y = float(self.func)
         images_for_gif = [self.draw_result_image(iter_num, result_x, result_y)]
-        return GifMaker.create_gif_result(images_for_gif, IMAGES_FOLDER)
+        return GifMaker.create_gif_result(images_for_gif, self.images_folder)
 
-    @staticmethod
-    def save_iteration_img(iter_num: int = 0) -> str:
+    def save_iteration_img(self, iter_num: int = 0) -> str:
 
         """
         Method for saving the path to the image, along which it is planned to animate the minimization process,
@@ -355,6 +490,6 @@ class PlaneMinimizationDrawer(DrawerInterface):
         """
 
         image_name = "iter_{}".format(iter_num)
-        full_path = IMAGES_FOLDER + PATH_DELIMITER + RESULT_FILENAME + image_name + RES_POSTFIX
-        plt.savefig(full_path)
+        full_path = self.images_folder + PATH_DELIMITER + self.image_prefix + image_name + RES_POSTFIX
+        self.fig.savefig(full_path, dpi=RENDER_PRESETS[self.render_preset].dpi)
         return full_path
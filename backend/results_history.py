@@ -0,0 +1,252 @@
+from array import array
+from dataclasses import dataclass, field
+import numpy as np
+
+HISTORY_COLUMNS = ["function", "interval", "eps", "result", "method"]  # columns of the store in the table order
+METADATA_COLUMNS = ["wall_time", "trajectory"]  # columns of the store which are not shown in the table
+STORE_COLUMNS = HISTORY_COLUMNS + METADATA_COLUMNS
+NUMERIC_COLUMNS = ["eps", "result", "wall_time"]  # columns kept as arrays of floats, the rest are kept as lists
+INTERVAL_DELIMITER = ","  # separator of the bounds in the text of the interval
+
+
+@dataclass
+class ResultRecord:
+
+    """
+    Class of one solved minimization problem
+
+    Parameters:
+    ----------
+    function: str
+        Target function as it was entered by the user
+    interval: str
+        Initial uncertainty interval as it was entered by the user
+    eps: float
+        Accuracy of the minimum search
+    result: float
+        Value of the target function at the found point of minimum
+    method: str
+        Name of the minimization method
+    wall_time: float
+        Time of solving the problem in seconds
+    trajectory: list
+        Uncertainty intervals of the method as (iteration, left, right) tuples (bounds are tuples of coordinates
+         for the functions of several variables)
+    """
+
+    function: str
+    interval: str
+    eps: float
+    result: float
+    method: str
+    wall_time: float = 0.
+    trajectory: list = field(default_factory=list)
+
+    def key(self) -> tuple:
+        return ResultRecord.problem_key(self.function, self.interval, self.eps, self.method)
+
+    @staticmethod
+    def problem_key(function: str, interval, eps, method: str) -> tuple:
+
+        """
+        Method for making the key of the problem by which its result is found in the history: the same problem
+         entered by the user ("[1, 2]") and made by the parameter sweep ([1.0, 2.0]) has the same key
+
+        Parameters:
+        ----------
+        function: str
+            Target function
+        interval: str or list
+            Initial uncertainty interval as the text of the table or as the list of bounds
+        eps: str or float
+            Accuracy of the minimum search
+        method: str
+            Name of the minimization method
+
+        Returns:
+        -------
+            Function, interval as the tuple of floats (the text as it is if it is not a list of numbers), accuracy
+             as the float and method
+        """
+
+        try:
+            interval = tuple(float(bound) for bound in (interval.strip().strip("[]").split(INTERVAL_DELIMITER)
+                                                        if isinstance(interval, str) else interval))
+        except ValueError:  # incorrect text is compared as it is
+            interval = (str(interval).strip(),)
+        try:
+            eps = float(eps)
+        except ValueError:
+            eps = str(eps).strip()
+        return function.strip(), interval, eps, method
+
+    @staticmethod
+    def trajectory_from_borders(borders: dict) -> list:
+
+        """
+        Method for converting the sequence of intervals returned by the minimization method into the trajectory
+
+        Parameters:
+        ----------
+        borders: dict
+            Uncertainty intervals (or boxes of the multivariate methods) by the iteration numbers
+
+        Returns:
+        -------
+            List of (iteration, left, right) tuples ordered by the iterations
+        """
+
+        return [(int(iteration), ResultRecord.bound_value(left), ResultRecord.bound_value(right))
+                for iteration, (left, right) in sorted(borders.items())]
+
+    @staticmethod
+    def bound_value(bound):
+        return tuple(float(value) for value in bound) if isinstance(bound, (tuple, list)) else float(bound)
+
+
+class ResultsHistory:
+
+    """
+    Class of the columnar in-memory store of the minimization results: each column is kept in its own container,
+     so adding a row does not create any objects except the values themselves and sorting works on whole columns
+
+    Parameters:
+    ----------
+    columns: dict
+        Values of the store by the column names
+    keys: dict
+        Index of the last result of every problem by its key (function, interval, accuracy and method), it is the
+         cache of the solved problems
+    """
+
+    def __init__(self):
+        self.columns = {}
+        self.keys = {}
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.columns[HISTORY_COLUMNS[0]])
+
+    def clear(self):
+
+        """
+        Method for deleting all results from the store
+        """
+
+        self.columns = {name: array("d") if name in NUMERIC_COLUMNS else [] for name in STORE_COLUMNS}
+        self.keys = {}
+
+    def append_records(self, records: list):
+
+        """
+        Method for adding the batch of results to the end of the store
+
+        Parameters:
+        ----------
+        records: list
+            Results of the minimization problems (ResultRecord objects)
+        """
+
+        first_new = len(self)
+        for name in STORE_COLUMNS:
+            self.columns[name].extend(getattr(record, name) for record in records)
+        self.keys.update((record.key(), row) for row, record in enumerate(records, first_new))
+
+    def value(self, row: int, column: int):
+
+        """
+        Method for getting one value of the store
+
+        Parameters:
+        ----------
+        row: int
+            Index of the result in the store
+        column: int
+            Index of the column in HISTORY_COLUMNS
+
+        Returns:
+        -------
+            Value of the cell (float for numeric columns, str for the rest)
+        """
+
+        return self.columns[HISTORY_COLUMNS[column]][row]
+
+    def record(self, row: int) -> ResultRecord:
+        return ResultRecord(**{name: self.columns[name][row] for name in STORE_COLUMNS})
+
+    def records(self) -> list:
+        return [self.record(row) for row in range(len(self))]
+
+    def cached_record(self, key: tuple):
+
+        """
+        Method for finding the result of the already solved problem
+
+        Parameters:
+        ----------
+        key: tuple
+            Target function, interval, accuracy and method of the problem (see ResultRecord.problem_key)
+
+        Returns:
+        -------
+            Last result of the problem (None if it was not solved)
+        """
+
+        row = self.keys.get(key)
+        return None if row is None else self.record(row)
+
+    def sorted_rows(self, rows: list, column: int, descending: bool = False) -> list:
+
+        """
+        Method for ordering the given results by the values of the column (the order of equal values is kept)
+
+        Parameters:
+        ----------
+        rows: list
+            Indices of the results to order
+        column: int
+            Index of the column in HISTORY_COLUMNS
+        descending: bool
+            True for the descending order
+
+        Returns:
+        -------
+            Ordered indices of the results
+        """
+
+        name = HISTORY_COLUMNS[column]
+        if name in NUMERIC_COLUMNS:
+            values = np.frombuffer(self.columns[name], dtype=float)[rows]
+            order = np.argsort(-values if descending else values, kind="stable")
+            return np.asarray(rows)[order].tolist()
+        values = self.columns[name]
+        return sorted(rows, key=values.__getitem__, reverse=descending)
+
+    def filtered_rows(self, column: int, pattern: str) -> list:
+
+        """
+        Method for finding the results whose value of the column contains the pattern (case insensitive)
+
+        Parameters:
+        ----------
+        column: int
+            Index of the column in HISTORY_COLUMNS
+        pattern: str
+            Searched substring, for numeric columns the value must be equal to the number if pattern is a number
+
+        Returns:
+        -------
+            Indices of the found results in the store order
+        """
+
+        name = HISTORY_COLUMNS[column]
+        if not pattern:
+            return list(range(len(self)))
+        if name in NUMERIC_COLUMNS:
+            try:
+                number = float(pattern)
+            except ValueError:
+                return []
+            return np.flatnonzero(np.frombuffer(self.columns[name], dtype=float) == number).tolist()
+        pattern = pattern.lower()
+        return [row for row, value in enumerate(self.columns[name]) if pattern in value.lower()]
@@ -0,0 +1,404 @@
+import numpy as np
+from sympy import Expr
+from dataclasses import dataclass
+from matplotlib.figure import Figure, Axes
+from matplotlib.patches import Rectangle
+from backend.drawer_interface import DrawerInterface
+from typing import List, Callable
+from pure_protobuf.dataclasses_ import field, optional_field
+from backend.frame_selection import FrameSelector, FrameSelectionPolicy
+from backend.figure_pool import FIGURE_POOL
+from backend.animation_writer import RENDER_PRESETS, DEFAULT_RENDER_PRESET
+from backend.vectorized_evaluation import VectorizedEvaluation
+from backend.plane_minimization_drawer import IMAGES_FOLDER, RESULT_FILENAME, RES_POSTFIX, PATH_DELIMITER
+
+# constants for drawing the minimization of functions of several variables
+CONTOUR_POINTS_NUMBER = 200  # points of the grid along every axis for the contour map
+SURFACE_POINTS_NUMBER = 40  # decimated grid of the surface, its polygons are drawn again on every frame
+DRAWN_VARIABLES_NUMBER = 2  # the first two variables are the axes of the picture, the rest are fixed at the optimum
+CONTOUR_LEVELS = 15
+COLOR_MAP = "viridis"
+CONTOUR_COLOR = "white"
+CONTOUR_LINE_WIDTH = 0.5
+SURFACE_ALPHA = 0.6
+PATH_COLOR = "red"  # color of the path through the centers of the uncertainty boxes
+BOX_COLOR = "blue"  # color of the current uncertainty box
+RESULT_COLOR = "black"
+DOT_MARKER = "o"
+RESULT_MARKER = "*"
+FONT_SIZE = "xx-small"
+ITERATION_LABEL_POSITION = (0.02, 0.95)  # position of the iteration number in the axes coordinates
+
+
+@dataclass
+class SpaceMinimizationDrawer(DrawerInterface):
+
+    """
+    Class for drawing the minimization of a function of two or three variables on its contour map (or surface):
+     the function is sampled on the grid once and its layer stays in the figure, on every frame only the current
+     uncertainty box and the path through the centers of the boxes are drawn over it and removed after saving
+
+    Parameters:
+    ----------
+    func: Expr
+        Target function in sympy format to render
+    bounds: List
+        Interval of every variable
+    surface: bool
+        Whether the function is drawn as a 3D surface instead of the contour map
+    variables: tuple
+        Variables of the function ordered by their names (the first two are the axes of the picture)
+    numeric_func: Callable
+        Target function compiled into a function of an array of points
+    slice_point: tuple
+        Values of the variables after the first two, at which the function of three variables is drawn
+    grid: tuple
+        Values of the first two variables and of the function on the grid
+    overlay: List
+        Artists of the current frame
+    images_folder: str
+        Directory where the frames of the animation are saved
+    image_prefix: str
+        Beginning of the names of the frames (to render several animations into one directory at once)
+    render_preset: str
+        Name of the resolution preset of the frames (see RENDER_PRESETS)
+    initial_bounds: List
+        Interval of every variable before the minimization (the borders of the picture)
+    """
+
+    func: Expr = field(1, default="")
+    bounds: List = field(2, default_factory=list)
+    surface: bool = field(3, default=False)
+    variables: tuple = optional_field(4)
+    numeric_func: Callable = optional_field(5)
+    slice_point: tuple = optional_field(6)
+    grid: tuple = optional_field(7)
+    fig: Figure = optional_field(8)
+    axes: Axes = optional_field(9)
+    overlay: List = field(10, default_factory=list)
+    images_folder: str = field(11, default=IMAGES_FOLDER)
+    image_prefix: str = field(12, default=RESULT_FILENAME)
+    render_preset: str = field(13, default=DEFAULT_RENDER_PRESET)
+    initial_bounds: List = field(14, default_factory=list)
+
+    def __post_init__(self):
+        self.variables, self.numeric_func = VectorizedEvaluation.vectorize(self.func)
+        if len(self.variables) < DRAWN_VARIABLES_NUMBER:
+            raise ValueError("Function of one variable is drawn by PlaneMinimizationDrawer")
+        self.initial_bounds = list(self.bounds)
+        self.slice_point = ((self.bounds[0] + self.bounds[1]) / 2,) * (len(self.variables) - DRAWN_VARIABLES_NUMBER)
+        preset = RENDER_PRESETS[self.render_preset]
+        self.fig = FIGURE_POOL.acquire(preset.figure_size, preset.dpi)
+        self.axes = self.fig.add_subplot(projection="3d") if self.surface else self.fig.add_subplot()
+        self.calculate_function_graph()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+
+        """
+        Method for returning the figure of the drawer to the pool of figures, the drawer can not draw after it
+        """
+
+        if self.fig is not None:
+            FIGURE_POOL.release(self.fig)
+            self.fig, self.axes = None, None
+
+    def calculate_function_graph(self):
+
+        """
+        Method for sampling the function on the grid over the box with one vectorized call
+        """
+
+        points_number = SURFACE_POINTS_NUMBER if self.surface else CONTOUR_POINTS_NUMBER
+        axis = np.linspace(self.initial_bounds[0], self.initial_bounds[1], points_number)
+        x_values, y_values = np.meshgrid(axis, axis)
+        points = np.column_stack([x_values.ravel(), y_values.ravel()] +
+                                 [np.full(x_values.size, value) for value in self.slice_point])
+        self.grid = x_values, y_values, np.asarray(self.numeric_func(points)).reshape(x_values.shape)
+
+    def set_slice(self, point: tuple):
+
+        """
+        Method for choosing the values of the variables after the first two (the grid is sampled again only if
+         they are changed)
+
+        Parameters:
+        ----------
+        point: tuple
+            Point of the space whose coordinates after the first two become the slice
+        """
+
+        slice_point = tuple(float(value) for value in point[DRAWN_VARIABLES_NUMBER:])
+        if slice_point != self.slice_point:
+            self.slice_point = slice_point
+            self.calculate_function_graph()
+
+    def evaluate(self, points: np.ndarray) -> np.ndarray:
+
+        """
+        Method for calculating the function at the points of the picture plane (the slice values are added)
+
+        Parameters:
+        ----------
+        points: np.ndarray
+            Values of the first two variables given as rows of the array
+
+        Returns:
+        -------
+            Values of the function at the points
+        """
+
+        points = np.atleast_2d(points)
+        slices = np.tile(np.asarray(self.slice_point, dtype=float), (len(points), 1))
+        return np.asarray(self.numeric_func(np.hstack([points, slices])))
+
+    def render_optimization_image(self):
+
+        """
+        Method for drawing the layer of the picture which is the same on every frame
+        """
+
+        self.axes.cla()
+        self.draw_graph_of_function()
+        self.draw_colored_axes()
+
+    def draw_graph_of_function(self):
+
+        """
+        Method for drawing the function from the sampled grid
+        """
+
+        x_values, y_values, f_values = self.grid
+        if self.surface:
+            self.axes.plot_surface(x_values, y_values, f_values, cmap=COLOR_MAP, alpha=SURFACE_ALPHA, linewidth=0)
+            return
+        self.axes.imshow(f_values, extent=(x_values[0, 0], x_values[0, -1], y_values[0, 0], y_values[-1, 0]),
+                         origin="lower", cmap=COLOR_MAP, aspect="auto")
+        self.axes.contour(x_values, y_values, f_values, CONTOUR_LEVELS, colors=CONTOUR_COLOR,
+                          linewidths=CONTOUR_LINE_WIDTH)
+
+    def draw_colored_axes(self):
+
+        """
+        Method for signing the axes of the picture
+        """
+
+        self.axes.set_xlabel(str(self.variables[0]))
+        self.axes.set_ylabel(str(self.variables[1]))
+        if self.surface:
+            self.axes.set_zlabel("f")
+        title = "f({})".format(", ".join(str(variable) for variable in self.variables))
+        if self.slice_point:
+            title += ", " + ", ".join("{} = {:.4g}".format(variable, value) for variable, value in
+                                      zip(self.variables[DRAWN_VARIABLES_NUMBER:], self.slice_point))
+        self.axes.set_title(title, fontsize=FONT_SIZE)
+
+    def update_bounds(self, bounds: list):
+
+        """
+        Method for changing the current uncertainty box
+
+        Parameters:
+        ----------
+        bounds: list
+            Lower and upper corners of the box
+        """
+
+        self.bounds = bounds
+
+    def draw_point(self, iteration: int = 1, annotation: str = "", point_x: float = 0., point_y: float = 0.):
+
+        """
+        Method for drawing the point of the picture plane as an artist of the current frame
+
+        Parameters:
+        ----------
+        iteration: int
+            Iteration number of the minimization algorithm
+        annotation: str
+            Dot label text
+        point_x: float
+            Value of the first variable
+        point_y: float
+            Value of the second variable
+        """
+
+        if self.surface:
+            point_f = float(self.evaluate(np.array([[point_x, point_y]]))[0])
+            self.overlay.extend(self.axes.plot([point_x], [point_y], [point_f], color=RESULT_COLOR,
+                                               marker=RESULT_MARKER))
+            self.overlay.append(self.axes.text(point_x, point_y, point_f, annotation, fontsize=FONT_SIZE))
+            return
+        self.overlay.extend(self.axes.plot(point_x, point_y, color=RESULT_COLOR, marker=RESULT_MARKER))
+        self.overlay.append(self.axes.annotate(annotation, xy=(point_x, point_y), fontsize=FONT_SIZE))
+
+    def draw_box(self):
+
+        """
+        Method for drawing the current uncertainty box as an artist of the current frame
+        """
+
+        lower, upper = self.bounds[0][:DRAWN_VARIABLES_NUMBER], self.bounds[1][:DRAWN_VARIABLES_NUMBER]
+        if self.surface:
+            corners = np.array([lower, (upper[0], lower[1]), upper, (lower[0], upper[1]), lower])
+            self.overlay.extend(self.axes.plot(corners[:, 0], corners[:, 1], self.evaluate(corners), color=BOX_COLOR))
+            return
+        self.overlay.append(self.axes.add_patch(Rectangle(lower, upper[0] - lower[0], upper[1] - lower[1],
+                                                          fill=False, edgecolor=BOX_COLOR)))
+
+    def draw_path(self, path: list):
+
+        """
+        Method for drawing the path through the centers of the uncertainty boxes as an artist of the current frame
+
+        Parameters:
+        ----------
+        path: list
+            Centers of the boxes of the drawn iterations (points of the picture plane)
+        """
+
+        points = np.asarray(path, dtype=float)
+        if self.surface:
+            self.overlay.extend(self.axes.plot(points[:, 0], points[:, 1], self.evaluate(points), color=PATH_COLOR,
+                                               marker=DOT_MARKER))
+        else:
+            self.overlay.extend(self.axes.plot(points[:, 0], points[:, 1], color=PATH_COLOR, marker=DOT_MARKER))
+
+    def clear_overlay(self):
+        for artist in self.overlay:
+            artist.remove()
+        self.overlay = []
+
+    def get_fig(self):
+        return self.fig
+
+    def draw_minimization(self, x_optimum: tuple = (), f_x_optimum: float = 0., borders: dict = {},
+                          frame_policy: FrameSelectionPolicy = FrameSelectionPolicy.ALL,
+                          max_frames: int = None) -> list:
+
+        """
+        Method for drawing the whole minimization process, the layer of the function is drawn only once
+
+        Parameters:
+        ----------
+        x_optimum: tuple
+            Point at which the minimum of the function was found
+        f_x_optimum: float
+            Value of the function at the point at which the minimum of the function was found
+        borders: dict
+            Dictionary with all uncertainty boxes (lower and upper corners) numbered by the iteration index
+        frame_policy: FrameSelectionPolicy
+            Rule for choosing the iterations which become frames of the animation
+        max_frames: int
+            Upper limit of the number of iteration frames (without limit if None)
+
+        Returns:
+        -------
+            List of paths to images for gif creation
+        """
+
+        self.set_slice(x_optimum)
+        self.render_optimization_image()
+        frames = FrameSelector.select_frames(borders, frame_policy, max_frames, self.pixel_size())
+        images_for_gif, path = [], []
+        for iter_num in frames:
+            self.update_bounds(borders[iter_num])
+            path.append((np.asarray(self.bounds[0][:DRAWN_VARIABLES_NUMBER]) +
+                         np.asarray(self.bounds[1][:DRAWN_VARIABLES_NUMBER])) / 2)
+            images_for_gif.append(self.draw_current_iteration(iter_num, path))
+        images_for_gif.append(self.draw_result_image(len(borders.keys()), x_optimum, f_x_optimum, path))
+        return images_for_gif
+
+    def pixel_size(self) -> float:
+
+        """
+        Method for estimating the width of one pixel of the picture in the units of the variables
+
+        Returns:
+        -------
+            Width of one pixel along the first axis
+        """
+
+        axes_width = self.axes.get_position().width * self.fig.get_figwidth() * self.fig.dpi  # in pixels
+        return (self.initial_bounds[1] - self.initial_bounds[0]) / axes_width
+
+    def draw_current_iteration(self, iter_num: int = 0, path: list = ()) -> str:
+
+        """
+        Method for drawing the current iteration over the layer of the function
+
+        Parameters:
+        ----------
+        iter_num: int
+            Number of current iteration
+        path: list
+            Centers of the boxes of the drawn iterations
+
+        Returns:
+        -------
+            Path to result image
+        """
+
+        self.draw_box()
+        self.draw_path(path)
+        add_text = self.axes.text2D if self.surface else self.axes.text  # label is placed in the axes coordinates
+        self.overlay.append(add_text(*ITERATION_LABEL_POSITION, "iter #{}".format(iter_num),
+                                     transform=self.axes.transAxes, fontsize=FONT_SIZE))
+        image_path = self.save_iteration_img(iter_num)
+        self.clear_overlay()
+        return image_path
+
+    def draw_result_image(self, iter_num: int = 1, result_x: tuple = (), result_y: float = 0.,
+                          path: list = ()) -> str:
+
+        """
+        Method for drawing the found point of minimum over the layer of the function
+
+        Parameters:
+        ----------
+        iter_num: int
+            Iteration number at which the minimization result was found
+        result_x: tuple
+            Point of the minimum
+        result_y: float
+            Value of the function at the point of the minimum
+        path: list
+            Centers of the boxes of the drawn iterations
+
+        Returns:
+        -------
+            Path to result image
+        """
+
+        if len(path):
+            self.draw_path(path)
+        self.draw_point(iter_num, "minimum {:.4g} on iteration #{}".format(result_y, iter_num), result_x[0],
+                        result_x[1])
+        image_path = self.save_iteration_img(iter_num)
+        self.clear_overlay()
+        return image_path
+
+    def save_iteration_img(self, iter_num: int = 0) -> str:
+
+        """
+        Method for saving the current frame of the animation
+
+        Parameters:
+        ----------
+        iter_num: int
+            Number of iteration
+
+        Returns:
+        -------
+            Path to current saved image
+        """
+
+        image_name = "iter_{}".format(iter_num)
+        full_path = self.images_folder + PATH_DELIMITER + self.image_prefix + image_name + RES_POSTFIX
+        self.fig.savefig(full_path, dpi=RENDER_PRESETS[self.render_preset].dpi)
+        return full_path
@@ -0,0 +1,80 @@
+import time
+from contextlib import contextmanager
+
+MILLISECONDS_IN_SECOND = 1000
+PHASE_REPORT_LINE = "{:<52}{:>10.1f} ms"
+REPORT_TITLE = "Startup profile:"
+TOTAL_PHASE_NAME = "time to the last phase"
+
+
+class StartupProfile:
+
+    """
+    Class collecting the durations of the phases of the application start (imports, initialization of the window,
+     background warm-up) for the report printed by the "--startup-profile" flag
+
+    Parameters:
+    ----------
+    start_time: float
+        Moment of the profile creation (the beginning of the start)
+    phases: list
+        Names and durations of the finished phases in seconds
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.end_time = self.start_time
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name: str):
+
+        """
+        Method for measuring the phase of the start executed inside the "with" block
+
+        Parameters:
+        ----------
+        name: str
+            Name of the phase in the report
+        """
+
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.end_time = time.perf_counter()
+            self.phases.append((name, self.end_time - phase_start))
+
+    def mark(self, name: str):
+
+        """
+        Method for adding the moment of the event (for example, showing of the window) measured from the start
+
+        Parameters:
+        ----------
+        name: str
+            Name of the event in the report
+        """
+
+        self.end_time = time.perf_counter()
+        self.phases.append((name, self.end_time - self.start_time))
+
+    def report(self) -> str:
+
+        """
+        Method for making the report with the durations of all phases in milliseconds
+
+        Returns:
+        -------
+            Text of the report
+        """
+
+        lines = [REPORT_TITLE]
+        lines.extend(PHASE_REPORT_LINE.format(name, duration * MILLISECONDS_IN_SECOND)
+                     for name, duration in self.phases)
+        lines.append(PHASE_REPORT_LINE.format(TOTAL_PHASE_NAME, (self.end_time - self.start_time) *
+                                              MILLISECONDS_IN_SECOND))
+        return "\n".join(lines)
+
+
+STARTUP_PROFILE = StartupProfile()  # profile of the current application start
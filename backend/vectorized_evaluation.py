@@ -0,0 +1,221 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from multiprocessing import get_context
+from typing import Callable
+import numpy as np
+from backend.expression_compiler import ExpressionCompiler
+from backend.objective import Objective
+
+VECTORIZED_FUNCTIONS_CACHE_SIZE = 128  # number of last target functions kept compiled for the vectorized methods
+SPAWN_CONTEXT = "spawn"  # processes are spawned, because forking the process with running Qt threads is not safe
+
+
+def evaluate_points(func, points: np.ndarray) -> np.ndarray:
+
+    """
+    Function calculating the target function at the points in a process of the pool (the compiled function
+     cannot be sent to another process, so the expression is compiled there once)
+
+    Parameters:
+    ----------
+    func: sympy.Expr
+        Target function
+    points: np.ndarray
+        Points given as rows of the array
+
+    Returns:
+    -------
+        Values of the function
+    """
+
+    return np.array(VectorizedEvaluation.vectorize(func)[1](points))
+
+
+class CountedFunction:
+
+    """
+    Class of the vectorized function counting the points at which it was calculated
+
+    Parameters:
+    ----------
+    numeric_func: Callable
+        Function of the array of points
+    evaluations: int
+        Number of the calculated points
+    """
+
+    def __init__(self, numeric_func: Callable):
+        self.numeric_func = numeric_func
+        self.evaluations = 0
+
+    def __call__(self, points: np.ndarray) -> np.ndarray:
+        self.evaluations += len(points)
+        return self.numeric_func(points)
+
+    def at(self, point: np.ndarray):
+        return self(point[np.newaxis, :])[0]
+
+
+class VectorizedObjective:
+
+    """
+    Class of the target function compiled beforehand into the functions of the array of points: it is passed to
+     the multivariate methods instead of the sympy expression (for example, the merit functions of the constrained
+     methods, which are made of the objective and the constraints compiled together)
+
+    Parameters:
+    ----------
+    variables: tuple
+        Variables of the function ordered by their names
+    numeric_func: Callable
+        Function calculating the values at the points given as rows of the array
+    numeric_gradient: Callable
+        Function calculating the gradients at the points given as rows of the array
+    """
+
+    def __init__(self, variables: tuple, numeric_func: Callable, numeric_gradient: Callable = None):
+        self.variables = variables
+        self.numeric_func = numeric_func
+        self.numeric_gradient = numeric_gradient
+
+    @property
+    def free_symbols(self) -> set:
+        return set(self.variables)
+
+
+class VectorizedEvaluation:
+
+    """
+    Class uniting the static methods evaluating the target functions at many points at once, they are shared by
+     the one-dimensional, multivariate and global methods
+    """
+
+    @staticmethod
+    def vectorize(func) -> tuple:
+
+        """
+        Method for compiling the target function into the function of the array of points (the results are cached,
+         the functions compiled beforehand are returned as they are)
+
+        Parameters:
+        ----------
+        func: sympy.Expr, VectorizedObjective or Objective
+            Target function of finding the minimum
+
+        Returns:
+        -------
+            Variables of the function ordered by their names (in the order of the objective) and the function
+             calculating the values at the points given as rows of the array
+        """
+
+        if isinstance(func, (VectorizedObjective, Objective)):
+            return func.variables, func.numeric_func
+        return VectorizedEvaluation.compile_function(func)
+
+    @staticmethod
+    @lru_cache(maxsize=VECTORIZED_FUNCTIONS_CACHE_SIZE)
+    def compile_function(func) -> tuple:
+
+        """
+        Method for compiling the sympy expression into the function of the array of points (the results are cached)
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+
+        Returns:
+        -------
+            Variables of the function ordered by their names and the function calculating the values at the points
+             given as rows of the array
+        """
+
+        variables = tuple(sorted(func.free_symbols, key=str))
+        compiled = ExpressionCompiler.lambdify(variables, func)
+
+        def numeric_func(points: np.ndarray) -> np.ndarray:
+            # constant parts of the function are calculated as scalars, so the result is broadcast to all points
+            return np.broadcast_to(np.asarray(compiled(*points.T), dtype=float), (len(points),))
+
+        return variables, numeric_func
+
+    @staticmethod
+    def gradient(func) -> Callable:
+
+        """
+        Method for getting the gradient of the target function as the function of the array of points
+
+        Parameters:
+        ----------
+        func: sympy.Expr, VectorizedObjective or Objective
+            Target function of finding the minimum
+
+        Returns:
+        -------
+            Function calculating the gradients at the points given as rows of the array (one gradient in a row)
+        """
+
+        if isinstance(func, (VectorizedObjective, Objective)):
+            return func.numeric_gradient
+        return VectorizedEvaluation.compile_gradient(func)
+
+    @staticmethod
+    @lru_cache(maxsize=VECTORIZED_FUNCTIONS_CACHE_SIZE)
+    def compile_gradient(func) -> Callable:
+
+        """
+        Method for deriving the gradient of the sympy expression symbolically and compiling it into the function
+         of the array of points (the results are cached)
+
+        Parameters:
+        ----------
+        func: sympy.Expr
+            Target function of finding the minimum
+
+        Returns:
+        -------
+            Function calculating the gradients at the points given as rows of the array (one gradient in a row)
+        """
+
+        variables = tuple(sorted(func.free_symbols, key=str))
+        # the derivatives share most of their factors, they are calculated once for all components
+        compiled = ExpressionCompiler.lambdify(variables, [func.diff(variable) for variable in variables])
+
+        def numeric_gradient(points: np.ndarray) -> np.ndarray:
+            return np.column_stack([np.broadcast_to(np.asarray(derivative, dtype=float), (len(points),))
+                                    for derivative in compiled(*points.T)])
+
+        return numeric_gradient
+
+    @staticmethod
+    @contextmanager
+    def population_evaluator(func, numeric_func, workers: int = 0):
+
+        """
+        Method for making the function evaluating the population in this process or in the pool of processes
+
+        Parameters:
+        ----------
+        func: sympy.Expr or Objective
+            Target function
+        numeric_func: Callable
+            Vectorized target function
+        workers: int
+            Number of processes among which every population is split (evaluated in this process if 0, the objectives
+             cannot be sent to other processes, they are evaluated by their own threads)
+
+        Returns:
+        -------
+            Function of the array of points counting the evaluations
+        """
+
+        if not workers or isinstance(func, (VectorizedObjective, Objective)):
+            yield CountedFunction(numeric_func)
+            return
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context(SPAWN_CONTEXT)) as executor:
+            def pool_func(points: np.ndarray) -> np.ndarray:
+                chunks = np.array_split(points, min(workers, len(points)))
+                return np.concatenate(list(executor.map(evaluate_points, [func] * len(chunks), chunks)))
+
+            yield CountedFunction(pool_func)
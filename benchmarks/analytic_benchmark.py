@@ -0,0 +1,34 @@
+import sys
+import timeit
+from sympy.parsing import parse_expr
+from backend.analytic_minimization import AnalyticMinimization
+from backend.one_dimension_minimization import ONE_DIM_MINIMIZATION_METHODS
+from backend.multi_dimension_minimization import METRICS_INDEX
+
+ACCURACY = 1e-6
+REPEATS = 20  # the best of the repeats is reported
+PROBLEMS = [("x**2", [-2, 2]), ("sin(x)", [3, 5]), ("Abs(x)", [0, 1]), ("x**4 - 3*x**2 + x", [-2, 2]),
+            ("(x - 1)**6", [-3, 4]), ("exp(x) - 4*x", [0, 3]), ("x*log(x)", [0.1, 1])]  # test functions and others
+REPORT_HEADER = "{:<22}{:<24}{:>12}{:>14}{:>10}".format("function", "method", "iterative us", "analytic us", "solved")
+REPORT_LINE = "{:<22}{:<24}{:>12.1f}{:>14.1f}{:>10}"
+
+
+def best_time(method, func, interval: list) -> float:
+    return min(timeit.repeat(lambda: method(func, interval, ACCURACY), number=1, repeat=REPEATS)) * 1e6
+
+
+def main() -> int:
+    print(REPORT_HEADER)
+    for text, interval in PROBLEMS:
+        func = parse_expr(text)
+        for name, method in ONE_DIM_MINIMIZATION_METHODS.items():
+            analytic_method = AnalyticMinimization.analytic_first(method)
+            results = analytic_method(func, interval, ACCURACY)  # the critical points are found and cached
+            solved = len(results) > METRICS_INDEX and results[METRICS_INDEX].get("analytic", False)
+            print(REPORT_LINE.format(text, name, best_time(method, func, interval),
+                                     best_time(analytic_method, func, interval), str(solved)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
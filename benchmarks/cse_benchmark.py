@@ -0,0 +1,94 @@
+import argparse
+import sys
+import timeit
+import numpy as np
+from sympy import lambdify, count_ops, cse, Derivative
+from sympy.parsing import parse_expr
+from backend.expression_compiler import ExpressionCompiler
+
+POINTS_NUMBER = 10 ** 5  # points of the array evaluated by one call
+REPEATS = 7  # the best of the repeats is reported, it is the least disturbed by the other processes
+TEST_FUNCTIONS = ["x**2", "sin(x)", "Abs(x)", "(x - 1)**2 + (y + 0.5)**2 + x*y/2", "(1 - x)**2 + 10*(y - x**2)**2",
+                  "20 + x**2 - 10*cos(2*pi*x) + y**2 - 10*cos(2*pi*y) + z**2"]  # functions of the tests
+LARGE_FUNCTIONS = ["exp(-x**2)*sin(x) + exp(-x**2)*cos(x)",
+                   " + ".join("exp(-(x - {0}/4)**2 - y**2)*sin({0}*x)*cos({0}*y)".format(k) for k in range(1, 9)),
+                   " + ".join("sqrt(x**2 + y**2 + z**2 + 1)**{0}/(1 + exp(-x*y*z))".format(k) for k in range(1, 9)),
+                   "log(1 + exp(-(x*y + y*z + x*z)))**2 + sin(x*y + y*z + x*z)*exp(-(x*y + y*z + x*z))",
+                   " + ".join("({0}*x - y)**2*exp(-({0}*x - y)**2)".format(k) for k in range(1, 13))]  # corpus
+REPORT_HEADER = "{:<48}{:>8}{:>8}{:>12}{:>12}{:>9}".format("expression", "ops", "cse ops", "naive ms", "cse ms",
+                                                              "speedup")
+REPORT_LINE = "{:<48}{:>8}{:>8}{:>12.3f}{:>12.3f}{:>9.2f}"
+
+
+def cse_operations(expressions: list) -> int:
+    replacements, reduced = cse(expressions)
+    return count_ops([subexpression for _, subexpression in replacements] + reduced)
+
+
+def best_time(numeric_func, arguments: list) -> float:
+    return min(timeit.repeat(lambda: numeric_func(*arguments), number=1, repeat=REPEATS)) * 1000
+
+
+def measure(text: str, gradient: bool, simplify: bool) -> tuple:
+
+    """
+    Function measuring the evaluation of the expression compiled naively and after the preprocessing
+
+    Parameters:
+    ----------
+    text: str
+        Target function
+    gradient: bool
+        Whether the gradient of the function is evaluated instead of the function
+    simplify: bool
+        Whether the function is simplified before the elimination of the common subexpressions
+
+    Returns:
+    -------
+        Number of operations before and after the preprocessing, milliseconds of one call of the naive and the
+         preprocessed functions (None if the gradient of the function has no numeric form)
+    """
+
+    expr = parse_expr(text)
+    variables = tuple(sorted(expr.free_symbols, key=str))
+    prepared = ExpressionCompiler.simplify(expr) if simplify else expr
+    expressions = [expr.diff(variable) for variable in variables] if gradient else [expr]
+    prepared_expressions = [prepared.diff(variable) for variable in variables] if gradient else [prepared]
+    if any(expression.has(Derivative) for expression in expressions + prepared_expressions):
+        return None  # for example, the derivative of Abs(x) is not calculated by sympy
+
+    naive = lambdify(variables, expressions, "numpy")
+    optimized = ExpressionCompiler.lambdify(variables, prepared_expressions)
+    arguments = list(np.random.default_rng(0).uniform(-2, 2, (len(variables), POINTS_NUMBER)))
+    for naive_values, optimized_values in zip(naive(*arguments), optimized(*arguments)):
+        assert np.allclose(naive_values, optimized_values, equal_nan=True)
+    return count_ops(expressions), cse_operations(prepared_expressions), best_time(naive, arguments), \
+        best_time(optimized, arguments)
+
+
+def main(arguments: list) -> int:
+    parser = argparse.ArgumentParser(description="Evaluation cost of the target functions and their gradients "
+                                                 "with and without the elimination of the common subexpressions")
+    parser.add_argument("--simplify", action="store_true", help="simplify the functions before the elimination")
+    options = parser.parse_args(arguments[1:])
+
+    for title, functions in [("test functions", TEST_FUNCTIONS), ("large expressions", LARGE_FUNCTIONS)]:
+        for gradient in [False, True]:
+            print("\n{}, {} ({} points)".format(title, "gradient" if gradient else "value", POINTS_NUMBER))
+            print(REPORT_HEADER)
+            total_naive, total_optimized = 0., 0.
+            for text in functions:
+                measures = measure(text, gradient, options.simplify)
+                if measures is None:
+                    continue
+                operations, cse_ops, naive_time, optimized_time = measures
+                total_naive, total_optimized = total_naive + naive_time, total_optimized + optimized_time
+                name = text if len(text) <= 45 else text[:42] + "..."
+                print(REPORT_LINE.format(name, operations, cse_ops, naive_time, optimized_time,
+                                         naive_time / optimized_time))
+            print(REPORT_LINE.format("total", "", "", total_naive, total_optimized, total_naive / total_optimized))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
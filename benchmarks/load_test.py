@@ -0,0 +1,133 @@
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle, islice
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+import numpy as np
+
+DEFAULT_URL = "http://127.0.0.1:8000"
+DEFAULT_REQUESTS = 500
+DEFAULT_CONCURRENCY = 16
+LATENCY_PERCENTILES = [50, 90, 95, 99]
+DISTINCT_EPS_STEP = 1e-9  # accuracy of every request differs by it, so the results cache of the service is bypassed
+REQUEST_TIMEOUT = 60  # seconds
+LOAD_PROBLEMS = [{"function": "sin(x)", "interval": [3, 5], "eps": 1e-4, "method": "Golden Ratio Method"},
+                 {"function": "x**4 - 3*x**2 + x", "interval": [-2, 2], "eps": 1e-4, "method": "Fibonacci Method"},
+                 {"function": "(x - 1)**2 + (y + 0.5)**2 + x*y/2", "interval": [-2, 2], "eps": 1e-5,
+                  "method": "BFGS Method"},
+                 {"function": "(1 - x)**2 + 10*(y - x**2)**2", "interval": [-2, 2], "eps": 1e-4,
+                  "method": "Nelder-Mead Method"},
+                 {"function": "x**2 + y**2", "interval": [-2, 2], "eps": 1e-4, "method": "Augmented Lagrangian Method",
+                  "constraints": "x + y >= 1"}]  # mix of the problems sent to the service
+
+
+def send_request(url: str, body: dict) -> tuple:
+
+    """
+    Function sending one request to the service
+
+    Parameters:
+    ----------
+    url: str
+        Address of the endpoint
+    body: dict
+        Body of the request
+
+    Returns:
+    -------
+        Latency in seconds and HTTP status of the answer
+    """
+
+    request = Request(url, json.dumps(body).encode(), {"Content-Type": "application/json"})
+    start = time.perf_counter()
+    try:
+        with urlopen(request, timeout=REQUEST_TIMEOUT) as answer:
+            answer.read()
+            status = answer.status
+    except HTTPError as error:
+        status = error.code
+    return time.perf_counter() - start, status
+
+
+def make_bodies(endpoint: str, requests_number: int, distinct: bool, batch_size: int) -> list:
+    problems = [dict(problem) for problem in islice(cycle(LOAD_PROBLEMS), requests_number * batch_size)]
+    if distinct:
+        for index, problem in enumerate(problems):
+            problem["eps"] += index * DISTINCT_EPS_STEP
+    if endpoint == "batch":
+        return [{"problems": problems[index: index + batch_size]} for index in range(0, len(problems), batch_size)]
+    return problems
+
+
+def run_load(url: str, endpoint: str, requests_number: int, concurrency: int, distinct: bool,
+             batch_size: int) -> dict:
+
+    """
+    Function sending the requests to the service from several threads at once
+
+    Parameters:
+    ----------
+    url: str
+        Address of the service
+    endpoint: str
+        Endpoint of the requests (solve, batch or render)
+    requests_number: int
+        Number of the requests
+    concurrency: int
+        Number of the requests sent at once
+    distinct: bool
+        Whether all problems differ (otherwise the repeated problems are answered from the results cache)
+    batch_size: int
+        Number of the problems of one request of the batch endpoint
+
+    Returns:
+    -------
+        Throughput, latencies and statuses of the answers
+    """
+
+    bodies = make_bodies(endpoint, requests_number, distinct, batch_size)
+    address = url.rstrip("/") + "/" + endpoint
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        answers = list(executor.map(lambda body: send_request(address, body), bodies))
+    duration = time.perf_counter() - start
+
+    latencies = np.array([latency for latency, _ in answers]) * 1000
+    statuses = {}
+    for _, status in answers:
+        statuses[status] = statuses.get(status, 0) + 1
+    report = {"requests": len(bodies), "duration_s": duration, "throughput_rps": len(bodies) / duration,
+              "latency_mean_ms": float(latencies.mean()), "latency_max_ms": float(latencies.max()),
+              "statuses": statuses}
+    report.update({"latency_p{}_ms".format(percentile): float(np.percentile(latencies, percentile))
+                   for percentile in LATENCY_PERCENTILES})
+    return report
+
+
+def main(arguments: list) -> int:
+    parser = argparse.ArgumentParser(description="Load test of the minimization service started by "
+                                                 "\"python -m main --serve PORT\"")
+    parser.add_argument("--url", default=DEFAULT_URL, help="address of the running service")
+    parser.add_argument("--endpoint", choices=["solve", "batch", "render"], default="solve")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="number of the requests")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="requests sent at once")
+    parser.add_argument("--batch-size", type=int, default=len(LOAD_PROBLEMS), help="problems of one batch request")
+    parser.add_argument("--distinct", action="store_true", help="make every problem unique to bypass the cache")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    options = parser.parse_args(arguments[1:])
+
+    report = run_load(options.url, options.endpoint, options.requests, options.concurrency, options.distinct,
+                      options.batch_size if options.endpoint == "batch" else 1)
+    if options.json:
+        print(json.dumps(report))
+    else:
+        for name, value in report.items():
+            print("{:<20}{}".format(name, "{:.2f}".format(value) if isinstance(value, float) else value))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,83 @@
+import numpy as np
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem, QLabel, QAbstractItemView, \
+    QHeaderView
+from matplotlib.figure import Figure
+from front.plot_canvas import MplCanvas
+from backend.method_comparison import ComparisonReport
+
+COMPARISON_WINDOW_TITLE = "Comparison of minimization methods"
+COMPARISON_COLUMNS = ["Method", "Result", "Iterations", "Evaluations", "Wall time, ms", "Error"]
+COMPUTATIONS_TEXT = "Function was computed {} times for {} evaluations requested by all methods"
+MILLISECONDS_IN_SECOND = 1000
+INTERVAL_ALPHA = 0.15  # transparency of the uncertainty interval of the method on the plot
+REFERENCE_LINE_STYLE = ":"
+REFERENCE_COLOR = "black"
+COMPARISON_WINDOW_SIZE = (800, 700)
+
+
+class ComparisonDialog(QDialog):
+
+    """
+    Window with the measurements of all minimization methods on one problem and their trajectories on one plot
+    """
+
+    def __init__(self, report: ComparisonReport, parent=None):
+        QDialog.__init__(self, parent)
+        self.setWindowTitle(COMPARISON_WINDOW_TITLE)
+        self.resize(*COMPARISON_WINDOW_SIZE)
+        self.report = report
+        layout = QVBoxLayout(self)
+
+        self.metrics_table = QTableWidget(len(report.methods), len(COMPARISON_COLUMNS), self)
+        self.metrics_table.setHorizontalHeaderLabels(COMPARISON_COLUMNS)
+        self.metrics_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.metrics_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.fill_metrics_table()
+        layout.addWidget(self.metrics_table)
+
+        requested = sum(method_report.evaluations for method_report in report.methods)
+        self.computations_label = QLabel(COMPUTATIONS_TEXT.format(report.computations, requested), self)
+        layout.addWidget(self.computations_label)
+
+        self.canvas = MplCanvas(Figure(), self)
+        self.draw_trajectories()
+        layout.addWidget(self.canvas)
+
+    def fill_metrics_table(self):
+
+        """
+        Method for filling the table with one row for every method
+        """
+
+        for row, method_report in enumerate(self.report.methods):
+            if method_report.error_msg:
+                values = [method_report.method, method_report.error_msg] + [""] * (len(COMPARISON_COLUMNS) - 2)
+            else:
+                values = [method_report.method, "{:.8g}".format(method_report.x_opt), str(method_report.iterations),
+                          str(method_report.evaluations),
+                          "{:.3f}".format(method_report.wall_time * MILLISECONDS_IN_SECOND),
+                          "{:.3g}".format(method_report.error)]
+            for column, value in enumerate(values):
+                self.metrics_table.setItem(row, column, QTableWidgetItem(value))
+
+    def draw_trajectories(self):
+
+        """
+        Method for drawing the uncertainty intervals of all methods by the iterations on one plot
+        """
+
+        axes = self.canvas.fig.add_subplot()
+        for method_report in self.report.methods:
+            if method_report.error_msg:
+                continue
+            iterations = sorted(method_report.borders.keys())
+            bounds = np.array([method_report.borders[iteration] for iteration in iterations], dtype=float)
+            middle, = axes.plot(iterations, bounds.mean(axis=1), label=method_report.method)
+            axes.fill_between(iterations, bounds[:, 0], bounds[:, 1], color=middle.get_color(), alpha=INTERVAL_ALPHA)
+        axes.axhline(self.report.reference_x, color=REFERENCE_COLOR, linestyle=REFERENCE_LINE_STYLE,
+                     label="reference minimum")
+        axes.set_xlabel("iteration")
+        axes.set_ylabel("uncertainty interval")
+        axes.grid()
+        axes.legend(loc="upper right")
+        self.canvas.draw()
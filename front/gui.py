@@ -1,13 +1,30 @@
-from PyQt5.QtWidgets import QMainWindow, QTableWidgetItem, QMessageBox, QStyleFactory
-from PyQt5.QtGui import QMovie, QIcon, QPixmap
+from PyQt5.QtWidgets import QMainWindow, QMessageBox, QStyleFactory, QDialog, QFileDialog
+from PyQt5.QtGui import QIcon, QPixmap, QMovie
+from PyQt5.QtCore import pyqtSignal, QSize, Qt, QTimer
 from PyQt5 import QtWidgets
 from front.optimization_methods_gui import Ui_MainWindow
-from backend.one_dimension_minimization import OneDimMinimization, EMPTY_STR
-from backend.plane_minimization_drawer import PlaneMinimizationDrawer, IMAGES_FOLDER
-from backend.gif_maker import GifMaker
+from front.minimization_worker import MinimizationJob, MinimizationJobQueue, SweepRunner
+from front.sweep_dialog import SweepDialog
+from front.results_table_model import ResultsTableModel, TABLE_COLUMNS, NO_SORT_COLUMN
+from backend.one_dimension_minimization import OneDimMinimization, ONE_DIM_MINIMIZATION_METHODS, EMPTY_STR
+from backend.bracketing import Bracketing
+from backend.analytic_minimization import AnalyticMinimization
+from backend.multi_dimension_minimization import MultiDimMinimization, MULTI_DIM_MINIMIZATION_METHODS, METRICS_INDEX
+from backend.global_minimization import GLOBAL_MINIMIZATION_METHODS
+from backend.constrained_minimization import CONSTRAINED_MINIMIZATION_METHODS
+from backend.frame_selection import FrameSelectionPolicy
 from backend.error_message import ErrorMessage
-from sympy.parsing import parse_expr
+from backend.results_history import ResultRecord
+from backend.history_io import HistoryIO, HISTORY_FILE_FILTER
+from backend.expression_compiler import ExpressionCompiler
+from backend.method_comparison import MethodComparison
+from backend.startup_profile import STARTUP_PROFILE
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Thread
+import importlib
 import logging
+import os
 import datetime
 
 
@@ -16,23 +33,61 @@ LEFT_BORDER_DEFAULT = 0.
 RIGHT_BORDER_DEFAULT = 1.
 EPSILON_DEFAULT = 1e-6
 FUNCTION_DIMENSIONS = [1, 2, 3]  # dimensions of spaces in which the optimization problem can be solved
-ONE_DIM_MINIMIZATION_METHODS_NAMES = {"Golden Ratio Method": OneDimMinimization.golden_ratio_method,
-                                      "Dichotomy Method": OneDimMinimization.dichotomy_method,
-                                      "Bisection Method": OneDimMinimization.bisection_method,
-                                      "Fibonacci Method": OneDimMinimization.fibonacci_method}
-TABLE_COLUMNS = ["Target Function", "Interval", "Accuracy", "Result"]  # column names in the results table
-INIT_ROWS_NUMBER = 1  # before starting work with minimization, the table must have one empty string
-FIRST_COLUMN_INDEX = 0
+RESULT_COLUMN_INDEX = 3  # column of the results table which is resized to its contents
+FILTER_PLACEHOLDER_TEXT = "Filter results"
+ANIMATION_FRAME_POLICY = FrameSelectionPolicy.PIXEL_CHANGE  # iterations invisible on the graph are not drawn
+ANIMATION_MAX_FRAMES = 30  # upper limit of frames in the result gif regardless of the iterations number
 
 DEFAULT_STYLESHEET_COLOR = "color:red;"
-PAUSE_BTN_PLAY_TEXT = "continue gif"
-PAUSE_BTN_PAUSE_TEXT = "pause gif"
-PAUSE_BTN_INIT_TEXT = "No gif available"
+PAUSE_BTN_PLAY_TEXT = "continue animation"
+PAUSE_BTN_PAUSE_TEXT = "pause animation"
+PAUSE_BTN_INIT_TEXT = "No animation available"
+ZOOM_CHECK_BOX_TEXT = "Follow the uncertainty interval"
+EXPORT_CHECK_BOX_TEXT = "Export gif in background"
+SURFACE_CHECK_BOX_TEXT = "Draw surface"
+DRAWN_VARIABLES_NUMBER = 2  # functions of several variables are drawn on the plane of their first two variables
+GIF_EXPORTED_MESSAGE = "Animation of minimization was saved to {}"
+EXPORT_WORKERS_NUMBER = 1  # gif files are exported one by one, so they do not overwrite each other
+ANIMATION_OPTIONS_ROW = 4  # row of the rendering layout under the pause button
 LOGGER_NAME = "application_log.log"  # name for the application logger to collect error information
 WINDOW_STYLE_NAME = 'Fusion'
 
 LABEL_INIT_PIXMAP = "front/ui_src/your_advert.png"
 LOADING_GIF = "front/ui_src/loading.gif"
+LOADING_GIF_SIZE = QSize(20, 20)  # size of the spinner in the status bar
+CANCEL_BTN_TEXT = "Cancel"
+JOB_QUEUED_MESSAGE = "Problem is queued, problems before it: {}"
+JOB_CANCELLED_MESSAGE = "Minimization was cancelled"
+VALIDATION_DELAY = 300  # milliseconds without typing after which the target function is parsed in background
+FUNCTION_ERROR_ROW = 4  # row of the problem input layout under the accuracy field
+SWEEP_BTN_TEXT = "Sweep"
+CANCEL_SWEEP_BTN_TEXT = "Cancel sweep"
+SWEEP_CANCELLED_MESSAGE = "Sweep was cancelled"
+SWEEP_PROGRESS_MESSAGE = "Sweep: {} of {} problems solved"
+SWEEP_FLUSH_INTERVAL = 200  # milliseconds between adding the collected sweep results to the table
+SWEEP_RESULT_NAME = "sweep_gif_{}"  # name of the animation of the sweep problem by its number
+COMPARE_BTN_TEXT = "Compare methods"
+METRICS_MESSAGE = "Solved in {iterations} iterations with {evaluations} function and {gradient_evaluations} " \
+                  "gradient evaluations"
+SWEEP_CACHED_MESSAGE = "Sweep: {} of {} problems were taken from the results history"
+EXPORT_HISTORY_BTN_TEXT = "Export results"
+IMPORT_HISTORY_BTN_TEXT = "Import results"
+HISTORY_EXPORTED_MESSAGE = "{} results were saved to {}"
+HISTORY_IMPORTED_MESSAGE = "{} results were loaded from {}"
+CONSTRAINTS_PLACEHOLDER_TEXT = "Constraints, for example: x + y >= 1; x**2 + y**2 <= 4"
+CONSTRAINTS_ROW = 5  # row of the problem input layout under the errors of the target function
+CONSTRAINED_FUNCTION_CELL = "{} subject to {}"  # target function with the constraints in the results table
+VIOLATION_MESSAGE = ", the largest violation of the constraints is {max_violation:.2e}"
+BRACKET_CHECK_BOX_TEXT = "Search for the minimum outside the interval"
+BRACKET_ROW = 6  # row of the problem input layout under the constraints
+ANALYTIC_CHECK_BOX_TEXT = "Solve exactly when possible"
+ANALYTIC_ROW = 7  # row of the problem input layout under the bracket search
+ANALYTIC_MESSAGE = "Solved analytically: {critical_points} critical points were compared with the ends of the interval"
+BRACKETING_MESSAGE = "Solved in {iterations} iterations in the bracket [{bracket[0]:.6g}, {bracket[1]:.6g}] found " \
+                     "by {bracketing_evaluations} function evaluations"
+# modules of the solver and rendering stacks, which are imported in background after the window is shown
+WARM_UP_MODULES = ["sympy", "front.plot_canvas", "backend.plane_minimization_drawer", "backend.gif_maker",
+                   "front.comparison_dialog", "backend.space_minimization_drawer"]
 
 STANDARD_ERROR_MSG = "Error in the formulation of the minimization problem"
 ERROR_MSG_TITLE = "Critical error"
@@ -43,33 +98,98 @@ class AppWindow(QMainWindow, Ui_MainWindow):
 
     """
     Main class of minimization gui application
+
+    Parameters:
+    ----------
+    export_folder: str
+        Folder of the frames and the exported animations (IMAGES_FOLDER of the drawers if None)
     """
 
+    export_folder = None
+    gif_exported = pyqtSignal(str)  # emitted from the export thread with the path of the saved animation
+    # emitted from the validation thread with the checked text, dimension, compiled function and error message
+    expression_checked = pyqtSignal(str, int, object, str)
+    comparison_done = pyqtSignal(object)  # emitted from the comparison thread with the report
+    warm_up_finished = pyqtSignal()  # emitted from the warm-up thread when the heavy modules are imported
+
     def __init__(self, parent=0, *args, **kwargs):
         QMainWindow.__init__(self)
-        self.setupUi(self)
-        self.setStyle(QStyleFactory.create(WINDOW_STYLE_NAME))
-        self.minimization_movie = QMovie()  # for drawing gif result to user
-
-        # handling keystrokes
-        self.restart_prog_button.clicked.connect(self.restart_button_clicked)
-        self.exit_button.clicked.connect(self.close)
-        self.solution_button.clicked.connect(self.solution_button_clicked)
-        self.pause_button.clicked.connect(self.pause_animation)
-        self.pause_button.setEnabled(False)
+        with STARTUP_PROFILE.phase("window widgets"):
+            self.setupUi(self)
+            self.setStyle(QStyleFactory.create(WINDOW_STYLE_NAME))
+            # canvas showing the iterations is created after the warm-up, it replaces the picture of the gif label
+            self.live_canvas = None
+            self.export_executor = ThreadPoolExecutor(max_workers=EXPORT_WORKERS_NUMBER)
+            self.gif_exported.connect(self.show_exported_gif)
+            self.init_job_queue()
+            self.init_expression_validator()
+            self.init_sweep()
+            self.init_comparison()
+
+            # handling keystrokes
+            self.restart_prog_button.clicked.connect(self.restart_button_clicked)
+            self.exit_button.clicked.connect(self.close)
+            self.solution_button.clicked.connect(self.solution_button_clicked)
+            self.pause_button.clicked.connect(self.pause_animation)
+            self.pause_button.setEnabled(False)
+            self.init_animation_options()
+
+        with STARTUP_PROFILE.phase("logger"):
+            logging.basicConfig(filename=LOGGER_NAME, level=logging.INFO)  # initializing application logger
+            logging.info("Program started at {}".format(datetime.datetime.now()))
+        with STARTUP_PROFILE.phase("input fields and results table"):
+            # initialize drop-down button with dimensions of spaces
+            self.init_variables_editor()
+            # initialize minimization methods list
+            self.init_minimization_methods()
+            self.variables_number.currentIndexChanged.connect(self.init_minimization_methods)
+            # initializing results table
+            self.init_results_table()
+            # now init all tables and task edits
+            self.init_application()
+
+        # solver and rendering stacks are loaded when the event loop is started, so they do not delay the window
+        self.warm_up_finished.connect(self.ensure_live_canvas)
+        QTimer.singleShot(0, self.start_warm_up)
+        logging.info("Application initialization was completed")
 
-        logging.basicConfig(filename=LOGGER_NAME, level=logging.INFO)  # initializing application logger
-        logging.info("Program started at {}".format(datetime.datetime.now()))
-        # initialize drop-down button with dimensions of spaces
-        self.init_variables_editor()
-        # initialize minimization methods list
-        self.init_minimization_methods()
-        # initializing results table
-        self.init_results_table()
-        # now init all tables and task edits
-        self.init_application()
+    def start_warm_up(self):
+        Thread(target=self.warm_up, daemon=True).start()
 
-        logging.info("Application initialization was completed")
+    def warm_up(self):
+
+        """
+        Method for importing the heavy modules and compiling the default function (executed in the warm-up thread)
+        """
+
+        try:
+            for module_name in WARM_UP_MODULES:
+                with STARTUP_PROFILE.phase("warm-up: import " + module_name):
+                    importlib.import_module(module_name)
+            with STARTUP_PROFILE.phase("warm-up: compile default function"):
+                ExpressionCompiler.compile(str(TARGET_FUNCTION_DEFAULT))
+        except Exception as error:  # modules are imported again on demand, so the error is only logged
+            logging.error("Warm-up failed: {}".format(error))
+        self.warm_up_finished.emit()
+
+    def ensure_live_canvas(self):
+
+        """
+        Method for creating the canvas showing the iterations (on the first call)
+
+        Returns:
+        -------
+            Live canvas of the window
+        """
+
+        if self.live_canvas is None:
+            from front.plot_canvas import LiveMinimizationCanvas  # matplotlib is not imported before it is needed
+            self.live_canvas = LiveMinimizationCanvas(self.centralwidget)
+            self.live_canvas.setObjectName("live_canvas")
+            self.live_canvas.hide()
+            self.render_layout.addWidget(self.live_canvas)
+            STARTUP_PROFILE.mark("live canvas is ready")
+        return self.live_canvas
 
     def restart_button_clicked(self):
 
@@ -78,21 +198,36 @@ class AppWindow(QMainWindow, Ui_MainWindow):
         """
 
         # AppWindow.clear_layout(self.graph_rendering_layout)
-        self.clear_gif_label()
+        self.clear_animation()
         self.init_application()
+        self.edit_constraints.clear()
+        self.bracket_check_box.setChecked(False)
+        self.analytic_check_box.setChecked(False)
         self.pause_button.setEnabled(False)
         logging.info("Application interface was successfully reinitialized")
 
-    def clear_gif_label(self):
+    def clear_animation(self):
 
         """
-        Method for deleting current gif from label for drawing next minimization process
+        Method for deleting current animation of the minimization process and showing the initial picture instead
         """
 
-        self.gif_label.clear()
-        self.minimization_movie.stop()
-        self.minimization_movie.setFileName(EMPTY_STR)
-        logging.info("Problem edit labels were reinitialized")
+        if self.live_canvas is not None:
+            self.live_canvas.clear()
+            self.live_canvas.hide()
+        self.gif_label.show()
+        logging.info("Animation of minimization was cleared")
+
+    def closeEvent(self, event):
+        self.job_queue.cancel_all(wait=True)
+        self.sweep_runner.cancel()
+        self.comparison_executor.shutdown(wait=False, cancel_futures=True)
+        self.validation_timer.stop()
+        self.validation_executor.shutdown(wait=False, cancel_futures=True)
+        if self.live_canvas is not None:
+            self.live_canvas.set_paused(True)
+        self.export_executor.shutdown(wait=False, cancel_futures=True)
+        QMainWindow.closeEvent(self, event)
 
     def init_application(self):
 
@@ -113,53 +248,537 @@ class AppWindow(QMainWindow, Ui_MainWindow):
         Method of handling pressing the search key for a solution to the problem
         """
 
+        problem = self.read_problem()
+        if problem is None:
+            return
+        compiled_function, interval, eps = problem
+        method_name = self.minimization_methods_box.currentText()
+        constraints = self.read_constraints(compiled_function, method_name)
+        if constraints is None:
+            return
+        method, cell_values = self.minimization_methods()[method_name], self.problem_cell_values()
+        if constraints:
+            method = partial(method, constraints=constraints)
+            cell_values[0] = CONSTRAINED_FUNCTION_CELL.format(cell_values[0], self.edit_constraints.text().strip())
+        plane = self.selected_dimension() == FUNCTION_DIMENSIONS[0]
+        if plane and self.analytic_check_box.isChecked():  # iterations are run only if the problem is not solved
+            method = AnalyticMinimization.analytic_first(method)
+        bracketing = plane and self.bracket_check_box.isChecked()
+        if bracketing:  # the entered interval is only the start of the search
+            method = Bracketing.bracketed(method)
+
+        # the problem is solved in the worker thread, so the window stays responsive
+        OneDimMinimization.logger = logging.getLogger()
+        MultiDimMinimization.logger = logging.getLogger()
+        if self.job_queue.is_busy():
+            self.statusbar.showMessage(JOB_QUEUED_MESSAGE.format(len(self.job_queue.jobs) + 1))
+        # iterations of the multivariate methods are boxes, the live canvas shows only one variable, the gif shows
+        # the contour map (or the surface) of the function of two or three variables
+        drawable = plane or len(compiled_function.variables) >= DRAWN_VARIABLES_NUMBER
+        self.job_queue.submit(MinimizationJob(compiled_function.expr, interval, eps, method,
+                                              numeric_func=compiled_function.numeric_func,
+                                              cell_values=cell_values,
+                                              options={"zoom": self.zoom_check_box.isChecked(),
+                                                       "export": self.export_check_box.isChecked() and drawable,
+                                                       "surface": self.surface_check_box.isChecked(),
+                                                       "live": plane and not bracketing}))
+
+    def read_problem(self):
+
+        """
+        Method for reading the minimization problem from the input fields, the user is shown the error if it is
+         incorrect
+
+        Returns:
+        -------
+            Compiled target function, interval and accuracy (None if the problem is entered incorrectly)
+        """
+
         err_msg = self.process_init_mistakes()
         if err_msg:
             logging.error(err_msg)
             AppWindow.show_user_error_mess(err_msg)
-            return
-        # get all information about the task from the input fields
-        function = self.edit_target_function.toPlainText()
-        eps = self.edit_epsilon.toPlainText()
-        bound_left = self.bound_left.toPlainText()
-        bound_right = self.right_bound.toPlainText()
-        method_name = self.minimization_methods_box.currentText()
+            return None
+        # the target function is usually compiled while the user typed it
+        compiled_function, err_msg = self.current_compiled_function()
+        if err_msg:
+            logging.error(err_msg)
+            AppWindow.show_user_error_mess(err_msg)
+            return None
 
         # translate information into a convenient format for transfer to the optimization method
         try:
-            function = parse_expr(function)
-            eps = float(eps)
-            bound_right = float(bound_right)
-            bound_left = float(bound_left)
+            eps = float(self.edit_epsilon.toPlainText())
+            bound_right = float(self.right_bound.toPlainText())
+            bound_left = float(self.bound_left.toPlainText())
         except ValueError:  # error in filling numeric parameters of minimization problem
             logging.error(ErrorMessage.ERROR_INVALID_VALUE.value)
             AppWindow.show_user_error_mess(ErrorMessage.ERROR_INVALID_VALUE.value)
-        except SyntaxError:  # error in filling target function of minimization problem
-            logging.error(ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION.value)
-            AppWindow.show_user_error_mess(ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION.value)
+            return None
 
         logging.info("All data on the minimization problem are entered correctly")
+        return compiled_function, [bound_left, bound_right], eps
 
-        interval = [bound_left, bound_right]
+    def read_constraints(self, compiled_function, method_name: str):
 
-        # check if the minimization process has been started before clicking and match clear the gif if it was playing
-        if self.gif_label.movie() or self.gif_label.pixmap():
-            self.clear_gif_label()
+        """
+        Method for reading the inequality constraints from the input field, the user is shown the error if they are
+         incorrect or the chosen method does not take them into account
 
-        # adopt the minimization method and draw the process
-        # self.draw_result_gif(LOADING_GIF)
-        OneDimMinimization.logger = logging.getLogger()
-        results = ONE_DIM_MINIMIZATION_METHODS_NAMES[method_name](function, interval, eps)
+        Parameters:
+        ----------
+        compiled_function: CompiledExpression
+            Compiled target function
+        method_name: str
+            Name of the chosen minimization method
 
-        # self.clear_gif_label()
-        if OneDimMinimization.error_msg:
-            AppWindow.show_user_error_mess(OneDimMinimization.error_msg)
+        Returns:
+        -------
+            Tuple of the constraints in sympy format (empty if there are no constraints, None if they are incorrect)
+        """
+
+        try:
+            constraints = ExpressionCompiler.parse_constraints(self.edit_constraints.text().strip(),
+                                                               self.selected_dimension())
+            variables = set(compiled_function.variables).union(*(constraint.free_symbols for constraint in constraints))
+            if constraints and method_name not in CONSTRAINED_MINIMIZATION_METHODS:
+                raise ValueError(ErrorMessage.ERROR_CONSTRAINTS_NOT_SUPPORTED.value)
+            if len(variables) > self.selected_dimension():
+                raise ValueError(ErrorMessage.ERROR_INCORRECT_DIMENSION.value)
+        except ValueError as error:
+            logging.error(str(error))
+            AppWindow.show_user_error_mess(str(error))
+            return None
+        return constraints
+
+    def compare_button_clicked(self):
+
+        """
+        Method for running all minimization methods on the entered problem in background
+        """
+
+        problem = self.read_problem()
+        if problem is None:
             return
-        drawer = PlaneMinimizationDrawer(function, interval)
-        images_for_gif = drawer.draw_minimization(*results)  # ее сейчас переделаем
-        result_gif = GifMaker.create_gif_result(images_for_gif, IMAGES_FOLDER)
-        self.draw_result_gif(result_gif)
-        self.draw_result_table(results[1])
+        self.compare_button.setEnabled(False)
+        self.comparison_executor.submit(self.compare_methods, *problem)
+
+    def compare_methods(self, compiled_function, interval: list, eps: float):
+
+        """
+        Method for comparing the minimization methods (executed in the comparison thread)
+
+        Parameters:
+        ----------
+        compiled_function: CompiledExpression
+            Target function of the problem
+        interval: list
+            Initial uncertainty interval
+        eps: float
+            Accuracy of the minimum search
+        """
+
+        try:
+            self.comparison_done.emit(MethodComparison.compare(compiled_function, interval, eps))
+        except Exception as error:  # comparison thread must not fall silently
+            logging.error("Comparison of methods failed: {}".format(error))
+            self.comparison_done.emit(None)
+
+    def show_comparison(self, report):
+
+        """
+        Method for showing the results of all methods in one window
+
+        Parameters:
+        ----------
+        report: ComparisonReport
+            Results of the comparison (None if it failed)
+        """
+
+        self.compare_button.setEnabled(True)
+        if report is None:
+            return
+        from front.comparison_dialog import ComparisonDialog  # matplotlib is not imported before it is needed
+        self.comparison_dialog = ComparisonDialog(report, self)
+        self.comparison_dialog.show()
+        logging.info("Comparison of methods was shown")
+
+    def init_job_queue(self):
+
+        """
+        Method for creating the queue of minimization problems solved in background and the spinner showing its work
+        """
+
+        self.job_queue = MinimizationJobQueue(self)
+        self.live_job = True  # whether the iterations of the current problem are shown on the live canvas
+        self.job_queue.job_started.connect(self.job_started)
+        self.job_queue.iteration_done.connect(self.show_iteration)
+        self.job_queue.job_finished.connect(self.job_finished)
+        self.job_queue.job_failed.connect(self.job_failed)
+        self.job_queue.job_cancelled.connect(self.job_cancelled)
+        self.job_queue.idle.connect(self.job_queue_idle)
+
+        self.cancel_button = QtWidgets.QPushButton(CANCEL_BTN_TEXT, self.centralwidget)
+        self.cancel_button.setObjectName("cancel_button")
+        self.cancel_button.setMinimumSize(self.solution_button.minimumSize())
+        self.cancel_button.setMaximumSize(self.solution_button.maximumSize())
+        self.cancel_button.setFont(self.solution_button.font())
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.job_queue.cancel_current)
+        self.control_buttons_layout.insertWidget(self.control_buttons_layout.indexOf(self.solution_button) + 1,
+                                                 self.cancel_button)
+
+        self.loading_movie = QMovie(LOADING_GIF)
+        self.loading_movie.setScaledSize(LOADING_GIF_SIZE)
+        self.loading_label = QtWidgets.QLabel(self.statusbar)
+        self.loading_label.setObjectName("loading_label")
+        self.loading_label.setMovie(self.loading_movie)
+        self.loading_label.hide()
+        self.statusbar.addPermanentWidget(self.loading_label)
+
+    def init_expression_validator(self):
+
+        """
+        Method for setting up the background parsing of the target function while the user types it
+        """
+
+        self.compiled_function = None  # last compiled function matching the text of the input field
+        self.validation_executor = ThreadPoolExecutor(max_workers=1)
+        self.validation_timer = QTimer(self)
+        self.validation_timer.setSingleShot(True)
+        self.validation_timer.setInterval(VALIDATION_DELAY)
+        self.validation_timer.timeout.connect(self.start_expression_check)
+        self.edit_target_function.textChanged.connect(self.validation_timer.start)
+        self.variables_number.currentIndexChanged.connect(self.validation_timer.start)
+        self.expression_checked.connect(self.show_expression_check)
+
+        self.function_error_label = QtWidgets.QLabel(self.centralwidget)
+        self.function_error_label.setObjectName("function_error_label")
+        self.function_error_label.setStyleSheet(DEFAULT_STYLESHEET_COLOR)
+        self.function_error_label.setWordWrap(True)
+        self.layout_data_edit.addWidget(self.function_error_label, FUNCTION_ERROR_ROW, 2, 1, 4)
+
+        # inequality constraints are taken into account by the constrained methods of functions of several variables
+        self.edit_constraints = QtWidgets.QLineEdit(self.centralwidget)
+        self.edit_constraints.setObjectName("edit_constraints")
+        self.edit_constraints.setPlaceholderText(CONSTRAINTS_PLACEHOLDER_TEXT)
+        self.layout_data_edit.addWidget(self.edit_constraints, CONSTRAINTS_ROW, 2, 1, 4)
+
+        # the one-dimensional methods can start from a rough interval and search for the bracket of the minimum first
+        self.bracket_check_box = QtWidgets.QCheckBox(BRACKET_CHECK_BOX_TEXT, self.centralwidget)
+        self.bracket_check_box.setObjectName("bracket_check_box")
+        self.layout_data_edit.addWidget(self.bracket_check_box, BRACKET_ROW, 2, 1, 4)
+        self.analytic_check_box = QtWidgets.QCheckBox(ANALYTIC_CHECK_BOX_TEXT, self.centralwidget)
+        self.analytic_check_box.setObjectName("analytic_check_box")
+        self.layout_data_edit.addWidget(self.analytic_check_box, ANALYTIC_ROW, 2, 1, 4)
+
+    def selected_dimension(self) -> int:
+        return int(self.variables_number.currentText() or FUNCTION_DIMENSIONS[0])
+
+    def start_expression_check(self):
+
+        """
+        Method for sending the current target function to the validation thread (called when the user stops typing)
+        """
+
+        text, dimension = self.edit_target_function.toPlainText(), self.selected_dimension()
+        self.validation_executor.submit(self.check_expression, text, dimension)
+
+    def check_expression(self, text: str, dimension: int):
+
+        """
+        Method for compiling the target function (executed in the validation thread)
+
+        Parameters:
+        ----------
+        text: str
+            Target function entered by the user
+        dimension: int
+            Number of variables chosen by the user
+        """
+
+        compiled_function, error_msg = ExpressionCompiler.check(text, dimension)
+        self.expression_checked.emit(text, dimension, compiled_function, error_msg)
+
+    def show_expression_check(self, text: str, dimension: int, compiled_function, error_msg: str):
+
+        """
+        Method for showing the result of the background check of the target function under the input fields
+
+        Parameters:
+        ----------
+        text: str
+            Checked target function
+        dimension: int
+            Number of variables with which the function was checked
+        compiled_function: CompiledExpression
+            Compiled function (None if it is incorrect)
+        error_msg: str
+            Error message (empty string if the function is correct)
+        """
+
+        if text != self.edit_target_function.toPlainText() or dimension != self.selected_dimension():
+            return  # the user has changed the problem since the check was started
+        self.compiled_function = compiled_function
+        self.function_error_label.setText(error_msg)
+
+    def current_compiled_function(self) -> tuple:
+
+        """
+        Method for getting the compiled target function of the input field, it is compiled at once if the background
+         check has not finished yet
+
+        Returns:
+        -------
+            Compiled function (None if it is incorrect) and the error message (empty string if it is correct)
+        """
+
+        text = self.edit_target_function.toPlainText()
+        if self.compiled_function is not None and self.compiled_function.text == text.strip() and \
+                len(self.compiled_function.variables) <= self.selected_dimension():
+            return self.compiled_function, EMPTY_STR
+        return ExpressionCompiler.check(text, self.selected_dimension())
+
+    def job_started(self, job: MinimizationJob):
+
+        """
+        Method for preparing the live canvas for the iterations of the problem which started in background
+
+        Parameters:
+        ----------
+        job: MinimizationJob
+            Started problem
+        """
+
+        self.live_job = job.options.get("live", True)
+        if self.live_job:
+            self.gif_label.hide()
+            self.ensure_live_canvas().show()
+            self.live_canvas.start(job.function, job.interval, job.numeric_func)
+        else:
+            self.clear_animation()
+        self.cancel_button.setEnabled(True)
+        self.loading_label.show()
+        self.loading_movie.start()
+        logging.info("Minimization of {} was started".format(job.function))
+
+    def show_iteration(self, iter_num: int, bounds: tuple):
+        if self.live_job:
+            self.live_canvas.push_iteration(iter_num, bounds)
+
+    def job_finished(self, job: MinimizationJob, results: list):
+
+        """
+        Method for showing the result of the problem solved in background
+
+        Parameters:
+        ----------
+        job: MinimizationJob
+            Solved problem
+        results: list
+            Result of the minimization method (optimum, its value and the sequence of intervals)
+        """
+
+        if self.live_job:
+            self.live_canvas.push_result(results[0], results[1])
+            self.pause_button.setText(PAUSE_BTN_PAUSE_TEXT)
+            self.pause_button.setEnabled(True)
+        metrics = results[METRICS_INDEX] if len(results) > METRICS_INDEX else {}
+        if metrics.get("analytic"):
+            self.statusbar.showMessage(ANALYTIC_MESSAGE.format(**metrics))
+        elif "bracket" in metrics:
+            self.statusbar.showMessage(BRACKETING_MESSAGE.format(**metrics))
+        elif metrics:  # multivariate methods report their numbers of evaluations
+            self.statusbar.showMessage(METRICS_MESSAGE.format(**metrics) +
+                                       (VIOLATION_MESSAGE.format(**metrics) if "max_violation" in metrics else ""))
+        if job.options.get("export"):
+            # the minimization found by the bracket search is drawn in the bracket instead of the entered interval
+            interval = list(metrics.get("bracket", job.interval))
+            self.export_executor.submit(self.export_gif, job.function, interval, results, job.options.get("zoom"),
+                                        surface=job.options.get("surface", False))
+        self.draw_result_table(results[1], job.cell_values, results[2], job.wall_time)
+
+    def init_sweep(self):
+
+        """
+        Method for adding the button of the parameter sweep and the runner solving its problems in background
+        """
+
+        self.sweep_button = QtWidgets.QPushButton(SWEEP_BTN_TEXT, self.centralwidget)
+        self.sweep_button.setObjectName("sweep_button")
+        self.sweep_button.setMinimumSize(self.solution_button.minimumSize())
+        self.sweep_button.setMaximumSize(self.solution_button.maximumSize())
+        self.sweep_button.setFont(self.solution_button.font())
+        self.sweep_button.clicked.connect(self.sweep_button_clicked)
+        self.control_buttons_layout.insertWidget(self.control_buttons_layout.indexOf(self.cancel_button) + 1,
+                                                 self.sweep_button)
+        # the sweep has its own cancel button, so cancelling it does not cancel the problem solved at the same time
+        self.cancel_sweep_button = QtWidgets.QPushButton(CANCEL_SWEEP_BTN_TEXT, self.centralwidget)
+        self.cancel_sweep_button.setObjectName("cancel_sweep_button")
+        self.cancel_sweep_button.setMinimumSize(self.solution_button.minimumSize())
+        self.cancel_sweep_button.setFont(self.solution_button.font())
+        self.cancel_sweep_button.setEnabled(False)
+        self.cancel_sweep_button.clicked.connect(self.cancel_sweep)
+        self.control_buttons_layout.insertWidget(self.control_buttons_layout.indexOf(self.sweep_button) + 1,
+                                                 self.cancel_sweep_button)
+
+        self.sweep_runner = SweepRunner(self)
+        self.sweep_runner.result_ready.connect(self.collect_sweep_result)
+        self.sweep_runner.finished.connect(self.sweep_finished)
+        self.sweep_results = []  # results received from the pool and not added to the table yet
+        self.sweep_problems_number, self.sweep_solved_number = 0, 0
+        self.sweep_render = False
+        # results are added to the table by batches, so a fast sweep does not relayout the table for every run
+        self.sweep_flush_timer = QTimer(self)
+        self.sweep_flush_timer.setInterval(SWEEP_FLUSH_INTERVAL)
+        self.sweep_flush_timer.timeout.connect(self.flush_sweep_results)
+
+    def init_comparison(self):
+
+        """
+        Method for adding the button running all minimization methods on one problem
+        """
+
+        self.compare_button = QtWidgets.QPushButton(COMPARE_BTN_TEXT, self.centralwidget)
+        self.compare_button.setObjectName("compare_button")
+        self.compare_button.setMinimumSize(self.solution_button.minimumSize())
+        self.compare_button.setMaximumSize(self.solution_button.maximumSize())
+        self.compare_button.setFont(self.solution_button.font())
+        self.compare_button.clicked.connect(self.compare_button_clicked)
+        self.control_buttons_layout.insertWidget(self.control_buttons_layout.indexOf(self.cancel_sweep_button) + 1,
+                                                 self.compare_button)
+        self.comparison_executor = ThreadPoolExecutor(max_workers=1)
+        self.comparison_done.connect(self.show_comparison)
+        self.comparison_dialog = None
+
+    def sweep_button_clicked(self):
+
+        """
+        Method for asking the user the parameters of the sweep and starting it
+        """
+
+        dialog = SweepDialog(self.edit_target_function.toPlainText(), self.bound_left.toPlainText(),
+                             self.right_bound.toPlainText(), self)
+        if dialog.exec_() == QDialog.Accepted:
+            self.start_sweep(dialog.problems(), dialog.render_animations())
+
+    def start_sweep(self, problems: list, render: bool = False):
+
+        """
+        Method for sending the problems of the sweep to the pool of processes
+
+        Parameters:
+        ----------
+        problems: list
+            Problems of the sweep (SweepProblem objects)
+        render: bool
+            Whether the animation of every solved problem is exported
+        """
+
+        # problems solved before (in this session or in the imported history) are not solved again
+        history = self.results_model.history
+        new_problems = [problem for problem in problems if history.cached_record(ResultRecord.problem_key(
+            problem.function, problem.interval, problem.eps, problem.method)) is None]
+        if len(new_problems) < len(problems):
+            logging.info(SWEEP_CACHED_MESSAGE.format(len(problems) - len(new_problems), len(problems)))
+        if not new_problems:
+            self.statusbar.showMessage(SWEEP_CACHED_MESSAGE.format(len(problems), len(problems)))
+            return
+        problems = new_problems
+
+        self.sweep_problems_number, self.sweep_solved_number = len(problems), 0
+        self.sweep_render = render
+        self.sweep_runner.start(problems)
+        self.sweep_flush_timer.start()
+        self.cancel_sweep_button.setEnabled(True)
+        self.loading_label.show()
+        self.loading_movie.start()
+        self.statusbar.showMessage(SWEEP_PROGRESS_MESSAGE.format(0, self.sweep_problems_number))
+        logging.info("Sweep of {} problems was started".format(len(problems)))
+
+    def collect_sweep_result(self, result):
+
+        """
+        Method for receiving the result of one problem of the sweep
+
+        Parameters:
+        ----------
+        result: SweepResult
+            Result of the problem
+        """
+
+        self.sweep_solved_number += 1
+        if result.error_msg:
+            logging.error("Sweep problem {} failed: {}".format(result.problem, result.error_msg))
+            return
+        self.sweep_results.append(result)
+        if self.sweep_render:
+            self.export_executor.submit(self.export_gif, ExpressionCompiler.compile(result.problem.function).expr,
+                                        result.problem.interval, result.results, False,
+                                        SWEEP_RESULT_NAME.format(self.sweep_solved_number))
+
+    def flush_sweep_results(self):
+
+        """
+        Method for adding the collected results of the sweep to the table by one batch
+        """
+
+        records = [ResultRecord(result.problem.function, str(result.problem.interval), result.problem.eps,
+                                result.results[1], result.problem.method, result.wall_time,
+                                ResultRecord.trajectory_from_borders(result.results[2]))
+                   for result in self.sweep_results]
+        self.sweep_results = []
+        self.results_model.append_records(records)
+        self.statusbar.showMessage(SWEEP_PROGRESS_MESSAGE.format(self.sweep_solved_number,
+                                                                 self.sweep_problems_number))
+
+    def sweep_finished(self):
+        self.sweep_flush_timer.stop()
+        self.cancel_sweep_button.setEnabled(False)
+        self.flush_sweep_results()
+        if not self.job_queue.is_busy():
+            self.job_queue_idle()
+        logging.info("Sweep was finished")
+
+    def cancel_sweep(self):
+        if not self.sweep_runner.is_running():
+            return
+        self.sweep_runner.cancel()
+        self.sweep_finished()
+        self.statusbar.showMessage(SWEEP_CANCELLED_MESSAGE)
+
+    def job_failed(self, job: MinimizationJob, error_msg: str):
+        logging.error(error_msg)
+        self.clear_animation()
+        AppWindow.show_user_error_mess(error_msg)
+
+    def job_cancelled(self, job: MinimizationJob):
+        if self.live_job:
+            self.live_canvas.clear_pending()
+        self.statusbar.showMessage(JOB_CANCELLED_MESSAGE)
+        logging.info("Minimization of {} was cancelled".format(job.function))
+
+    def job_queue_idle(self):
+        self.cancel_button.setEnabled(False)
+        if self.sweep_runner.is_running():
+            return  # spinner is still needed by the sweep
+        self.loading_movie.stop()
+        self.loading_label.hide()
+
+    def problem_cell_values(self) -> list:
+
+        """
+        Method for getting the problem as it is entered by the user at the moment (for the results table)
+
+        Returns:
+        -------
+            Target function, interval, accuracy and method name as strings
+        """
+
+        return [self.edit_target_function.toPlainText(),
+                "[" + self.bound_left.toPlainText() + ", " + self.right_bound.toPlainText() + "]",
+                self.edit_epsilon.toPlainText(),
+                self.minimization_methods_box.currentText()]
 
     def init_task_edits(self):
 
@@ -175,38 +794,77 @@ class AppWindow(QMainWindow, Ui_MainWindow):
         self.pause_button.setText(PAUSE_BTN_INIT_TEXT)
         logging.info("Initial values of input fields are correctly initialized")
 
-    def draw_result_gif(self, result_gif_path: str):
+    def export_gif(self, function, interval: list, results: list, zoom: bool = False,
+                   result_name: str = None, surface: bool = False):
 
         """
-        Method for initializing the means of drawing the graph of the function to be minimized
+        Method for rendering the minimization process into a gif file (executed in the export thread)
 
         Parameters:
         ----------
-        result_gif_path: str
-            Full path to the GIF image with rendering of the minimization process
+        function: Expr
+            Target function of the minimization problem
+        interval: list
+            Initial uncertainty interval
+        results: list
+            Result of the minimization method (optimum, its value and the sequence of intervals)
+        zoom: bool
+            Whether the frames follow the current uncertainty interval
+        result_name: str
+            Name of the animation file without extension (default name of GifMaker if None)
+        surface: bool
+            Whether the function of several variables is drawn as the surface instead of the contour map
         """
 
-        self.minimization_movie = QMovie(result_gif_path)
+        # rendering stack is loaded on demand
+        from backend.plane_minimization_drawer import PlaneMinimizationDrawer, IMAGES_FOLDER
+        from backend.space_minimization_drawer import SpaceMinimizationDrawer
+        from backend.gif_maker import GifMaker, RES_GIF_NAME
+
+        try:
+            folder = self.export_folder or IMAGES_FOLDER
+            # optimum of the multivariate methods is the point, their trajectories are drawn over the contour map
+            drawer = SpaceMinimizationDrawer(function, interval, surface=surface, images_folder=folder) if \
+                isinstance(results[0], tuple) else PlaneMinimizationDrawer(function, interval, zoom=zoom,
+                                                                           images_folder=folder)
+            with drawer:  # metrics of the multivariate methods are not drawn
+                images_for_gif = drawer.draw_minimization(*results[:METRICS_INDEX],
+                                                          frame_policy=ANIMATION_FRAME_POLICY,
+                                                          max_frames=ANIMATION_MAX_FRAMES)
+                result_path = GifMaker.create_gif_result(images_for_gif, drawer.images_folder,
+                                                         result_name=result_name or RES_GIF_NAME)
+            for image in set(images_for_gif):  # frames are not needed after the animation is written
+                os.remove(image)
+            self.gif_exported.emit(result_path)
+        except Exception as error:  # export thread must not fall silently
+            logging.error("Animation export failed: {}".format(error))
+
+    def show_exported_gif(self, result_gif_path: str):
+
+        """
+        Method for informing the user that the gif with rendering of the minimization process is ready
 
-        self.gif_label.setMovie(self.minimization_movie)
-        self.minimization_movie.start()
+        Parameters:
+        ----------
+        result_gif_path: str
+            Full path to the GIF image with rendering of the minimization process
+        """
 
-        self.pause_button.setText(PAUSE_BTN_PAUSE_TEXT)
-        self.pause_button.setEnabled(True)
-        logging.info("Result animation was successfully drawn")
+        self.statusbar.showMessage(GIF_EXPORTED_MESSAGE.format(result_gif_path))
+        logging.info("Result animation was successfully exported")
 
     def pause_animation(self):
-        # if self.minimization_movie
-        if self.minimization_movie.state() == QMovie.Paused:
-            self.minimization_movie.setPaused(False)
+        if self.live_canvas.is_paused():
+            self.live_canvas.set_paused(False)
             self.pause_button.setText(PAUSE_BTN_PAUSE_TEXT)
-            logging.info("Animation of minimization successfully paused")
+            logging.info("Animation of minimization successfully continued")
         else:
-            self.minimization_movie.setPaused(True)
+            self.live_canvas.set_paused(True)
             self.pause_button.setText(PAUSE_BTN_PLAY_TEXT)
-            logging.info("Animation of minimization successfully continued")
+            logging.info("Animation of minimization successfully paused")
 
-    def draw_result_table(self, minimization_result: float = 0):
+    def draw_result_table(self, minimization_result: float = 0, problem_values: list = None, borders: dict = None,
+                          wall_time: float = 0.):
 
         """
         Method for drawing minimization result information to user of application
@@ -215,52 +873,22 @@ class AppWindow(QMainWindow, Ui_MainWindow):
         ----------
         minimization_result: float
             Result of minimization in given as real number
+        problem_values: list
+            Target function, interval, accuracy and method of the solved problem (taken from the input fields if None)
+        borders: dict
+            Uncertainty intervals of the method by the iteration numbers (kept in the history for the export)
+        wall_time: float
+            Time of solving the problem in seconds
         """
-        row_index = self.results_table.rowCount() - 1
-        # check the previous cell for filling
-        last_item = self.results_table.item(row_index, FIRST_COLUMN_INDEX)
-        if not last_item:
-            self.table_cell_filling(row_index,
-                                    cell_values=[self.edit_target_function.toPlainText(),
-                                                 "[" + self.bound_left.toPlainText() + ", " +
-                                                 self.right_bound.toPlainText() + "]",
-                                                 self.edit_epsilon.toPlainText(),
-                                                 str(minimization_result)])
-        else:
-            self.results_table.insertRow(self.results_table.rowCount())  # inserting new row at the end of the table
-            self.table_cell_filling(row_index + 1,
-                                    cell_values=[self.edit_target_function.toPlainText(),
-                                                 "[" + self.bound_left.toPlainText() + ", " +
-                                                 self.right_bound.toPlainText() + "]",
-                                                 self.edit_epsilon.toPlainText(),
-                                                 str(minimization_result)])
-
-        # resizing table columns
-        header = self.results_table.horizontalHeader()
-        for column in range(self.results_table.columnCount() - 1):
-            header.setSectionResizeMode(column, QtWidgets.QHeaderView.Stretch)
-        # resizing last column manually
-        header.setSectionResizeMode(self.results_table.columnCount() - 1, QtWidgets.QHeaderView.ResizeToContents)
-
-    def table_cell_filling(self, row_index: int = 0, cell_values: list = None):
-
-        """
-        Method for filling the row of the result table with the values obtained in the last minimization process
-
-        Parameters:
-        ----------
-        row_index: int
-            Index of row on which position it is necessary to insert new values
-        cell_values: list
-            Values to insert into table cells
-        """
-
-        if len(cell_values) != len(TABLE_COLUMNS):
+        if problem_values is None:
+            problem_values = self.problem_cell_values()
+        if len(problem_values) != len(TABLE_COLUMNS) - 1:
             raise Exception("Error while table cell filling: not enough or too much input arguments")
-        else:
-            for index, column_value in enumerate(cell_values):
-                self.results_table.setItem(row_index, index, QTableWidgetItem(column_value))
-
+        function, interval, eps, method_name = problem_values
+        # the row is added to the model, the view materializes its cells only when they are shown
+        trajectory = ResultRecord.trajectory_from_borders(borders) if borders else []
+        self.results_model.append_records([ResultRecord(function, interval, float(eps), float(minimization_result),
+                                                        method_name, wall_time, trajectory)])
         logging.info("Minimization result successfully added to table")
 
     def init_variables_editor(self):
@@ -273,34 +901,158 @@ class AppWindow(QMainWindow, Ui_MainWindow):
             self.variables_number.addItem(str(dimension))
         logging.info("Combo box with minimization dimensions successfully initialized")
 
+    def init_animation_options(self):
+
+        """
+        Method for adding the options of rendering the minimization process under the animation
+        """
+
+        self.animation_options_layout = QtWidgets.QHBoxLayout()
+        self.animation_options_layout.setObjectName("animation_options_layout")
+        self.zoom_check_box = QtWidgets.QCheckBox(ZOOM_CHECK_BOX_TEXT, self.centralwidget)
+        self.zoom_check_box.setObjectName("zoom_check_box")
+        self.animation_options_layout.addWidget(self.zoom_check_box)
+        self.export_check_box = QtWidgets.QCheckBox(EXPORT_CHECK_BOX_TEXT, self.centralwidget)
+        self.export_check_box.setObjectName("export_check_box")
+        self.animation_options_layout.addWidget(self.export_check_box)
+        self.surface_check_box = QtWidgets.QCheckBox(SURFACE_CHECK_BOX_TEXT, self.centralwidget)
+        self.surface_check_box.setObjectName("surface_check_box")
+        self.animation_options_layout.addWidget(self.surface_check_box)
+        self.graph_rendering_layout.addLayout(self.animation_options_layout, ANIMATION_OPTIONS_ROW, 0, 1, 1)
+
     def init_minimization_methods(self):
 
         """
         Method of filling the drop-down button with the names of the methods available for use in the minimization task
         """
 
-        for name in ONE_DIM_MINIMIZATION_METHODS_NAMES.keys():
+        self.minimization_methods_box.clear()
+        for name in self.minimization_methods().keys():
             self.minimization_methods_box.addItem(name)
+        if hasattr(self, "bracket_check_box"):  # the options of the one-dimensional methods
+            self.bracket_check_box.setEnabled(self.selected_dimension() == FUNCTION_DIMENSIONS[0])
+            self.analytic_check_box.setEnabled(self.selected_dimension() == FUNCTION_DIMENSIONS[0])
+
+    def minimization_methods(self) -> dict:
+
+        """
+        Method for getting the minimization methods of the selected dimension
+
+        Returns:
+        -------
+            Minimization methods by their names
+        """
+
+        if self.selected_dimension() == FUNCTION_DIMENSIONS[0]:
+            return ONE_DIM_MINIMIZATION_METHODS
+        return {**MULTI_DIM_MINIMIZATION_METHODS, **GLOBAL_MINIMIZATION_METHODS, **CONSTRAINED_MINIMIZATION_METHODS}
 
     def init_results_table(self):
 
         """
-        Method for initializing table widget for showing to user results of minimization
+        Method for initializing table view for showing to user results of minimization
         """
 
-        self.results_table.setColumnCount(len(TABLE_COLUMNS))
-        self.results_table.setRowCount(INIT_ROWS_NUMBER)
-        self.results_table.setHorizontalHeaderLabels(TABLE_COLUMNS)
+        self.results_model = ResultsTableModel(self)
+        self.results_table.setModel(self.results_model)
         self.results_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        # self.tableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.results_table.horizontalHeader().setSortIndicator(NO_SORT_COLUMN, Qt.AscendingOrder)  # solving order
+        self.results_table.setSortingEnabled(True)
 
-        # resizing table columns
+        # resize modes are set once, so adding rows does not relayout the whole table
         header = self.results_table.horizontalHeader()
-        for column in range(self.results_table.columnCount() - 1):
-            header.setSectionResizeMode(column, QtWidgets.QHeaderView.Stretch)
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        header.setSectionResizeMode(RESULT_COLUMN_INDEX, QtWidgets.QHeaderView.Interactive)
+        self.results_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+
+        # filter of the results by one of the columns is placed over the table
+        self.filter_column_box = QtWidgets.QComboBox(self.centralwidget)
+        self.filter_column_box.setObjectName("filter_column_box")
+        self.filter_column_box.addItems(TABLE_COLUMNS)
+        self.filter_edit = QtWidgets.QLineEdit(self.centralwidget)
+        self.filter_edit.setObjectName("filter_edit")
+        self.filter_edit.setPlaceholderText(FILTER_PLACEHOLDER_TEXT)
+        self.filter_edit.textChanged.connect(self.filter_results)
+        self.filter_column_box.currentIndexChanged.connect(self.filter_results)
+
+        # whole history with the trajectories is saved to a file and loaded back without solving the problems again
+        self.export_history_button = QtWidgets.QPushButton(EXPORT_HISTORY_BTN_TEXT, self.centralwidget)
+        self.export_history_button.setObjectName("export_history_button")
+        self.export_history_button.clicked.connect(self.export_history_button_clicked)
+        self.import_history_button = QtWidgets.QPushButton(IMPORT_HISTORY_BTN_TEXT, self.centralwidget)
+        self.import_history_button.setObjectName("import_history_button")
+        self.import_history_button.clicked.connect(self.import_history_button_clicked)
+
+        filter_layout = QtWidgets.QHBoxLayout()
+        filter_layout.addWidget(self.filter_column_box)
+        filter_layout.addWidget(self.filter_edit)
+        filter_layout.addWidget(self.export_history_button)
+        filter_layout.addWidget(self.import_history_button)
+        self.results_layout = QtWidgets.QVBoxLayout()
+        self.results_layout.setObjectName("results_layout")
+        self.results_layout.addLayout(filter_layout)
+        table_position = self.render_layout.indexOf(self.results_table)
+        self.render_layout.removeWidget(self.results_table)
+        self.results_layout.addWidget(self.results_table)
+        self.render_layout.insertLayout(table_position, self.results_layout)
 
         logging.info("Result table was successfully drawn")
 
+    def filter_results(self):
+        self.results_model.set_filter(self.filter_column_box.currentIndex(), self.filter_edit.text())
+
+    def export_history_button_clicked(self):
+        path, _ = QFileDialog.getSaveFileName(self, EXPORT_HISTORY_BTN_TEXT, "", HISTORY_FILE_FILTER)
+        if path:
+            self.export_history(path)
+
+    def import_history_button_clicked(self):
+        path, _ = QFileDialog.getOpenFileName(self, IMPORT_HISTORY_BTN_TEXT, "", HISTORY_FILE_FILTER)
+        if path:
+            self.import_history(path)
+
+    def export_history(self, path: str):
+
+        """
+        Method for saving all results of the history (not only the filtered ones) to the file
+
+        Parameters:
+        ----------
+        path: str
+            Path of the file, its extension defines the format (csv, jsonl or pb)
+        """
+
+        records = self.results_model.history.records()
+        try:
+            HistoryIO.export_records(records, path)
+        except (OSError, ValueError) as error:
+            logging.error(str(error))
+            AppWindow.show_user_error_mess(str(error))
+            return
+        self.statusbar.showMessage(HISTORY_EXPORTED_MESSAGE.format(len(records), path))
+        logging.info(HISTORY_EXPORTED_MESSAGE.format(len(records), path))
+
+    def import_history(self, path: str):
+
+        """
+        Method for adding the saved results to the table by one batch, they also become the cache of the sweep
+
+        Parameters:
+        ----------
+        path: str
+            Path of the file saved by export_history
+        """
+
+        try:
+            records = HistoryIO.import_records(path)
+        except (OSError, ValueError) as error:
+            logging.error(str(error))
+            AppWindow.show_user_error_mess(str(error))
+            return
+        self.results_model.append_records(records)
+        self.statusbar.showMessage(HISTORY_IMPORTED_MESSAGE.format(len(records), path))
+        logging.info(HISTORY_IMPORTED_MESSAGE.format(len(records), path))
+
     def process_init_mistakes(self) -> str:
 
         """
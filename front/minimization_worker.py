@@ -0,0 +1,315 @@
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from threading import Event, Lock
+from typing import Callable, Any
+from PyQt5.QtCore import QObject, QThread, Qt, pyqtSignal
+from backend.one_dimension_minimization import OneDimMinimization, EMPTY_STR
+from backend.multi_dimension_minimization import MultiDimMinimization
+from backend.parameter_sweep import ParameterSweep, SweepResult
+
+SPAWN_CONTEXT = "spawn"
+
+
+class MinimizationCancelled(Exception):
+
+    """
+    Exception raised inside the solver when the user cancels the running minimization
+    """
+
+
+@dataclass
+class MinimizationJob:
+
+    """
+    Class of one minimization problem submitted by the user
+
+    Parameters:
+    ----------
+    function: sympy.Expr
+        Target function of the minimization problem
+    interval: list
+        Initial uncertainty interval
+    eps: float
+        Required accuracy of the minimum search
+    method: Callable
+        Minimization method of OneDimMinimization or MultiDimMinimization
+    numeric_func: Callable
+        Compiled version of the function for drawing (made from the function if None)
+    cell_values: list
+        Problem as it was entered by the user (for the results table)
+    options: dict
+        Rendering options chosen at the moment of submission
+    wall_time: float
+        Time of solving the problem in seconds (it is set by the worker)
+    """
+
+    function: Any
+    interval: list
+    eps: float
+    method: Callable
+    numeric_func: Callable = None
+    cell_values: list = field(default_factory=list)
+    options: dict = field(default_factory=dict)
+    wall_time: float = 0.
+
+
+class MinimizationWorker(QObject):
+
+    """
+    Class solving one minimization problem in a separate thread and reporting the progress by signals
+    """
+
+    iteration_done = pyqtSignal(int, tuple)
+    finished = pyqtSignal(object, list)
+    failed = pyqtSignal(object, str)
+    cancelled = pyqtSignal(object)
+
+    def __init__(self, job: MinimizationJob):
+        QObject.__init__(self)
+        self.job = job
+        self.cancel_event = Event()
+
+    def run(self):
+
+        """
+        Method for solving the problem of the job (executed in the worker thread)
+        """
+
+        # error of the previous problem must not be reported again
+        OneDimMinimization.error_msg, MultiDimMinimization.error_msg = EMPTY_STR, EMPTY_STR
+        start = time.perf_counter()
+        try:
+            if self.cancel_event.is_set():
+                raise MinimizationCancelled()
+            results = self.job.method(self.job.function, self.job.interval, self.job.eps,
+                                      on_iteration=self.report_iteration)
+            self.job.wall_time = time.perf_counter() - start
+        except MinimizationCancelled:
+            self.cancelled.emit(self.job)
+            return
+        except Exception as error:  # any error of the solver must reach the user instead of killing the thread
+            self.failed.emit(self.job, str(error))
+            return
+
+        error_msg = OneDimMinimization.error_msg or MultiDimMinimization.error_msg
+        if error_msg:
+            self.failed.emit(self.job, error_msg)
+        else:
+            self.finished.emit(self.job, results)
+
+    def report_iteration(self, iter_num: int, bounds: tuple):
+
+        """
+        Method called by the solver after each iteration, it is also the point where the cancellation happens
+
+        Parameters:
+        ----------
+        iter_num: int
+            Number of the iteration
+        bounds: tuple
+            Uncertainty interval after the iteration
+        """
+
+        if self.cancel_event.is_set():
+            raise MinimizationCancelled()
+        self.iteration_done.emit(iter_num, bounds)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class MinimizationJobQueue(QObject):
+
+    """
+    Class running the submitted minimization problems one after another in a background thread,
+     the problems submitted while another one is solved are queued
+
+    Parameters:
+    ----------
+    jobs: deque
+        Problems waiting for their turn
+    worker: MinimizationWorker
+        Worker of the problem that is being solved now (None if the queue is idle)
+    thread: QThread
+        Thread of the current worker
+    """
+
+    job_started = pyqtSignal(object)
+    iteration_done = pyqtSignal(int, tuple)
+    job_finished = pyqtSignal(object, list)
+    job_failed = pyqtSignal(object, str)
+    job_cancelled = pyqtSignal(object)
+    idle = pyqtSignal()
+
+    def __init__(self, parent=None):
+        QObject.__init__(self, parent)
+        self.jobs = deque()
+        self.worker = None
+        self.thread = None
+
+    def submit(self, job: MinimizationJob):
+
+        """
+        Method for adding the problem to the queue, it starts at once if nothing is being solved
+
+        Parameters:
+        ----------
+        job: MinimizationJob
+            Problem to solve
+        """
+
+        self.jobs.append(job)
+        if not self.is_busy():
+            self.start_next_job()
+
+    def is_busy(self) -> bool:
+        return self.worker is not None
+
+    def start_next_job(self):
+
+        """
+        Method for starting the oldest queued problem in a new worker thread
+        """
+
+        if not self.jobs:
+            self.idle.emit()
+            return
+        job = self.jobs.popleft()
+        self.thread = QThread()
+        self.worker = MinimizationWorker(job)
+        self.worker.moveToThread(self.thread)
+
+        self.thread.started.connect(self.worker.run)
+        self.worker.iteration_done.connect(self.iteration_done)
+        self.worker.finished.connect(self.job_finished)
+        self.worker.failed.connect(self.job_failed)
+        self.worker.cancelled.connect(self.job_cancelled)
+        for signal in (self.worker.finished, self.worker.failed, self.worker.cancelled):
+            # the thread is stopped right from the worker, so it never outlives its problem
+            signal.connect(self.thread.quit, Qt.DirectConnection)
+        self.thread.finished.connect(self.job_done)
+
+        self.job_started.emit(job)
+        self.thread.start()
+
+    def job_done(self):
+
+        """
+        Method for releasing the finished worker and starting the next problem
+        """
+
+        self.thread.wait()
+        self.worker.deleteLater()
+        self.thread.deleteLater()
+        self.worker, self.thread = None, None
+        self.start_next_job()
+
+    def cancel_current(self):
+
+        """
+        Method for cancelling the problem that is being solved now, the queued problems are kept
+        """
+
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def cancel_all(self, wait: bool = False):
+
+        """
+        Method for cancelling the running problem and dropping all queued ones
+
+        Parameters:
+        ----------
+        wait: bool
+            Whether to block until the worker thread is stopped
+        """
+
+        self.jobs.clear()
+        self.cancel_current()
+        if wait and self.thread is not None:
+            self.thread.wait()
+
+
+class SweepRunner(QObject):
+
+    """
+    Class solving the problems of the parameter sweep in a pool of processes, the results are sent as they finish
+
+    Parameters:
+    ----------
+    executor: ProcessPoolExecutor
+        Pool of the current sweep (None if no sweep is running)
+    futures: list
+        Not finished problems of the current sweep
+    """
+
+    result_ready = pyqtSignal(object)  # emitted from the thread of the pool with the SweepResult
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None, workers_number: int = None):
+        QObject.__init__(self, parent)
+        self.workers_number = workers_number
+        self.executor = None
+        self.futures = []
+        self.lock = Lock()
+
+    def start(self, problems: list):
+
+        """
+        Method for sending all problems of the sweep to the pool
+
+        Parameters:
+        ----------
+        problems: list
+            Problems of the sweep (SweepProblem objects)
+        """
+
+        self.cancel()
+        # processes are spawned, because forking the process with running Qt threads is not safe
+        self.executor = ProcessPoolExecutor(max_workers=self.workers_number, mp_context=get_context(SPAWN_CONTEXT))
+        with self.lock:
+            self.futures = [self.executor.submit(ParameterSweep.solve_problem, problem)
+                            for problem in problems]
+        for future in list(self.futures):
+            future.add_done_callback(self.problem_done)
+
+    def problem_done(self, future: Future):
+
+        """
+        Method called by the pool when one problem is finished
+
+        Parameters:
+        ----------
+        future: Future
+            Finished problem
+        """
+
+        if future.cancelled():
+            return
+        with self.lock:
+            if future not in self.futures:  # problem of the cancelled sweep
+                return
+            self.futures.remove(future)
+            last = not self.futures
+        error = future.exception()
+        self.result_ready.emit(future.result() if error is None else SweepResult(None, error_msg=str(error)))
+        if last:
+            self.finished.emit()
+
+    def is_running(self) -> bool:
+        return bool(self.futures)
+
+    def cancel(self):
+
+        """
+        Method for dropping the not started problems of the current sweep
+        """
+
+        with self.lock:
+            self.futures = []
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
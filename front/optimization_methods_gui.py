@@ -152,15 +152,13 @@ class Ui_MainWindow(object):
         self.graph_rendering_layout.setObjectName("graph_rendering_layout")
         self.render_layout = QtWidgets.QHBoxLayout()
         self.render_layout.setObjectName("render_layout")
-        self.results_table = QtWidgets.QTableWidget(self.centralwidget)
+        self.results_table = QtWidgets.QTableView(self.centralwidget)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(self.results_table.sizePolicy().hasHeightForWidth())
         self.results_table.setSizePolicy(sizePolicy)
         self.results_table.setObjectName("results_table")
-        self.results_table.setColumnCount(0)
-        self.results_table.setRowCount(0)
         self.render_layout.addWidget(self.results_table)
         self.gif_label = QtWidgets.QLabel(self.centralwidget)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
@@ -1,5 +1,24 @@
+from collections import deque
+from typing import Callable
+import numpy as np
+from sympy import Expr
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
 from PyQt5.QtWidgets import QSizePolicy
+from PyQt5.QtCore import QTimer
+from backend.expression_compiler import ExpressionCompiler
+
+LIVE_POINTS_NUMBER = 1000  # number of points of the function graph on the live canvas
+LIVE_UPDATE_INTERVAL = 150  # milliseconds between two shown iterations
+FUNCTION_COLOR = "r"
+BOUNDS_COLOR = "blue"
+RESULT_COLOR = "green"
+BOUNDS_LINE_STYLE = "--"
+DOT_MARKER = "o"
+RESULT_ITERATION = None  # iteration number of the pending state which holds the result of minimization
+ITERATION_TEXT_POSITION = (0.02, 0.95)  # position of the iteration caption in the axes coordinates
+ITERATION_TEXT = "iter #{}: [{:.6g}, {:.6g}]"
+RESULT_TEXT = "result: f({:.6g}) = {:.6g}"
 
 
 class MplCanvas(FigureCanvas):
@@ -11,3 +30,204 @@ class MplCanvas(FigureCanvas):
         FigureCanvas.setSizePolicy(self, QSizePolicy.Expanding, QSizePolicy.Expanding)
         FigureCanvas.updateGeometry(self)
 
+
+class LiveMinimizationCanvas(MplCanvas):
+
+    """
+    Canvas showing the iterations of the minimization process as they are produced by the solver,
+     the graph of the function is drawn once and on each timer tick only the artists of the interval are redrawn
+
+    Parameters:
+    ----------
+    pending: deque
+        Iterations received from the solver and not shown yet
+    background: Any
+        Saved picture of the static part of the plot (function graph, axes, grid)
+    """
+
+    def __init__(self, parent=None):
+
+        MplCanvas.__init__(self, Figure(), parent)
+        self.axes = self.fig.add_subplot()
+        self.pending = deque()
+        self.background = None
+        self.func = None
+        self.variable = None
+        self.numeric_func = None
+        self.animated_artists = []
+        self.timer = QTimer(self)
+        self.timer.setInterval(LIVE_UPDATE_INTERVAL)
+        self.timer.timeout.connect(self.show_next_iteration)
+        self.mpl_connect("draw_event", self.save_background)
+
+    def start(self, func: Expr, interval: list, numeric_func: Callable = None):
+
+        """
+        Method for drawing the static part of the plot for the new minimization problem and starting the updater
+
+        Parameters:
+        ----------
+        func: Expr
+            Target function of the minimization problem
+        interval: list
+            Initial uncertainty interval
+        numeric_func: Callable
+            Already compiled function (it is compiled here if None)
+        """
+
+        self.pending.clear()
+        self.axes.cla()
+        self.func = func
+        self.variable = next(iter(func.free_symbols)) if func.free_symbols else None
+        self.numeric_func = numeric_func or ExpressionCompiler.lambdify(self.variable if self.variable else [], func)
+        x_values = np.linspace(interval[0], interval[1], LIVE_POINTS_NUMBER)
+        self.axes.plot(x_values, self.evaluate(x_values), FUNCTION_COLOR, label="target function")
+        self.axes.set_xlabel(str(self.variable))
+        self.axes.grid()
+        self.axes.legend(loc="upper right")
+
+        # only these artists are changed from iteration to iteration, they are drawn over the saved background
+        self.bound_lines = [self.axes.axvline(bound, color=BOUNDS_COLOR, linestyle=BOUNDS_LINE_STYLE, animated=True)
+                            for bound in interval]
+        self.bound_points, = self.axes.plot(interval, self.evaluate(np.array(interval, dtype=float)),
+                                            color=BOUNDS_COLOR, marker=DOT_MARKER, linestyle="", animated=True)
+        self.iteration_text = self.axes.text(*ITERATION_TEXT_POSITION, "", transform=self.axes.transAxes,
+                                             animated=True)
+        self.animated_artists = [*self.bound_lines, self.bound_points, self.iteration_text]
+
+        self.draw()
+        self.timer.start()
+
+    def evaluate(self, x_values: np.ndarray) -> np.ndarray:
+
+        """
+        Method for calculating the target function on an array of points with one call
+
+        Parameters:
+        ----------
+        x_values: np.ndarray
+            Points of the optimization variable
+
+        Returns:
+        -------
+            Values of the function at the given points
+        """
+
+        if self.variable is None:  # constant function does not depend on the points
+            return np.full(np.shape(x_values), float(self.func))
+        return np.broadcast_to(np.asarray(self.numeric_func(x_values), dtype=float), np.shape(x_values))
+
+    def push_iteration(self, iter_num: int, bounds: tuple):
+
+        """
+        Method for receiving a new iteration from the solver (it is shown on one of the next timer ticks)
+
+        Parameters:
+        ----------
+        iter_num: int
+            Number of the iteration
+        bounds: tuple
+            Uncertainty interval after the iteration
+        """
+
+        self.pending.append((iter_num, bounds))
+
+    def push_result(self, result_x: float, result_y: float):
+
+        """
+        Method for receiving the result of the minimization, it is shown after all iterations
+
+        Parameters:
+        ----------
+        result_x: float
+            Abscissa of the minimization result point
+        result_y: float
+            Ordinate of the minimization result point
+        """
+
+        self.pending.append((RESULT_ITERATION, (float(result_x), float(result_y))))
+
+    def show_next_iteration(self):
+
+        """
+        Method for showing the oldest not shown iteration (called by the timer)
+        """
+
+        if not self.pending or self.background is None:
+            return
+        iter_num, state = self.pending.popleft()
+        if iter_num is RESULT_ITERATION:
+            self.bound_lines[0].set_xdata([state[0]] * 2)
+            self.bound_lines[1].set_visible(False)
+            self.bound_points.set_data([state[0]], [state[1]])
+            self.bound_points.set_color(RESULT_COLOR)
+            self.iteration_text.set_text(RESULT_TEXT.format(*state))
+        else:
+            for line, bound in zip(self.bound_lines, state):
+                line.set_xdata([bound] * 2)
+            self.bound_points.set_data(state, self.evaluate(np.array(state, dtype=float)))
+            self.iteration_text.set_text(ITERATION_TEXT.format(iter_num, *state))
+        self.blit_artists()
+
+    def blit_artists(self):
+
+        """
+        Method for redrawing only the changed artists over the saved static part of the plot
+        """
+
+        self.restore_region(self.background)
+        for artist in self.animated_artists:
+            self.axes.draw_artist(artist)
+        self.blit(self.fig.bbox)
+
+    def save_background(self, event=None):
+
+        """
+        Method for saving the static part of the plot after its full redraw (for example, after resizing)
+        """
+
+        self.background = self.copy_from_bbox(self.fig.bbox)
+        for artist in self.animated_artists:
+            self.axes.draw_artist(artist)
+
+    def set_paused(self, paused: bool):
+
+        """
+        Method for pausing / continuing the showing of iterations
+
+        Parameters:
+        ----------
+        paused: bool
+            True to pause the updater
+        """
+
+        if paused:
+            self.timer.stop()
+        else:
+            self.timer.start()
+
+    def is_paused(self) -> bool:
+        return not self.timer.isActive()
+
+    def is_finished(self) -> bool:
+        return not self.pending
+
+    def clear_pending(self):
+
+        """
+        Method for dropping the iterations which are not shown yet (the shown ones stay on the canvas)
+        """
+
+        self.pending.clear()
+
+    def clear(self):
+
+        """
+        Method for stopping the updater and clearing the canvas
+        """
+
+        self.timer.stop()
+        self.pending.clear()
+        self.animated_artists = []
+        self.axes.cla()
+        self.draw()
@@ -0,0 +1,118 @@
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from backend.results_history import ResultsHistory, NUMERIC_COLUMNS, HISTORY_COLUMNS
+
+TABLE_COLUMNS = ["Target Function", "Interval", "Accuracy", "Result", "Method"]  # column names in the results table
+NO_SORT_COLUMN = -1  # rows are shown in the order of solving until the user sorts the table
+
+
+class ResultsTableModel(QAbstractTableModel):
+
+    """
+    Model of the results table over the columnar history of results: the text of a cell is made only when the view
+     asks for it, so the number of stored results does not slow the table down
+
+    Parameters:
+    ----------
+    history: ResultsHistory
+        Store with all results of the session
+    rows: list
+        Indices of the results of the store shown in the table (in the shown order)
+    sort_column: int
+        Column by which the table is sorted (NO_SORT_COLUMN if it is not sorted)
+    filter_column: int
+        Column by which the results are filtered
+    filter_pattern: str
+        Searched value of the filter (all results are shown if empty)
+    """
+
+    def __init__(self, parent=None):
+        QAbstractTableModel.__init__(self, parent)
+        self.history = ResultsHistory()
+        self.rows = []
+        self.sort_column = NO_SORT_COLUMN
+        self.sort_order = Qt.AscendingOrder
+        self.filter_column = 0
+        self.filter_pattern = ""
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(TABLE_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self.history.value(self.rows[index.row()], index.column()))
+        if role == Qt.TextAlignmentRole and HISTORY_COLUMNS[index.column()] in NUMERIC_COLUMNS:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return TABLE_COLUMNS[section]
+        return str(section + 1)
+
+    def append_records(self, records: list):
+
+        """
+        Method for adding the batch of results to the table with one notification of the view
+
+        Parameters:
+        ----------
+        records: list
+            Results of the minimization problems (ResultRecord objects)
+        """
+
+        if not records:
+            return
+        first_new = len(self.history)
+        self.history.append_records(records)
+        if self.sort_column != NO_SORT_COLUMN or self.filter_pattern:
+            self.update_rows()  # new results must take their places among the old ones
+            return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(records) - 1)
+        self.rows.extend(range(first_new, len(self.history)))
+        self.endInsertRows()
+
+    def sort(self, column: int, order: int = Qt.AscendingOrder):
+        self.sort_column, self.sort_order = column, order
+        self.update_rows()
+
+    def set_filter(self, column: int, pattern: str):
+
+        """
+        Method for showing only the results whose value of the column matches the pattern
+
+        Parameters:
+        ----------
+        column: int
+            Index of the filtered column
+        pattern: str
+            Searched value (substring for text columns, number for numeric ones), empty string to show all results
+        """
+
+        self.filter_column, self.filter_pattern = column, pattern.strip()
+        self.update_rows()
+
+    def update_rows(self):
+
+        """
+        Method for recalculating the shown results after changing of the sorting or the filter
+        """
+
+        rows = self.history.filtered_rows(self.filter_column, self.filter_pattern)
+        if self.sort_column != NO_SORT_COLUMN:
+            rows = self.history.sorted_rows(rows, self.sort_column, self.sort_order == Qt.DescendingOrder)
+        self.beginResetModel()  # the number of shown rows may change, so the view is reset instead of relayout
+        self.rows = rows
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.history.clear()
+        self.rows = []
+        self.endResetModel()
@@ -0,0 +1,105 @@
+from PyQt5.QtWidgets import QDialog, QFormLayout, QLineEdit, QListWidget, QListWidgetItem, QCheckBox, \
+    QDialogButtonBox, QLabel
+from PyQt5.QtCore import Qt
+from backend.one_dimension_minimization import ONE_DIM_MINIMIZATION_METHODS
+from backend.parameter_sweep import ParameterSweep
+from backend.expression_compiler import ExpressionCompiler
+from backend.error_message import ErrorMessage
+
+SWEEP_WINDOW_TITLE = "Parameter sweep"
+EPS_VALUES_DEFAULT = "1e-2:1e-6:5"  # five accuracies from 0.01 to 1e-6 on the logarithmic scale
+VALUES_HINT = "list (1, 2, 3) or range (start:stop:count)"
+RENDER_CHECK_BOX_TEXT = "Export animation of every run"
+PROBLEMS_NUMBER_TEXT = "Number of problems: {}"
+NO_METHODS_ERROR = "At least one minimization method must be chosen"
+
+
+class SweepDialog(QDialog):
+
+    """
+    Dialog for entering the ranges or lists of the minimization problem parameters, whose cartesian product is solved
+    """
+
+    def __init__(self, function: str = "", left_bound: str = "", right_bound: str = "", parent=None):
+        QDialog.__init__(self, parent)
+        self.setWindowTitle(SWEEP_WINDOW_TITLE)
+        layout = QFormLayout(self)
+
+        self.function_edit = QLineEdit(function, self)
+        self.eps_edit = QLineEdit(EPS_VALUES_DEFAULT, self)
+        self.left_bounds_edit = QLineEdit(left_bound, self)
+        self.right_bounds_edit = QLineEdit(right_bound, self)
+        for edit in (self.eps_edit, self.left_bounds_edit, self.right_bounds_edit):
+            edit.setPlaceholderText(VALUES_HINT)
+            edit.textChanged.connect(self.update_problems_number)
+        self.function_edit.textChanged.connect(self.update_problems_number)
+
+        self.methods_list = QListWidget(self)
+        for name in ONE_DIM_MINIMIZATION_METHODS.keys():
+            item = QListWidgetItem(name, self.methods_list)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+        self.methods_list.itemChanged.connect(self.update_problems_number)
+
+        self.render_check_box = QCheckBox(RENDER_CHECK_BOX_TEXT, self)
+        self.problems_label = QLabel(self)
+        self.buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+
+        layout.addRow("Target function", self.function_edit)
+        layout.addRow("Accuracy", self.eps_edit)
+        layout.addRow("Left bounds", self.left_bounds_edit)
+        layout.addRow("Right bounds", self.right_bounds_edit)
+        layout.addRow("Methods", self.methods_list)
+        layout.addRow(self.render_check_box)
+        layout.addRow(self.problems_label)
+        layout.addRow(self.buttons)
+        self.update_problems_number()
+
+    def chosen_methods(self) -> list:
+        return [self.methods_list.item(row).text() for row in range(self.methods_list.count())
+                if self.methods_list.item(row).checkState() == Qt.Checked]
+
+    def problems(self) -> list:
+
+        """
+        Method for making all problems of the sweep from the entered values
+
+        Returns:
+        -------
+            List of SweepProblem objects, ValueError with the message for the user is raised if the input is incorrect
+        """
+
+        methods = self.chosen_methods()
+        if not methods:
+            raise ValueError(NO_METHODS_ERROR)
+        error_msg = ExpressionCompiler.check(self.function_edit.text())[1]
+        if error_msg:
+            raise ValueError(error_msg)
+        eps_values = ParameterSweep.parse_values(self.eps_edit.text(), logarithmic=True)
+        if min(eps_values) <= 0:
+            raise ValueError(ErrorMessage.ERROR_NOT_APPLICABLE_ACCURACY.value)
+        problems = ParameterSweep.make_problems(self.function_edit.text().strip(), eps_values,
+                                                ParameterSweep.parse_values(self.left_bounds_edit.text()),
+                                                ParameterSweep.parse_values(self.right_bounds_edit.text()),
+                                                methods)
+        if not problems:
+            raise ValueError(ErrorMessage.ERROR_INCORRECT_BOUNDS.value)
+        return problems
+
+    def update_problems_number(self):
+
+        """
+        Method for showing the number of problems of the sweep or the error of the input
+        """
+
+        try:
+            self.problems_label.setText(PROBLEMS_NUMBER_TEXT.format(len(self.problems())))
+            self.buttons.button(QDialogButtonBox.Ok).setEnabled(True)
+        except ValueError as error:
+            self.problems_label.setText(str(error))
+            self.buttons.button(QDialogButtonBox.Ok).setEnabled(False)
+
+    def render_animations(self) -> bool:
+        return self.render_check_box.isChecked()
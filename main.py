@@ -1,9 +1,55 @@
-from PyQt5 import QtWidgets
-from front.gui import AppWindow
+import argparse
+import sys
+from backend.startup_profile import STARTUP_PROFILE
 
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    ui = AppWindow()
+STARTUP_PROFILE_FLAG = "--startup-profile"
+SERVE_FLAG = "--serve"
+WORKERS_FLAG = "--workers"
+
+
+def print_startup_profile():
+    print(STARTUP_PROFILE.report(), flush=True)
+
+
+def main(arguments: list):
+
+    """
+    Function for starting the application
+
+    Parameters:
+    ----------
+    arguments: list
+        Command line arguments
+    """
+
+    parser = argparse.ArgumentParser(description="Optimization methods application")
+    parser.add_argument(STARTUP_PROFILE_FLAG, action="store_true",
+                        help="print durations of the import and initialization phases of the start")
+    parser.add_argument(SERVE_FLAG, type=int, metavar="PORT",
+                        help="run the JSON-over-HTTP minimization service on the port instead of the window")
+    parser.add_argument(WORKERS_FLAG, type=int, help="number of the solving processes of the service")
+    options, qt_arguments = parser.parse_known_args(arguments[1:])
+
+    if options.serve is not None:  # the service does not need Qt
+        from backend.minimization_service import serve
+        return serve(options.serve, options.workers)
+
+    with STARTUP_PROFILE.phase("import PyQt5"):
+        from PyQt5 import QtWidgets
+        from PyQt5.QtCore import QTimer
+    with STARTUP_PROFILE.phase("import front.gui"):
+        from front.gui import AppWindow
+
+    app = QtWidgets.QApplication(arguments[:1] + qt_arguments)
+    with STARTUP_PROFILE.phase("window construction"):
+        ui = AppWindow()
     ui.show()
-    sys.exit(app.exec_())
+    # the first timer event comes after the window is shown
+    QTimer.singleShot(0, lambda: STARTUP_PROFILE.mark("window shown"))
+    if options.startup_profile:
+        ui.warm_up_finished.connect(print_startup_profile)
+    return app.exec_()
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,87 @@
+import pytest
+from sympy import parse_expr
+from backend.analytic_minimization import AnalyticMinimization
+from backend.bracketing import Bracketing
+from backend.one_dimension_minimization import OneDimMinimization
+from backend.multi_dimension_minimization import METRICS_INDEX
+from tests.test_data import ONE_DIM_MINIMIZATION_DATA, Case
+
+SOLVED_PROBLEMS = [("(x - 1)**6", [-3, 4], 1.),  # repeated root of the derivative
+                   ("x**4 - 3*x**2 + x", [-2, 2], -1.3008395659415772),  # two local minima
+                   ("x**2", [1, 2], 1.),  # minimum at the end of the interval
+                   ("0.5*x**2 - x", [-3, 3], 1.),  # float coefficients
+                   ("exp(x) - 4*x", [0, 3], 1.3862943611198906),
+                   ("x*log(x)", [0.1, 1], 0.36787944117144233)]
+UNSOLVED_PROBLEMS = [("Abs(x - 0.3) + x**2", [0, 1]),  # derivative is not defined at the minimum
+                     ("1/x", [-1, 1]),  # function is not continuous
+                     ("Max(x, 1) + sin(x)", [0, 3])]
+
+
+@pytest.mark.parametrize("case", ONE_DIM_MINIMIZATION_DATA[::3], ids=str)
+def test_test_functions(case: Case) -> None:
+
+    """
+    Testing that the test functions are solved with the accuracy of the iterative methods, the non-smooth ones by
+     the iterative method
+    """
+
+    results = AnalyticMinimization.analytic_first(OneDimMinimization.golden_ratio_method)(parse_expr(case.func),
+                                                                                          case.interval, case.accuracy)
+    assert float(results[0]) == pytest.approx(case.expected, abs=max(case.accuracy, 1e-6))
+    analytic = len(results) > METRICS_INDEX and results[METRICS_INDEX]["analytic"]
+    assert analytic == ("Abs" not in case.func)
+    assert len(results[2]) == 1 if analytic else len(results[2]) > 1
+
+
+@pytest.mark.parametrize("func, interval, expected", SOLVED_PROBLEMS)
+def test_solved_problems(func: str, interval: list, expected: float) -> None:
+
+    """
+    Testing that the minimum is found exactly among the critical points and the ends of the interval
+    """
+
+    results = AnalyticMinimization.minimize(parse_expr(func), interval)
+    assert results[0] == pytest.approx(expected, abs=1e-12)
+    assert results[METRICS_INDEX]["iterations"] == 0
+    assert AnalyticMinimization.minimize(parse_expr(func), interval) == results
+
+
+@pytest.mark.parametrize("func, interval", UNSOLVED_PROBLEMS)
+def test_unsolved_problems(func: str, interval: list) -> None:
+
+    """
+    Testing that the non-smooth and discontinuous functions are left to the iterative methods
+    """
+
+    assert AnalyticMinimization.minimize(parse_expr(func), interval) is None
+
+
+def test_with_bracketing() -> None:
+
+    """
+    Testing that the analytic solution is found in the bracket and both metrics are reported
+    """
+
+    method = Bracketing.bracketed(AnalyticMinimization.analytic_first(OneDimMinimization.fibonacci_method))
+    results = method(parse_expr("(x - 37)**2"), [0], 1e-6)
+    assert results[0] == pytest.approx(37, abs=1e-9)
+    assert results[METRICS_INDEX]["analytic"] and results[METRICS_INDEX]["bracketing_evaluations"] > 0
+
+
+def test_solving_budget_enforced(monkeypatch) -> None:
+
+    """
+    Testing that the solving process which did not answer in time is terminated instead of solving in background,
+     and the next function is solved by the new process
+    """
+
+    AnalyticMinimization.solve_in_time(parse_expr("exp(x) - 2*x"), 0., 2.)  # the process is started and kept
+    process = AnalyticMinimization.solver[0]
+    monkeypatch.setattr("backend.analytic_minimization.SOLVING_TIME_BUDGET", 0.)
+    assert AnalyticMinimization.solve_in_time(parse_expr("sin(x)*exp(x) + cos(3*x)"), 0., 5.) is None
+    assert AnalyticMinimization.solver is None and not process.is_alive()
+
+    monkeypatch.undo()
+    points = AnalyticMinimization.solve_in_time(parse_expr("exp(x) - 3*x"), 0., 2.)
+    assert points == pytest.approx((1.0986122886681098,))
+    assert AnalyticMinimization.solver[0].is_alive()
@@ -0,0 +1,104 @@
+import importlib.util
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+from sympy import parse_expr
+from backend.one_dimension_minimization import OneDimMinimization
+from backend.plane_minimization_drawer import PlaneMinimizationDrawer
+from backend.animation_writer import AnimationWriter, AnimationFormat, RENDER_PRESETS, TRANSPARENT_INDEX, MP4_PLUGIN
+from backend.gif_maker import GifMaker
+
+ANIMATION_FRAMES = 6
+
+
+@pytest.fixture
+def frames_paths(tmp_path) -> list:
+    func = parse_expr("sin(x)")
+    results = OneDimMinimization.golden_ratio_method(func, [3, 5], 1e-3)
+    with PlaneMinimizationDrawer(func, [3, 5], images_folder=str(tmp_path), render_preset="draft") as drawer:
+        return drawer.draw_minimization(*results, max_frames=ANIMATION_FRAMES)
+
+
+def test_gif_frames_are_restored_exactly(frames_paths: list, tmp_path) -> None:
+
+    """
+    Testing that the GIF with delta frames is decoded into the frames quantized with the global palette
+    """
+
+    frames = [AnimationWriter.to_rgb(np.asarray(Image.open(path))) for path in frames_paths]
+    gif_path = GifMaker.create_gif_result(frames_paths, str(tmp_path))
+
+    palette = AnimationWriter.build_global_palette(frames)
+    expected = [np.asarray(Image.fromarray(frame).quantize(palette=palette, dither=Image.Dither.NONE).convert("RGB"))
+                for frame in frames]
+    with Image.open(gif_path) as gif:
+        decoded = [np.asarray(frame.convert("RGB")) for frame in ImageSequence.Iterator(gif)]
+
+    assert len(decoded) == len(expected)
+    for decoded_frame, expected_frame in zip(decoded, expected):
+        assert (decoded_frame == expected_frame).all()
+
+
+def test_delta_frame_keeps_only_changes() -> None:
+
+    """
+    Testing that the pixels which did not change since the previous frame become transparent
+    """
+
+    previous = np.zeros((4, 4), dtype=np.uint8)
+    current = previous.copy()
+    current[1, 2] = 7
+    palette = AnimationWriter.build_global_palette([np.zeros((4, 4, 3), dtype=np.uint8)])
+
+    delta = np.asarray(AnimationWriter.delta_frame(previous, current, palette))
+    assert delta[1, 2] == 7
+    assert (delta == TRANSPARENT_INDEX).sum() == delta.size - 1
+
+
+def test_webp_animation(frames_paths: list, tmp_path) -> None:
+
+    """
+    Testing writing of the animation in the WebP format
+    """
+
+    path = GifMaker.create_gif_result(frames_paths, str(tmp_path), AnimationFormat.WEBP)
+    assert path.endswith(AnimationFormat.WEBP.value)
+    with Image.open(path) as animation:
+        assert animation.n_frames == len(frames_paths)
+
+
+def test_existing_result_name(frames_paths: list, tmp_path) -> None:
+
+    """
+    Testing that the error about the existing result names the given result file
+    """
+
+    (tmp_path / "custom_result").mkdir()
+    with pytest.raises(NameError, match="<custom_result>"):
+        GifMaker.create_gif_result(frames_paths, str(tmp_path), result_name="custom_result")
+
+
+@pytest.mark.skipif(importlib.util.find_spec(MP4_PLUGIN) is not None, reason="video plugin is installed")
+def test_mp4_requires_plugin(frames_paths: list, tmp_path) -> None:
+
+    """
+    Testing that writing the video without the optional plugin raises an understandable error
+    """
+
+    with pytest.raises(ImportError):
+        GifMaker.create_gif_result(frames_paths, str(tmp_path), AnimationFormat.MP4)
+
+
+@pytest.mark.parametrize('preset', RENDER_PRESETS.keys())
+def test_render_presets(preset: str, tmp_path) -> None:
+
+    """
+    Testing that the frames are rendered in the resolution of the preset
+    """
+
+    with PlaneMinimizationDrawer(parse_expr("x**2"), [-2, 2], images_folder=str(tmp_path),
+                                 render_preset=preset) as drawer:
+        path = drawer.draw_result_image(1, 0., 0.)
+    width, height = Image.open(path).size
+    assert (width, height) == tuple(round(side * RENDER_PRESETS[preset].dpi)
+                                    for side in RENDER_PRESETS[preset].figure_size)
@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from sympy import parse_expr
+from backend.async_solver import AsyncSolver, SolverOverloaded, SOLVER_METHODS
+from backend.expression_compiler import ExpressionCompiler
+from backend.error_message import ErrorMessage
+
+WORKERS_NUMBER = 2
+ASYNC_PROBLEMS = [("sin(x)", [3, 5], 1e-4, "Golden Ratio Method", ""),
+                  ("(x - 1)**2 + (y + 0.5)**2 + x*y/2", [-2, 2], 1e-5, "BFGS Method", ""),
+                  ("x**2 + y**2", [-2, 2], 1e-5, "Augmented Lagrangian Method", "x + y >= 1"),
+                  ("x**2 + y**2 + z**2", [-1, 2], 1e-4, "Nelder-Mead Method", "")]
+LONG_PROBLEM = ("20 + x**2 - 10*cos(2*pi*x) + y**2 - 10*cos(2*pi*y) + z**2", [-5, 5], 0.,
+                "Differential Evolution Method")  # the population never collapses to a point, so it runs long
+
+
+@pytest.fixture(scope="module")
+def solver():
+    solver = AsyncSolver(max_workers=WORKERS_NUMBER)
+    yield solver
+    solver.close()
+
+
+def solve_directly(function: str, interval: list, eps: float, method: str, constraints: str) -> list:
+    constraints = ExpressionCompiler.parse_constraints(constraints, 3)
+    options = {"constraints": constraints} if constraints else {}
+    return SOLVER_METHODS[method](parse_expr(function), interval, eps, **options)
+
+
+def test_concurrent_solves(solver: AsyncSolver) -> None:
+
+    """
+    Testing that the problems awaited at once are solved in the pool with the same results as the direct calls
+    """
+
+    async def solve_all() -> list:
+        return await asyncio.gather(*(solver.solve(*problem) for problem in ASYNC_PROBLEMS))
+
+    for results, problem in zip(asyncio.run(solve_all()), ASYNC_PROBLEMS):
+        expected = solve_directly(*problem)
+        assert results[0] == pytest.approx(expected[0])
+        assert results[1] == pytest.approx(float(expected[1]))
+        assert len(results[2]) == len(expected[2])
+
+
+def test_iterations_stream(solver: AsyncSolver) -> None:
+
+    """
+    Testing that the iterations are read while the problem is solved and the result is got after them
+    """
+
+    async def read_stream() -> tuple:
+        stream = solver.iterate(*ASYNC_PROBLEMS[1])
+        return [iteration async for iteration in stream], await stream
+
+    iterations, results = asyncio.run(read_stream())
+    assert [iter_num for iter_num, _ in iterations] == sorted(results[2].keys())[1:]
+    assert [bounds for _, bounds in iterations] == [results[2][iter_num] for iter_num, _ in iterations]
+
+
+def test_cancellation(solver: AsyncSolver) -> None:
+
+    """
+    Testing that the cancelled request stops the solving process and frees it for the next requests
+    """
+
+    async def cancel_long_solve() -> list:
+        stream = solver.iterate(*LONG_PROBLEM)
+        await stream.__anext__()
+        stream.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stream
+        return await asyncio.wait_for(asyncio.gather(*(solver.solve(*ASYNC_PROBLEMS[0])
+                                                       for _ in range(WORKERS_NUMBER))), timeout=10)
+
+    for results in asyncio.run(cancel_long_solve()):
+        assert results[0] == pytest.approx(solve_directly(*ASYNC_PROBLEMS[0])[0])
+
+
+def test_waiting_requests_limit() -> None:
+
+    """
+    Testing that the requests beyond the limit of the waiting ones are rejected at once
+    """
+
+    async def overload() -> list:
+        async with AsyncSolver(max_workers=1, max_pending=1) as solver:
+            return await asyncio.gather(*(solver.solve(*ASYNC_PROBLEMS[0]) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(overload())
+    assert [isinstance(result, SolverOverloaded) for result in results] == [False, False, True]
+
+
+def test_incorrect_requests(solver: AsyncSolver) -> None:
+
+    """
+    Testing that the errors of the problem are raised by the awaited request
+    """
+
+    with pytest.raises(ValueError, match=ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION.value):
+        asyncio.run(solver.solve("sin(x", [3, 5], 1e-3, "Golden Ratio Method"))
+    with pytest.raises(ValueError, match=ErrorMessage.ERROR_TOO_MUCH_BOUNDS.value):
+        asyncio.run(solver.solve("sin(x)", [3, 4, 5], 1e-3, "Golden Ratio Method"))
+    with pytest.raises(ValueError):
+        asyncio.run(solver.solve("sin(x)", [3, 5], 1e-3, "Unknown Method"))
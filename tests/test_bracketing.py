@@ -0,0 +1,56 @@
+import pytest
+from math import log
+from sympy import parse_expr
+from backend.bracketing import Bracketing, MAX_BRACKETING_EVALUATIONS
+from backend.one_dimension_minimization import OneDimMinimization, ONE_DIM_MINIMIZATION_METHODS, EMPTY_STR
+from backend.multi_dimension_minimization import METRICS_INDEX
+from backend.error_message import ErrorMessage
+
+BRACKETING_PROBLEMS = [("(x - 37)**2", [0], 37.),  # single starting point far from the minimum
+                       ("(x + 5)**2 + 1", [10, 11], -5.),  # minimum on the other side of the entered interval
+                       ("exp(x) - 4*x", [5, 6], log(4)),  # badly chosen interval to the right of the minimum
+                       ("x*log(x)", [0.1, 0.2], 1 / 2.718281828459045)]
+ACCURACY = 1e-6
+
+
+@pytest.mark.parametrize("func, interval, expected", BRACKETING_PROBLEMS)
+@pytest.mark.parametrize("name", ONE_DIM_MINIMIZATION_METHODS.keys())
+def test_bracketed_methods(func: str, interval: list, expected: float, name: str) -> None:
+
+    """
+    Testing that every one-dimensional method finds the minimum outside the entered interval and the evaluations
+     of the bracket search are reported in the metrics
+    """
+
+    results = Bracketing.bracketed(ONE_DIM_MINIMIZATION_METHODS[name])(parse_expr(func), interval, ACCURACY)
+    metrics = results[METRICS_INDEX]
+    assert float(results[0]) == pytest.approx(expected, abs=10 * ACCURACY)
+    assert metrics["bracket"][0] < expected < metrics["bracket"][1]
+    assert 0 < metrics["bracketing_evaluations"] < MAX_BRACKETING_EVALUATIONS
+    assert metrics["iterations"] == max(results[2].keys())
+
+
+def test_bracket_points() -> None:
+
+    """
+    Testing that the middle point of the found bracket has the smallest value
+    """
+
+    values = []
+    bracket = Bracketing.find_bracket(lambda x: values.append(x) or (x - 3) ** 4, -10, -9)
+    assert bracket.left < bracket.middle < bracket.right
+    assert (bracket.middle - 3) ** 4 <= min((bracket.left - 3) ** 4, (bracket.right - 3) ** 4)
+    assert bracket.evaluations == len(values)
+
+
+@pytest.mark.parametrize("func, interval", [("x", [0]), ("-x**2", [1, 2]), ("sqrt(x)", [1, 0.5])])
+def test_minimum_not_bracketed(func: str, interval: list) -> None:
+
+    """
+    Testing that the functions without the minimum (or leaving their domain) are reported
+    """
+
+    OneDimMinimization.error_msg = EMPTY_STR
+    assert Bracketing.bracketed(OneDimMinimization.golden_ratio_method)(parse_expr(func), interval, ACCURACY) == []
+    assert OneDimMinimization.error_msg == ErrorMessage.ERROR_BRACKET_NOT_FOUND.value
+    OneDimMinimization.error_msg = EMPTY_STR
@@ -0,0 +1,98 @@
+import pytest
+from sympy import parse_expr
+from backend.constrained_minimization import ConstrainedMinimization, CONSTRAINED_MINIMIZATION_METHODS, \
+    compile_problem
+from backend.multi_dimension_minimization import MultiDimMinimization
+from backend.expression_compiler import ExpressionCompiler
+
+CONSTRAINED_CASES = [("(x - 2)**2 + (y - 2)**2", "x + y <= 2", (1., 1.)),
+                     ("x**2 + y**2", "x + y >= 1", (0.5, 0.5)),
+                     ("(x - 1)**2 + (y + 0.5)**2 + (z - 0.3)**2", "x**2 + y**2 + z**2 <= 0.25; z >= 0.2",
+                      (0.4099, -0.2049, 0.2))]
+ACCURACY = 1e-5
+EXPECTED_ACCURACY = 1e-3
+
+
+@pytest.mark.parametrize('method', CONSTRAINED_MINIMIZATION_METHODS.values(),
+                         ids=CONSTRAINED_MINIMIZATION_METHODS.keys())
+@pytest.mark.parametrize('func, constraints, expected', CONSTRAINED_CASES)
+def test_constrained_methods(method, func: str, constraints: str, expected: tuple) -> None:
+
+    """
+    Testing that the constrained methods find the minimum on the border of the feasible set, report the boxes of
+     all unconstrained problems and the violations of the constraints
+    """
+
+    iterations = []
+    constraints = ExpressionCompiler.parse_constraints(constraints, len(expected))
+    results = method(parse_expr(func), [-2, 2], ACCURACY, on_iteration=lambda *args: iterations.append(args),
+                     constraints=constraints)
+    assert results[0] == pytest.approx(expected, abs=EXPECTED_ACCURACY)
+    assert results[1] == pytest.approx(float(parse_expr(func).subs(zip("xyz", results[0]))))
+    metrics = results[3]
+    # initial boxes of the unconstrained problems are not reported, the numbers continue through all problems
+    assert len(results[2]) == len(iterations) + metrics["outer_iterations"]
+    numbers = [iteration[0] for iteration in iterations]
+    assert numbers == sorted(set(numbers)) and set(numbers) <= set(results[2].keys())
+    assert len(metrics["violations"]) == len(constraints)
+    assert metrics["max_violation"] <= ACCURACY
+    assert metrics["outer_iterations"] > 1 and metrics["evaluations"] > 0
+
+
+def test_inner_method() -> None:
+
+    """
+    Testing that any unconstrained multivariate method can solve the subproblems
+    """
+
+    constraints = ExpressionCompiler.parse_constraints("x + y >= 1", 2)
+    results = ConstrainedMinimization.augmented_lagrangian_method(
+        parse_expr("x**2 + y**2"), [-2, 2], ACCURACY, constraints=constraints,
+        inner_method=MultiDimMinimization.nelder_mead_method)
+    assert results[0] == pytest.approx((0.5, 0.5), abs=EXPECTED_ACCURACY)
+    assert results[3]["gradient_evaluations"] == 0
+    assert results[3]["multipliers"] == pytest.approx([1.], abs=EXPECTED_ACCURACY)
+
+
+def test_infeasible_constraints() -> None:
+
+    """
+    Testing that the violation of the constraints which can not be satisfied in the box is reported in the metrics
+    """
+
+    constraints = ExpressionCompiler.parse_constraints("x >= 5", 2)
+    results = ConstrainedMinimization.penalty_method(parse_expr("x**2 + y**2"), [-2, 2], ACCURACY,
+                                                     constraints=constraints)
+    assert results[0] == pytest.approx((2., 0.), abs=EXPECTED_ACCURACY)
+    assert results[3]["max_violation"] == pytest.approx(3., abs=EXPECTED_ACCURACY)
+
+
+@pytest.mark.parametrize('method', CONSTRAINED_MINIMIZATION_METHODS.values(),
+                         ids=CONSTRAINED_MINIMIZATION_METHODS.keys())
+@pytest.mark.parametrize('constraints', ["", "x <= 0.5"])
+def test_constant_objective(method, constraints: str) -> None:
+
+    """
+    Testing that the constant target function is minimized with and without the constraints
+    """
+
+    constraints = ExpressionCompiler.parse_constraints(constraints, 1) if constraints else ()
+    results = method(parse_expr("5"), [-1, 1], ACCURACY, constraints=constraints)
+    assert results[1] == pytest.approx(5.)
+    assert not constraints or results[0][0] <= 0.5 + ACCURACY
+
+
+def test_problem_is_compiled_once() -> None:
+
+    """
+    Testing that the target function and the constraints are compiled together once per problem, including the
+     variables which appear only in the constraints
+    """
+
+    func, constraints = parse_expr("x**2"), ExpressionCompiler.parse_constraints("y >= 1 - x", 2)
+    compile_problem.cache_clear()
+    for method in CONSTRAINED_MINIMIZATION_METHODS.values():
+        results = method(func, [-2, 2], ACCURACY, constraints=constraints)
+        assert results[0][1] >= 1 - results[0][0] - ACCURACY
+    assert compile_problem.cache_info().misses == 1
+    assert [str(variable) for variable in compile_problem(func, constraints)[0]] == ["x", "y"]
@@ -0,0 +1,234 @@
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sympy import parse_expr
+from backend.gif_maker import GifMaker
+from backend.figure_pool import FIGURE_POOL
+from backend.one_dimension_minimization import OneDimMinimization
+from backend.frame_selection import FrameSelector, FrameSelectionPolicy
+from backend.plane_minimization_drawer import PlaneMinimizationDrawer, POINTS_NUMBER, ZOOM_POINTS_NUMBER
+from backend.multi_dimension_minimization import MultiDimMinimization
+from backend.space_minimization_drawer import SpaceMinimizationDrawer
+
+LONG_RUN_EPS = 1e-10
+FRAMES_LIMIT = 10
+MEMORY_TEST_PROBLEMS = 200
+MEMORY_WARM_UP_PROBLEMS = 20
+MEMORY_GROWTH_LIMIT = 30 * 2**20  # bytes of resident memory the long run of rendering may add after warm-up
+SPACE_PROBLEMS = [("(x - 1)**2 + 2*(y + 0.5)**2 + x*y", False), ("(x - 1)**2 + 2*(y + 0.5)**2 + x*y", True),
+                  ("(x - 1)**2 + (y + 0.5)**2 + (z - 0.3)**2", False)]  # functions and whether surface is drawn
+CONCURRENT_PROBLEMS = [("x**2", [-2, 2]), ("sin(x)", [3, 5]), ("Abs(x)", [0, 1]), ("exp(x) - 2*x", [0, 2])]
+
+
+@pytest.fixture
+def long_run_borders() -> dict:
+    return OneDimMinimization.golden_ratio_method(parse_expr("sin(x)"), [3, 5], LONG_RUN_EPS)[2]
+
+
+@pytest.mark.parametrize('policy', list(FrameSelectionPolicy), ids=str)
+def test_frames_are_capped(long_run_borders: dict, policy: FrameSelectionPolicy) -> None:
+
+    """
+    Testing that the number of frames does not exceed the limit and the first and last iterations are always drawn
+    """
+
+    frames = FrameSelector.select_frames(long_run_borders, policy, FRAMES_LIMIT, pixel_size=1e-3)
+    iterations = sorted(long_run_borders.keys())
+    assert len(frames) <= FRAMES_LIMIT
+    assert frames == sorted(set(frames))
+    assert frames[0] == iterations[0] and frames[-1] == iterations[-1]
+
+
+def test_pixel_change_skips_invisible_iterations(long_run_borders: dict) -> None:
+
+    """
+    Testing that iterations on which the borders moved less than one pixel are not drawn
+    """
+
+    pixel_size = 1e-2
+    frames = FrameSelector.select_frames(long_run_borders, FrameSelectionPolicy.PIXEL_CHANGE, pixel_size=pixel_size)
+    assert len(frames) < len(long_run_borders)
+    for previous, current in zip(frames[:-2], frames[1:-1]):
+        moves = [abs(a - b) for a, b in zip(long_run_borders[previous], long_run_borders[current])]
+        assert max(moves) >= pixel_size
+
+
+def test_logarithmic_frames_are_denser_at_start(long_run_borders: dict) -> None:
+
+    """
+    Testing that the logarithmic policy keeps more of the early iterations than of the late ones
+    """
+
+    frames = FrameSelector.select_frames(long_run_borders, FrameSelectionPolicy.LOGARITHMIC, FRAMES_LIMIT)
+    middle = len(long_run_borders) // 2
+    assert len([frame for frame in frames if frame < middle]) > len([frame for frame in frames if frame >= middle])
+
+
+def test_zoom_view_follows_interval(long_run_borders: dict) -> None:
+
+    """
+    Testing that the zooming view contains the current interval and shrinks together with it
+    """
+
+    drawer = PlaneMinimizationDrawer(parse_expr("sin(x)"), [3, 5], zoom=True)
+    last_iteration = max(long_run_borders.keys())
+    widths = []
+    for iteration in (0, last_iteration):
+        drawer.update_bounds(list(long_run_borders[iteration]))
+        view = drawer.zoom_interval()
+        assert view[0] < long_run_borders[iteration][0] < long_run_borders[iteration][1] < view[1]
+        widths.append(view[1] - view[0])
+    assert widths[1] < widths[0] * LONG_RUN_EPS
+
+
+def test_zoomed_frame_is_drawn_in_current_interval(long_run_borders: dict) -> None:
+
+    """
+    Testing that the zooming frame resamples the function only inside the current interval
+    """
+
+    drawer = PlaneMinimizationDrawer(parse_expr("sin(x)"), [3, 5], zoom=True)
+    drawer.update_bounds(list(long_run_borders[max(long_run_borders.keys())]))
+    view = drawer.zoom_interval()
+    drawer.draw_zoomed_iteration(max(long_run_borders.keys()))
+
+    graph = drawer.axes.get_lines()[0].get_xdata()
+    assert len(graph) == ZOOM_POINTS_NUMBER
+    assert graph[0] == view[0] and graph[-1] == view[-1]
+    assert drawer.axes.get_xlim() == view
+    assert len(drawer.x_values) == POINTS_NUMBER  # graph over the initial interval is kept for the result image
+
+
+def render_animation(task: tuple) -> str:
+
+    """
+    Helper for rendering an animation of the golden ratio method into a separate directory
+    """
+
+    func, interval, folder = parse_expr(task[0]), task[1], task[2]
+    results = OneDimMinimization.golden_ratio_method(func, interval, 1e-3)
+    with PlaneMinimizationDrawer(func, interval, images_folder=folder) as drawer:
+        return GifMaker.create_gif_result(drawer.draw_minimization(*results, max_frames=FRAMES_LIMIT), folder)
+
+
+def test_concurrent_rendering(tmp_path) -> None:
+
+    """
+    Testing that several animations can be rendered at once in a thread pool
+    """
+
+    tasks = []
+    for index, (func, interval) in enumerate(CONCURRENT_PROBLEMS):
+        folder = str(tmp_path / "animation_{}".format(index))
+        os.mkdir(folder)
+        tasks.append((func, interval, folder))
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        gifs = list(executor.map(render_animation, tasks))
+
+    for gif, task in zip(gifs, tasks):
+        assert os.path.dirname(gif) == task[2]
+        assert os.path.getsize(gif) > 0
+        # every animation got its own frames without overwriting the frames of the others
+        assert len(os.listdir(task[2])) > 2
+
+
+def test_result_without_intervals(tmp_path) -> None:
+
+    """
+    Testing that only the result is drawn when the minimization has no uncertainty intervals
+    """
+
+    with PlaneMinimizationDrawer(parse_expr("x**2"), [-1, 1], images_folder=str(tmp_path)) as drawer:
+        images = drawer.draw_minimization(0., 0.)
+    assert len(images) == 1 and os.path.isfile(images[0])
+
+
+def resident_memory() -> int:
+
+    """
+    Helper for getting the resident memory of the current process in bytes
+    """
+
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="resident memory is read from procfs")
+def test_memory_is_bounded_over_many_runs(tmp_path) -> None:
+
+    """
+    Testing that rendering hundreds of problems one after another does not accumulate figures in memory
+    """
+
+    def render(index: int):
+        func = parse_expr("x**2 + {}*x".format(index % 7))
+        with PlaneMinimizationDrawer(func, [-5, 5], images_folder=str(tmp_path)) as drawer:
+            drawer.draw_result_image(index, 0., 0.)
+
+    for index in range(MEMORY_WARM_UP_PROBLEMS):
+        render(index)
+    memory_after_warm_up = resident_memory()
+    for index in range(MEMORY_TEST_PROBLEMS):
+        render(index)
+
+    assert resident_memory() - memory_after_warm_up < MEMORY_GROWTH_LIMIT
+    assert len(FIGURE_POOL.figures) <= FIGURE_POOL.max_size
+
+
+def test_drawer_returns_figure_to_pool() -> None:
+
+    """
+    Testing that the figure of the drawer is reused by the next drawer after the context is closed
+    """
+
+    with PlaneMinimizationDrawer(parse_expr("x**2"), [-2, 2]) as drawer:
+        figure = drawer.fig
+    assert drawer.fig is None
+    with PlaneMinimizationDrawer(parse_expr("sin(x)"), [3, 5]) as drawer:
+        assert drawer.fig is figure
+        assert len(figure.axes) == 1
+
+
+@pytest.mark.parametrize('func, surface', SPACE_PROBLEMS)
+def test_space_drawer_renders_gif(tmp_path, func: str, surface: bool) -> None:
+
+    """
+    Testing that the minimization of a function of several variables is rendered into the gif, the function is
+     sampled only once and the overlay of every frame is removed after saving
+    """
+
+    func, interval = parse_expr(func), [-2, 2]
+    results = MultiDimMinimization.coordinate_descent_method(func, interval, 1e-3)
+    with SpaceMinimizationDrawer(func, interval, surface=surface, images_folder=str(tmp_path)) as drawer:
+        drawer.draw_minimization(*results[:3])  # only the function layer is sampled for the slice at the optimum
+        grid = drawer.grid
+        images = drawer.draw_minimization(*results[:3], frame_policy=FrameSelectionPolicy.PIXEL_CHANGE,
+                                          max_frames=FRAMES_LIMIT)
+        assert drawer.grid is grid
+        assert not drawer.overlay
+        gif = GifMaker.create_gif_result(images, str(tmp_path))
+    assert 1 < len(images) <= FRAMES_LIMIT + 1
+    assert os.path.getsize(gif) > 0
+
+
+def test_pixel_change_of_boxes() -> None:
+
+    """
+    Testing that the boxes of the multivariate methods are drawn only when one of their corners moved by a pixel
+    """
+
+    pixel_size = 0.1
+    borders = {0: ((0., 0.), (1., 1.)), 1: ((0., 0.05), (1., 1.)), 2: ((0., 0.2), (1., 1.)), 3: ((0., 0.2), (1., .9))}
+    frames = FrameSelector.select_frames(borders, FrameSelectionPolicy.PIXEL_CHANGE, pixel_size=pixel_size)
+    assert frames == [0, 2, 3]
+
+
+def test_space_drawer_rejects_function_of_one_variable() -> None:
+
+    """
+    Testing that the function of one variable is left to the plane drawer
+    """
+
+    with pytest.raises(ValueError):
+        SpaceMinimizationDrawer(parse_expr("x**2"), [-2, 2])
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from backend.expression_compiler import ExpressionCompiler
+from backend.error_message import ErrorMessage
+
+
+def test_compiled_function_is_cached() -> None:
+
+    """
+    Testing that the compiled function calculates the target function and is not compiled twice
+    """
+
+    compiled = ExpressionCompiler.compile("x**2 - 2*x", 1)
+    assert np.allclose(compiled.numeric_func(np.array([0., 1., 3.])), [0., -1., 3.])
+    assert ExpressionCompiler.compile("x**2 - 2*x", 1) is compiled
+
+
+@pytest.mark.parametrize('text, error', [("sin(x", ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION),
+                                         ("", ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION),
+                                         ("x > 1", ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION),
+                                         ("x * y", ErrorMessage.ERROR_INCORRECT_DIMENSION)])
+def test_incorrect_functions(text: str, error: ErrorMessage) -> None:
+
+    """
+    Testing the error messages of incorrect target functions
+    """
+
+    compiled, error_msg = ExpressionCompiler.check(text, 1)
+    assert compiled is None
+    assert error_msg.startswith(error.value)
+
+
+def test_constraints_parsing() -> None:
+
+    """
+    Testing that the inequalities separated by semicolons are parsed and the incorrect constraints are reported
+    """
+
+    constraints = ExpressionCompiler.parse_constraints("x + y >= 1; x**2 + y**2 < 4;", 2)
+    assert [constraint.rel_op for constraint in constraints] == [">=", "<"]
+    assert ExpressionCompiler.parse_constraints("", 2) == ()
+    for text, error in [("x = 1", ErrorMessage.ERROR_INCORRECT_CONSTRAINTS),
+                        ("Eq(x, 1)", ErrorMessage.ERROR_INCORRECT_CONSTRAINTS),
+                        ("2 > 1", ErrorMessage.ERROR_INCORRECT_CONSTRAINTS),
+                        ("x + y + z <= 1", ErrorMessage.ERROR_INCORRECT_DIMENSION)]:
+        with pytest.raises(ValueError, match=error.value):
+            ExpressionCompiler.parse_constraints(text, 2)
+
+
+def test_common_subexpressions_elimination() -> None:
+
+    """
+    Testing that the function compiled with the common subexpressions calculated once gives the same values in the
+     same structure as the expressions
+    """
+
+    from sympy import symbols, exp, sin, cos, lambdify
+
+    x, y = symbols("x y")
+    func = exp(-x**2 - y**2) * sin(x * y) + exp(-x**2 - y**2) * cos(x * y)
+    gradient = [[func.diff(x)], [func.diff(y)]]
+    points = np.random.default_rng(1).uniform(-2, 2, (2, 50))
+    assert np.allclose(ExpressionCompiler.lambdify((x, y), func)(*points), lambdify((x, y), func)(*points))
+    assert np.allclose(ExpressionCompiler.lambdify((x, y), gradient)(*points), lambdify((x, y), gradient)(*points))
+
+
+def test_simplification() -> None:
+
+    """
+    Testing that the function is simplified only on request and only if it becomes shorter
+    """
+
+    from sympy import count_ops, parse_expr
+
+    text = "sin(x)**2 + cos(x)**2 + x*(x + 1) - x"
+    assert ExpressionCompiler.compile(text, 1).expr == parse_expr(text)
+    simplified = ExpressionCompiler.compile(text, 1, simplify=True)
+    assert count_ops(simplified.expr) < count_ops(parse_expr(text)) and simplified.text == text
+    assert np.allclose(simplified.numeric_func(np.array([0., 1., 2.])), [1., 2., 5.])
+    assert ExpressionCompiler.simplify(parse_expr("x + y")) == parse_expr("x + y")
@@ -1,10 +1,30 @@
+import os
+import pytest
 from PyQt5.QtWidgets import QLabel, QPushButton, QTextEdit
 # from PyQt5 import QtWidgets
 # import sys
 from PyQt5.QtCore import Qt
+from sympy import parse_expr
 from front.gui import AppWindow
+from front.minimization_worker import MinimizationJob, MinimizationWorker
+from front.results_table_model import ResultsTableModel, TABLE_COLUMNS
+from backend.one_dimension_minimization import OneDimMinimization, ONE_DIM_MINIMIZATION_METHODS
+from backend.results_history import ResultRecord
+from backend.error_message import ErrorMessage
+from backend.parameter_sweep import ParameterSweep
 from tests.test_front_data import LABELS_TEXT, BUTTONS_TEXT, EDITS_TEXT, RESULT
 
+SOLUTION_TIMEOUT = 10000  # milliseconds
+LIVE_ANIMATION_TIMEOUT = 10000
+GIF_EXPORT_TIMEOUT = 30000
+QUEUED_EPSILON = "0.001"
+VALIDATION_TIMEOUT = 5000
+SWEEP_TIMEOUT = 60000  # processes of the pool are spawned, which takes a few seconds
+
+
+def table_cell(app: AppWindow, row: int, column: int) -> str:
+    return app.results_model.data(app.results_model.index(row, column))
+
 
 def test_correct_input(qtbot):
 
@@ -24,16 +44,18 @@ def test_correct_input(qtbot):
     for editor in line_edits:
         editor.setText(EDITS_TEXT[editor.objectName()])
 
-    qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
-    assert test_app.results_table.rowCount() == 1
+    # problem is solved in background, so the result appears in the table after the queue becomes idle
+    with qtbot.waitSignal(test_app.job_queue.idle, timeout=SOLUTION_TIMEOUT):
+        qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    assert test_app.results_model.rowCount() == 1
 
     concatenated_interval = "[" + test_app.bound_left.toPlainText() + ", " + test_app.right_bound.toPlainText() + "]"
 
     # processing each table cell manually so as not to write an interval gluer into one line of two numbers
-    assert test_app.results_table.item(0, 0).text() == EDITS_TEXT[test_app.edit_target_function.objectName()]
-    assert test_app.results_table.item(0, 1).text() == concatenated_interval
-    assert test_app.results_table.item(0, 2).text() == EDITS_TEXT[test_app.edit_epsilon.objectName()]
-    assert float(test_app.results_table.item(0, 3).text()) - RESULT < float(test_app.edit_epsilon.toPlainText())
+    assert table_cell(test_app, 0, 0) == EDITS_TEXT[test_app.edit_target_function.objectName()]
+    assert table_cell(test_app, 0, 1) == concatenated_interval
+    assert table_cell(test_app, 0, 2) == EDITS_TEXT[test_app.edit_epsilon.objectName()]
+    assert float(table_cell(test_app, 0, 3)) - RESULT < float(test_app.edit_epsilon.toPlainText())
 
 
 def test_initializing_app():
@@ -53,3 +75,320 @@ def test_initializing_app():
     for btn in buttons:
         assert btn.text() == BUTTONS_TEXT[btn.objectName()]
 
+
+def test_live_animation(qtbot):
+
+    """
+    Method for testing that the iterations of the solver are shown on the live canvas one after another
+    """
+
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    for editor in test_app.findChildren(QTextEdit):
+        editor.setText(EDITS_TEXT[editor.objectName()])
+
+    with qtbot.waitSignal(test_app.job_queue.idle, timeout=SOLUTION_TIMEOUT):
+        qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    assert test_app.live_canvas.isVisibleTo(test_app) and not test_app.gif_label.isVisibleTo(test_app)
+    assert test_app.live_canvas.pending  # iterations are waiting for the next timer ticks
+    assert test_app.pause_button.isEnabled()
+
+    qtbot.waitUntil(test_app.live_canvas.is_finished, timeout=LIVE_ANIMATION_TIMEOUT)
+    assert test_app.live_canvas.iteration_text.get_text().startswith("result")
+
+
+def test_background_gif_export(qtbot, tmp_path, monkeypatch):
+
+    """
+    Method for testing that the gif is exported in background when the user asks for it and only the gif is left
+     in the folder
+    """
+
+    monkeypatch.setattr(AppWindow, "export_folder", str(tmp_path))
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    for editor in test_app.findChildren(QTextEdit):
+        editor.setText(EDITS_TEXT[editor.objectName()])
+    test_app.export_check_box.setChecked(True)
+
+    with qtbot.waitSignal(test_app.gif_exported, timeout=GIF_EXPORT_TIMEOUT) as blocker:
+        qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    assert os.path.isfile(blocker.args[0])
+    assert blocker.args[0] in test_app.statusbar.currentMessage()
+    assert [path.suffix for path in tmp_path.iterdir()] == [".gif"]
+    qtbot.waitUntil(lambda: not test_app.job_queue.is_busy(), timeout=SOLUTION_TIMEOUT)
+
+
+def test_queued_problems(qtbot):
+
+    """
+    Method for testing that the problems submitted while another one is solved are queued and solved in turn
+    """
+
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    for editor in test_app.findChildren(QTextEdit):
+        editor.setText(EDITS_TEXT[editor.objectName()])
+
+    qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    test_app.edit_epsilon.setText(QUEUED_EPSILON)
+    qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    assert test_app.job_queue.is_busy()
+
+    with qtbot.waitSignal(test_app.job_queue.idle, timeout=SOLUTION_TIMEOUT):
+        pass
+    assert test_app.results_model.rowCount() == 2
+    assert table_cell(test_app, 0, 2) == EDITS_TEXT[test_app.edit_epsilon.objectName()]
+    assert table_cell(test_app, 1, 2) == QUEUED_EPSILON
+    assert not test_app.cancel_button.isEnabled()
+
+
+def test_multi_dim_problem(qtbot):
+
+    """
+    Method for testing that the function of two variables is solved by the multivariate method
+    """
+
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    test_app.variables_number.setCurrentText("2")
+    assert test_app.minimization_methods_box.currentText() == "Nelder-Mead Method"
+    for editor in test_app.findChildren(QTextEdit):
+        editor.setText(EDITS_TEXT[editor.objectName()])
+    test_app.edit_target_function.setText("(x - 1.5)**2 + (y - 1.5)**2")
+
+    with qtbot.waitSignal(test_app.job_queue.idle, timeout=SOLUTION_TIMEOUT):
+        qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    assert test_app.results_model.rowCount() == 1
+    record = test_app.results_model.history.record(0)
+    assert record.method == "Nelder-Mead Method"
+    assert abs(record.result) < 1e-3
+    assert len(record.trajectory[0][1]) == 2
+    assert not test_app.pause_button.isEnabled()
+
+
+def test_constrained_problem(qtbot, monkeypatch):
+
+    """
+    Method for testing that the constraints are passed to the constrained method and are rejected by the others
+    """
+
+    errors = []
+    monkeypatch.setattr(AppWindow, "show_user_error_mess", staticmethod(errors.append))
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    test_app.variables_number.setCurrentText("2")
+    for editor in test_app.findChildren(QTextEdit):
+        editor.setText(EDITS_TEXT[editor.objectName()])
+    test_app.edit_target_function.setText("x**2 + y**2")
+    test_app.edit_constraints.setText("x + y >= 3")
+
+    qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    assert errors == [ErrorMessage.ERROR_CONSTRAINTS_NOT_SUPPORTED.value]
+    assert not test_app.job_queue.is_busy()
+
+    test_app.minimization_methods_box.setCurrentText("Augmented Lagrangian Method")
+    with qtbot.waitSignal(test_app.job_queue.idle, timeout=SOLUTION_TIMEOUT):
+        qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    record = test_app.results_model.history.record(0)
+    assert record.function == "x**2 + y**2 subject to x + y >= 3"
+    assert record.result == pytest.approx(4.5, abs=0.05)
+    assert "violation" in test_app.statusbar.currentMessage()
+
+
+def test_bracketed_problem(qtbot):
+
+    """
+    Method for testing that the minimum outside the entered interval is found when the bracket search is chosen
+     (with the iterative and the analytic solution)
+    """
+
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    for editor in test_app.findChildren(QTextEdit):
+        editor.setText(EDITS_TEXT[editor.objectName()])
+    test_app.bracket_check_box.setChecked(True)
+    with qtbot.waitSignal(test_app.job_queue.idle, timeout=SOLUTION_TIMEOUT):
+        qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    assert test_app.results_model.history.record(0).result == pytest.approx(-1, abs=1e-3)
+    assert "bracket" in test_app.statusbar.currentMessage()
+
+    test_app.analytic_check_box.setChecked(True)
+    with qtbot.waitSignal(test_app.job_queue.idle, timeout=SOLUTION_TIMEOUT):
+        qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    assert test_app.results_model.history.record(1).result == pytest.approx(-1, abs=1e-12)
+    assert "analytically" in test_app.statusbar.currentMessage()
+
+    test_app.variables_number.setCurrentText("2")
+    assert not test_app.bracket_check_box.isEnabled() and not test_app.analytic_check_box.isEnabled()
+
+
+def test_multi_dim_gif_export(qtbot, tmp_path):
+
+    """
+    Method for testing that the minimization of the function of two variables is exported to the gif in background
+    """
+
+    test_app = AppWindow()
+    test_app.export_folder = str(tmp_path)
+    qtbot.addWidget(test_app)
+    test_app.variables_number.setCurrentText("2")
+    for editor in test_app.findChildren(QTextEdit):
+        editor.setText(EDITS_TEXT[editor.objectName()])
+    test_app.edit_target_function.setText("(x - 1.5)**2 + (y - 1.5)**2")
+    test_app.export_check_box.setChecked(True)
+    test_app.surface_check_box.setChecked(True)
+
+    with qtbot.waitSignal(test_app.gif_exported, timeout=GIF_EXPORT_TIMEOUT) as blocker:
+        qtbot.mouseClick(test_app.solution_button, Qt.LeftButton)
+    assert os.path.isfile(blocker.args[0])
+    qtbot.waitUntil(lambda: not test_app.job_queue.is_busy(), timeout=SOLUTION_TIMEOUT)
+
+
+def test_cancelled_worker(qtbot):
+
+    """
+    Method for testing that the cancelled worker stops the solver and reports the cancellation
+    """
+
+    job = MinimizationJob(parse_expr("sin(x)"), [1, 2], 1e-10, OneDimMinimization.golden_ratio_method)
+    worker = MinimizationWorker(job)
+    worker.cancel()
+    with qtbot.waitSignal(worker.cancelled) as blocker:
+        worker.run()
+    assert blocker.args == [job]
+
+
+def test_results_model_sort_and_filter(qtbot):
+
+    """
+    Testing sorting and filtering of the results table model and inserting of results by one batch
+    """
+
+    model = ResultsTableModel()
+    records = [ResultRecord("x**2", "[-1, 1]", eps, result, method)
+               for eps, result, method in [(0.1, 2., "Golden Ratio Method"), (0.01, -1., "Bisection Method"),
+                                           (0.001, 0.5, "Golden Ratio Method")]]
+    with qtbot.waitSignal(model.rowsInserted) as blocker:
+        model.append_records(records)
+    assert blocker.args[1:] == [0, len(records) - 1]  # one notification for the whole batch
+
+    model.sort(TABLE_COLUMNS.index("Result"), Qt.DescendingOrder)
+    assert [model.data(model.index(row, 3)) for row in range(model.rowCount())] == ["2.0", "0.5", "-1.0"]
+
+    model.set_filter(TABLE_COLUMNS.index("Method"), "golden")
+    assert model.rowCount() == 2
+    model.set_filter(TABLE_COLUMNS.index("Accuracy"), "0.01")
+    assert model.rowCount() == 1 and model.data(model.index(0, 4)) == "Bisection Method"
+
+    model.set_filter(TABLE_COLUMNS.index("Accuracy"), "")
+    model.append_records(records)  # sorted table keeps its order for the new results
+    assert model.rowCount() == 2 * len(records)
+    assert model.data(model.index(0, 3)) == model.data(model.index(1, 3)) == "2.0"
+
+
+def test_function_validation_while_typing(qtbot):
+
+    """
+    Testing that the target function is checked in background while typing and the error is shown under the fields
+    """
+
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+
+    test_app.edit_target_function.setText("sin(x")
+    qtbot.waitUntil(lambda: test_app.function_error_label.text() != "", timeout=VALIDATION_TIMEOUT)
+    assert test_app.function_error_label.text().startswith(ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION.value)
+
+    test_app.edit_target_function.setText("x * y")
+    qtbot.waitUntil(lambda: test_app.function_error_label.text() == ErrorMessage.ERROR_INCORRECT_DIMENSION.value,
+                    timeout=VALIDATION_TIMEOUT)
+
+    test_app.edit_target_function.setText(EDITS_TEXT[test_app.edit_target_function.objectName()])
+    qtbot.waitUntil(lambda: test_app.compiled_function is not None, timeout=VALIDATION_TIMEOUT)
+    assert test_app.function_error_label.text() == ""
+    assert test_app.current_compiled_function()[0] is test_app.compiled_function
+
+
+def test_sweep_results_stream_into_table(qtbot):
+
+    """
+    Testing that the results of the parameter sweep solved in the pool of processes are added to the table
+    """
+
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    problems = ParameterSweep.make_problems("sin(x)", [0.1, 0.01], [1], [2],
+                                            ["Golden Ratio Method", "Bisection Method"])
+
+    with qtbot.waitSignal(test_app.sweep_runner.finished, timeout=SWEEP_TIMEOUT):
+        test_app.start_sweep(problems)
+    assert test_app.results_model.rowCount() == len(problems)
+    assert {table_cell(test_app, row, 4) for row in range(len(problems))} == {"Golden Ratio Method",
+                                                                              "Bisection Method"}
+    assert not test_app.cancel_button.isEnabled() and not test_app.cancel_sweep_button.isEnabled()
+
+
+def test_sweep_has_own_cancel_button(qtbot):
+
+    """
+    Testing that the cancel button of the solved problem does not cancel the sweep and the sweep is cancelled by
+     its own button
+    """
+
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    problems = ParameterSweep.make_problems("sin(x)", [0.1, 0.01, 0.001], [1], [2],
+                                            ["Golden Ratio Method", "Bisection Method"])
+    test_app.start_sweep(problems)
+    assert test_app.cancel_sweep_button.isEnabled() and not test_app.cancel_button.isEnabled()
+    test_app.cancel_button.click()
+    assert test_app.sweep_runner.is_running()
+
+    test_app.cancel_sweep_button.click()
+    assert not test_app.sweep_runner.is_running() and not test_app.cancel_sweep_button.isEnabled()
+
+
+def test_history_export_and_import(qtbot, tmp_path):
+
+    """
+    Testing that the exported history is loaded into a new window and its problems are not solved by the sweep again
+    """
+
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    problems = ParameterSweep.make_problems("sin(x)", [0.1, 0.01], [1], [2], ["Golden Ratio Method"])
+    test_app.results_model.append_records([ResultRecord(problem.function, str(problem.interval), problem.eps, 1.5,
+                                                        problem.method, 0.01, [(0, 1., 2.)])
+                                           for problem in problems])
+    path = str(tmp_path / "history.pb")
+    test_app.export_history(path)
+
+    new_app = AppWindow()
+    qtbot.addWidget(new_app)
+    new_app.import_history(path)
+    assert new_app.results_model.rowCount() == len(problems)
+    assert new_app.results_model.history.record(0).trajectory == [(0, 1., 2.)]
+    new_app.start_sweep(problems)
+    assert not new_app.sweep_runner.is_running()
+    assert new_app.results_model.rowCount() == len(problems)
+
+
+def test_compare_methods(qtbot):
+
+    """
+    Testing that the comparison of all methods is shown in one window
+    """
+
+    test_app = AppWindow()
+    qtbot.addWidget(test_app)
+    for editor in test_app.findChildren(QTextEdit):
+        editor.setText(EDITS_TEXT[editor.objectName()])
+
+    with qtbot.waitSignal(test_app.comparison_done, timeout=SOLUTION_TIMEOUT):
+        qtbot.mouseClick(test_app.compare_button, Qt.LeftButton)
+    qtbot.waitUntil(lambda: test_app.comparison_dialog is not None, timeout=SOLUTION_TIMEOUT)
+    qtbot.addWidget(test_app.comparison_dialog)
+    assert test_app.comparison_dialog.metrics_table.rowCount() == len(ONE_DIM_MINIMIZATION_METHODS)
+    assert len(test_app.comparison_dialog.canvas.fig.axes[0].collections) == len(ONE_DIM_MINIMIZATION_METHODS)
+    assert test_app.compare_button.isEnabled()
@@ -6,11 +6,19 @@ LABELS_TEXT = {'label': "Choose number of variables",
                'label_target_function': "Enter target function",
                'label_bounds': "Enter uncertainty interval",
                'label_minimization_method': "Choose optimization method",
-               'gif_label': ""}
+               'gif_label': "",
+               'loading_label': "",
+               'function_error_label': ""}
 
-BUTTONS_TEXT = {'pause_button': "No gif available",
+BUTTONS_TEXT = {'pause_button': "No animation available",
                 'restart_prog_button': "New problem",
                 'solution_button': "Calculate",
+                'cancel_button': "Cancel",
+                'sweep_button': "Sweep",
+                'cancel_sweep_button': "Cancel sweep",
+                'compare_button': "Compare methods",
+                'export_history_button': "Export results",
+                'import_history_button': "Import results",
                 'exit_button': "Exit"}
 
 EDITS_TEXT = {'edit_target_function': "sin(x)",
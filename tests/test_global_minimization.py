@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from sympy import parse_expr
+from backend.global_minimization import GlobalMinimization, GLOBAL_MINIMIZATION_METHODS
+
+RASTRIGIN = "20 + x**2 - 10*cos(2*pi*x) + y**2 - 10*cos(2*pi*y)"  # many local minima, the global one is at zero
+ACCURACY = 1e-5
+EXPECTED_ACCURACY = 1e-3
+
+
+@pytest.mark.parametrize('method', GLOBAL_MINIMIZATION_METHODS.values(), ids=GLOBAL_MINIMIZATION_METHODS.keys())
+def test_global_minimum(method) -> None:
+
+    """
+    Testing that the population methods find the global minimum of the multimodal function and report the
+     convergence curve with one value for every generation
+    """
+
+    iterations = []
+    results = method(parse_expr(RASTRIGIN), [-5.12, 5.12], ACCURACY, on_iteration=lambda *args: iterations.append(args))
+    assert results[0] == pytest.approx((0., 0.), abs=EXPECTED_ACCURACY)
+    assert len(results[2]) == len(iterations) + 1
+    convergence = results[3]["convergence"]
+    assert len(convergence) == len(results[2])
+    assert np.all(np.diff(convergence) <= 0)  # the best value never gets worse
+    assert convergence[-1] == results[1]
+
+
+@pytest.mark.parametrize('method', GLOBAL_MINIMIZATION_METHODS.values(), ids=GLOBAL_MINIMIZATION_METHODS.keys())
+def test_seed_reproducibility(method) -> None:
+    func = parse_expr("sin(3*x)*cos(2*y) + (x**2 + y**2) / 10")
+    first, second = method(func, [-3, 3], 1e-3, seed=7), method(func, [-3, 3], 1e-3, seed=7)
+    assert first[0] == second[0] and first[3] == second[3]
+    assert method(func, [-3, 3], 1e-3, seed=8)[3]["convergence"] != first[3]["convergence"]
+
+
+def test_process_pool() -> None:
+
+    """
+    Testing that spreading the generations over the pool of processes does not change the result
+    """
+
+    func = parse_expr("(x - 1)**2 + (y + 0.5)**2 + (z - 2)**2")
+    serial = GlobalMinimization.differential_evolution_method(func, [-3, 3], 1e-3)
+    parallel = GlobalMinimization.differential_evolution_method(func, [-3, 3], 1e-3, workers=2)
+    assert parallel[0] == serial[0]
+    assert parallel[3]["evaluations"] == serial[3]["evaluations"]
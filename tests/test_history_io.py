@@ -0,0 +1,33 @@
+import pytest
+from backend.history_io import HistoryIO
+from backend.results_history import ResultRecord
+
+HISTORY_SIZE = 1000
+
+
+@pytest.mark.parametrize('file_name', ["history.csv", "history.jsonl", "history.pb"])
+def test_export_and_import(tmp_path, file_name: str) -> None:
+
+    """
+    Testing that the results with their trajectories and times are loaded from every format without changes
+    """
+
+    records = [ResultRecord("sin(x) + {}".format(index), "[1, 2]", 10. ** -(index % 5), index / 3, "Dichotomy Method",
+                            index * 1e-4, [(iteration, 1. + iteration / 7, 2. - iteration / 9)
+                                           for iteration in range(index % 4)])
+               for index in range(HISTORY_SIZE)]
+    # trajectories of the multivariate methods are boxes
+    records.append(ResultRecord("x*y", "[0, 1]", 0.1, 0., "Nelder-Mead Method", 0.5,
+                                [(0, (0., 0.), (1., 1.)), (1, (0., 0.25), (0.5, 0.75))]))
+    path = str(tmp_path / file_name)
+    HistoryIO.export_records(records, path)
+    assert HistoryIO.import_records(path) == records
+
+
+def test_incorrect_history_file(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        HistoryIO.export_records([], str(tmp_path / "history.txt"))
+    damaged = tmp_path / "history.jsonl"
+    damaged.write_text("{\"function\": \"x\"}\n")
+    with pytest.raises(ValueError):
+        HistoryIO.import_records(str(damaged))
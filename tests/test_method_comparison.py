@@ -0,0 +1,71 @@
+import pytest
+from backend.expression_compiler import ExpressionCompiler
+from backend.method_comparison import MethodComparison
+from backend.evaluation_cache import SharedEvaluationCache
+from backend.one_dimension_minimization import OneDimMinimization, ONE_DIM_MINIMIZATION_METHODS, EMPTY_STR
+
+COMPARISON_EPS = 1e-4
+FAILED_METHOD_MESSAGE = "Method failed"
+
+
+def test_shared_cache_computes_point_once() -> None:
+
+    """
+    Testing that the point requested by two methods is computed once
+    """
+
+    cache = SharedEvaluationCache(ExpressionCompiler.compile("x**2"))
+    first, second = cache.objective(), cache.objective()
+    assert first.subs(None, 3) == second.subs(None, 3.) == 9.
+    assert (first.evaluations, second.evaluations, cache.computations) == (1, 1, 1)
+
+
+def test_compare_all_methods() -> None:
+
+    """
+    Testing that every registered method is measured and finds the minimum with the required accuracy
+    """
+
+    report = MethodComparison.compare(ExpressionCompiler.compile("(x - 1)**2 + sin(3*x)"), [0, 3], COMPARISON_EPS)
+
+    assert [method_report.method for method_report in report.methods] == list(ONE_DIM_MINIMIZATION_METHODS.keys())
+    for method_report in report.methods:
+        assert not method_report.error_msg
+        assert method_report.error < COMPARISON_EPS
+        assert method_report.iterations == max(method_report.borders.keys()) > 0
+        assert method_report.wall_time > 0
+    # the bisection method requests the middle of the interval again, the cache computes it once
+    assert report.computations < sum(method_report.evaluations for method_report in report.methods)
+    assert report.reference_x == pytest.approx(1.4655933, abs=1e-6)
+
+
+def test_shared_probe_points() -> None:
+
+    """
+    Testing that the points requested by several methods are computed once for all of them
+    """
+
+    golden_ratio = ONE_DIM_MINIMIZATION_METHODS["Golden Ratio Method"]
+    report = MethodComparison.compare(ExpressionCompiler.compile("(x - 1)**2"), [0, 3], COMPARISON_EPS,
+                                      {"first": golden_ratio, "second": golden_ratio})
+    first, second = report.methods
+    assert report.computations <= first.evaluations == second.evaluations  # second run computes nothing new
+
+
+def test_errors_of_concurrent_methods() -> None:
+
+    """
+    Testing that the error of the method is reported only for it, while the other methods run at the same time
+     and the error left by the previous problem of this thread is not reported
+    """
+
+    def failing_method(func, interval: list, eps: float) -> list:
+        OneDimMinimization.error_msg = FAILED_METHOD_MESSAGE
+        return []
+
+    OneDimMinimization.error_msg = FAILED_METHOD_MESSAGE
+    methods = dict(ONE_DIM_MINIMIZATION_METHODS, failing=failing_method)
+    report = MethodComparison.compare(ExpressionCompiler.compile("(x - 1)**2"), [0, 3], COMPARISON_EPS, methods)
+    assert [method_report.error_msg for method_report in report.methods] == \
+        [EMPTY_STR] * len(ONE_DIM_MINIMIZATION_METHODS) + [FAILED_METHOD_MESSAGE]
+    OneDimMinimization.error_msg = EMPTY_STR
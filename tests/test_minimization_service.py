@@ -0,0 +1,125 @@
+import json
+import pytest
+from threading import Thread
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from backend.minimization_service import make_server
+from backend.error_message import ErrorMessage
+
+WORKERS_NUMBER = 2
+SERVICE_PROBLEM = {"function": "(x - 1)**2 + (y + 0.5)**2 + x*y/2", "interval": [-2, 2], "eps": 1e-5,
+                   "method": "BFGS Method"}
+ONE_DIM_PROBLEM = {"function": "sin(x)", "interval": [3, 5], "eps": 1e-3, "method": "Golden Ratio Method"}
+
+
+@pytest.fixture(scope="module")
+def service_url():
+    server = make_server(0, WORKERS_NUMBER)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield "http://{}:{}".format(*server.server_address)
+    server.shutdown()
+    server.server_close()
+
+
+def post(url: str, body, headers: dict = None) -> tuple:
+    request = Request(url, json.dumps(body).encode(), headers or {"Content-Type": "application/json"})
+    try:
+        with urlopen(request) as answer:
+            return answer.status, answer.headers["Content-Type"], answer.read()
+    except HTTPError as error:
+        return error.code, error.headers["Content-Type"], error.read()
+
+
+def test_health(service_url: str) -> None:
+
+    """
+    Testing that the service reports the size of its pool
+    """
+
+    with urlopen(service_url + "/health") as answer:
+        assert json.loads(answer.read()) == {"status": "ok", "workers": WORKERS_NUMBER, "pending": 0}
+
+
+def test_solve_and_cache(service_url: str) -> None:
+
+    """
+    Testing that the problem is solved by the service and the repeated problem is answered from the cache
+    """
+
+    status, _, content = post(service_url + "/solve", dict(SERVICE_PROBLEM, trajectory=True))
+    first = json.loads(content)
+    assert status == 200 and not first["cached"]
+    assert first["point"] == pytest.approx([1.2, -0.8], abs=1e-4)
+    assert len(first["trajectory"]) == first["iterations"] + 1
+
+    second = json.loads(post(service_url + "/solve", SERVICE_PROBLEM)[2])
+    assert second["cached"] and second["point"] == first["point"] and "trajectory" not in second
+
+
+def test_batch(service_url: str) -> None:
+
+    """
+    Testing that the incorrect problem of the batch does not stop the others
+    """
+
+    problems = [ONE_DIM_PROBLEM, dict(ONE_DIM_PROBLEM, function="sin(x"), SERVICE_PROBLEM]
+    status, _, content = post(service_url + "/batch", {"problems": problems})
+    results = json.loads(content)["results"]
+    assert status == 200 and len(results) == len(problems)
+    assert results[0]["point"] == pytest.approx(1.5 * 3.14159, abs=1e-2)
+    assert results[1]["error"].startswith(ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION.value)
+    assert "point" in results[2]
+
+
+def test_render(service_url: str) -> None:
+
+    """
+    Testing that the minimization is rendered into the gif
+    """
+
+    status, content_type, content = post(service_url + "/render", ONE_DIM_PROBLEM)
+    assert status == 200 and content_type == "image/gif"
+    assert content.startswith(b"GIF8")
+
+
+def test_incorrect_requests(service_url: str) -> None:
+
+    """
+    Testing the answers to the incorrect requests
+    """
+
+    assert post(service_url + "/solve", {"function": "sin(x)"})[0] == 400
+    assert post(service_url + "/solve", dict(ONE_DIM_PROBLEM, eps=-1))[0] == 400
+    assert post(service_url + "/solve", dict(ONE_DIM_PROBLEM, method="Unknown Method"))[0] == 400
+    assert post(service_url + "/unknown", ONE_DIM_PROBLEM)[0] == 404
+    with pytest.raises(HTTPError, match="404"):
+        urlopen(service_url + "/unknown")
+
+
+@pytest.mark.parametrize("function", ["__import__('os').getpid()*0 + x", "x.func", "'x'", "eval('x')",
+                                      "getattr(x, 'func')"])
+def test_code_in_expression_rejected(service_url: str, function: str) -> None:
+
+    """
+    Testing that the expressions of the requests can not run python code (sympy.parse_expr evaluates its input)
+    """
+
+    status, _, content = post(service_url + "/solve", dict(ONE_DIM_PROBLEM, function=function))
+    assert status == 400
+    assert json.loads(content)["error"].startswith(ErrorMessage.ERROR_INCORRECT_TARGET_FUNCTION.value)
+    status, _, content = post(service_url + "/solve", dict(SERVICE_PROBLEM, method="Penalty Method",
+                                                           constraints=function + " <= 1"))
+    assert status == 400
+    assert json.loads(content)["error"].startswith(ErrorMessage.ERROR_INCORRECT_CONSTRAINTS.value)
+
+
+@pytest.mark.parametrize("headers, expected_status", [({"Content-Type": "text/plain"}, 415),
+                                                      ({"Content-Type": "application/json",
+                                                        "Origin": "http://example.com"}, 403)])
+def test_browser_requests_rejected(service_url: str, headers: dict, expected_status: int) -> None:
+
+    """
+    Testing that the requests which web pages can send (not JSON or cross-origin) are rejected
+    """
+
+    assert post(service_url + "/solve", ONE_DIM_PROBLEM, headers)[0] == expected_status
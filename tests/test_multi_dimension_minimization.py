@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from sympy import parse_expr
+from backend.multi_dimension_minimization import MultiDimMinimization, MULTI_DIM_MINIMIZATION_METHODS, \
+    SUFFICIENT_DECREASE, CURVATURE_CONDITION, METRICS_INDEX
+from backend.vectorized_evaluation import VectorizedEvaluation, CountedFunction
+from backend.results_history import ResultRecord
+from backend.error_message import ErrorMessage
+
+MULTI_DIM_CASES = [("(x - 1)**2 + (y + 0.5)**2", [-2, 2], (1., -0.5)),
+                   ("(x - 1)**2 + (y + 0.5)**2 + x*y/2", [-2, 2], (1.2, -0.8)),
+                   ("x**2 + y**2 + (z - 1)**2", [-3, 3], (0., 0., 1.)),
+                   ("(1 - x)**2 + 10*(y - x**2)**2", [-2, 2], (1., 1.))]
+ACCURACY = 1e-5
+EXPECTED_ACCURACY = 1e-2
+GRADIENT_METHODS = ["Steepest Descent Method", "Conjugate Gradient Method", "BFGS Method"]
+
+
+@pytest.mark.parametrize('method', MULTI_DIM_MINIMIZATION_METHODS.values(),
+                         ids=MULTI_DIM_MINIMIZATION_METHODS.keys())
+@pytest.mark.parametrize('func, interval, expected', MULTI_DIM_CASES)
+def test_multi_dim_methods(method, func: str, interval: list, expected: tuple) -> None:
+
+    """
+    Testing that the multivariate methods find the minimum and report the boxes of the iterations
+    """
+
+    iterations = []
+    results = method(parse_expr(func), interval, ACCURACY, on_iteration=lambda *args: iterations.append(args))
+    assert results[0] == pytest.approx(expected, abs=EXPECTED_ACCURACY)
+    assert results[1] == pytest.approx(float(parse_expr(func).subs(zip("xyz", results[0]))))
+    assert len(results[2]) == len(iterations) + 1
+    assert results[3]["iterations"] == len(iterations)
+    lower, upper = results[2][0]
+    assert len(lower) == len(upper) == len(expected)
+    # the trajectory is kept in the results history as for the one-dimensional methods
+    assert ResultRecord.trajectory_from_borders(results[2])[0] == (0, lower, upper)
+
+
+def test_gradient_methods_metrics() -> None:
+
+    """
+    Testing that the gradient is compiled once per expression and the quasi-Newton method needs fewer evaluations
+     than the method without derivatives on a smooth function
+    """
+
+    func = parse_expr("(x - 1)**2 + 3*(y + 0.5)**2 + x*y")
+    VectorizedEvaluation.compile_gradient.cache_clear()
+    for name in ["Steepest Descent Method", "Conjugate Gradient Method", "BFGS Method"]:
+        MULTI_DIM_MINIMIZATION_METHODS[name](func, [-2, 2], ACCURACY)
+    assert VectorizedEvaluation.compile_gradient.cache_info().misses == 1
+
+    bfgs = MultiDimMinimization.bfgs_method(func, [-2, 2], ACCURACY)[3]
+    nelder_mead = MultiDimMinimization.nelder_mead_method(func, [-2, 2], ACCURACY)[3]
+    assert bfgs["gradient_evaluations"] > 0 and nelder_mead["gradient_evaluations"] == 0
+    assert bfgs["evaluations"] + bfgs["gradient_evaluations"] < nelder_mead["evaluations"]
+
+
+def test_wolfe_line_search() -> None:
+
+    """
+    Testing that the step of the Wolfe line search decreases the function enough and flattens its slope
+    """
+
+    func = parse_expr("x**4 + y**2")
+    objective = CountedFunction(VectorizedEvaluation.vectorize(func)[1])
+    gradient = CountedFunction(VectorizedEvaluation.gradient(func))
+    point = np.array([1.5, 1.])
+    value, grad = objective.at(point), gradient.at(point)
+    step, new_value, new_grad = MultiDimMinimization.wolfe_line_search(objective, gradient, point, -grad, value, grad,
+                                                                       10.)
+    assert new_value <= value - SUFFICIENT_DECREASE * step * (grad @ grad)
+    assert abs(new_grad @ grad) <= CURVATURE_CONDITION * (grad @ grad)
+
+
+def test_multi_dim_errors() -> None:
+    MultiDimMinimization.error_msg = ""
+    assert MultiDimMinimization.nelder_mead_method(parse_expr("x*y"), [0, 1, 2], 0.1) == []
+    assert MultiDimMinimization.error_msg == ErrorMessage.ERROR_TOO_MUCH_BOUNDS.value
+    assert MultiDimMinimization.coordinate_descent_method(parse_expr("3"), [0, 1], 0.1)[1] == 3.
+
+
+@pytest.mark.parametrize("func, expected", [("x*y", -4.), ("sin(x)*y", -2.), ("-x**2 - y**2", -8.)])
+@pytest.mark.parametrize("name", GRADIENT_METHODS)
+def test_stationary_centre_is_left(name: str, func: str, expected: float) -> None:
+
+    """
+    Testing that the gradient methods do not stop at the saddle point or the maximum in the centre of the box where
+     they start, while the minimum in the centre is kept
+    """
+
+    method = MULTI_DIM_MINIMIZATION_METHODS[name]
+    results = method(parse_expr(func), [-2, 2], ACCURACY)
+    assert results[1] == pytest.approx(expected, abs=EXPECTED_ACCURACY)
+    assert results[METRICS_INDEX]["iterations"] > 0
+    results = method(parse_expr("x**2 + y**2"), [-2, 2], ACCURACY)
+    assert results[0] == (0., 0.) and results[METRICS_INDEX]["iterations"] == 0
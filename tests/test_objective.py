@@ -0,0 +1,151 @@
+import sys
+import threading
+import time
+import numpy as np
+import pytest
+from sympy import parse_expr, Symbol
+from backend.objective import Objective, SympyObjective, CallableObjective, CommandObjective, \
+    ObjectiveEvaluationError
+from backend.one_dimension_minimization import ONE_DIM_MINIMIZATION_METHODS
+from backend.multi_dimension_minimization import MULTI_DIM_MINIMIZATION_METHODS, METRICS_INDEX
+from backend.bracketing import Bracketing
+from backend.analytic_minimization import AnalyticMinimization
+from backend.error_message import ErrorMessage
+
+ACCURACY = 1e-5
+# the command printing (x - 2)**2 + 1 for the coordinate given as its argument
+SQUARE_COMMAND = [sys.executable, "-c", "import sys; print((float(sys.argv[1]) - 2) ** 2 + 1)"]
+
+
+def parabola(x: float) -> float:
+    return (x - 2) ** 2 + 1
+
+
+def rosenbrock(x, y):
+    return (1 - x) ** 2 + 100 * (y - x ** 2) ** 2
+
+
+@pytest.mark.parametrize("name", ONE_DIM_MINIMIZATION_METHODS.keys())
+def test_callable_objective_one_dimension(name: str) -> None:
+
+    """
+    Testing that every one-dimensional method minimizes the Python function and the repeated points are not
+     calculated again
+    """
+
+    objective = CallableObjective(parabola)
+    results = ONE_DIM_MINIMIZATION_METHODS[name](objective, [0, 5], ACCURACY)
+    assert results[0] == pytest.approx(2, abs=ACCURACY)
+    assert results[1] == pytest.approx(1)
+    assert objective.computations <= objective.evaluations
+
+
+@pytest.mark.parametrize("name", ["Nelder-Mead Method", "BFGS Method", "Conjugate Gradient Method"])
+def test_vectorized_objective_multi_dimension(name: str) -> None:
+
+    """
+    Testing that the multivariate methods minimize the vectorized Python function (the gradient methods use
+     the central differences) and its variables are taken from the parameters
+    """
+
+    objective = CallableObjective(rosenbrock, vectorized=True)
+    results = MULTI_DIM_MINIMIZATION_METHODS[name](objective, [-2, 2], 1e-6)
+    assert objective.variables == (Symbol("x"), Symbol("y"))
+    assert results[0] == pytest.approx((1, 1), abs=1e-2)
+    assert objective.evaluations >= results[METRICS_INDEX]["evaluations"]
+
+
+def test_finite_difference_gradient() -> None:
+
+    """
+    Testing that the central differences of the black-box function are close to the symbolic gradient
+    """
+
+    points = np.array([[0.5, -1.], [-1.5, 2.], [1., 1.]])
+    expected = SympyObjective(parse_expr("(1 - x)**2 + 100*(y - x**2)**2")).numeric_gradient(points)
+    assert CallableObjective(rosenbrock).numeric_gradient(points) == pytest.approx(expected, rel=1e-6, abs=1e-6)
+
+
+def test_memoized_evaluation() -> None:
+
+    """
+    Testing that the vectorized function is called once for all new points of the request and the known points
+     are taken from the cache
+    """
+
+    calls = []
+    objective = CallableObjective(lambda x: calls.append(len(x)) or x ** 2, vectorized=True)
+    assert objective.numeric_func(np.array([[1.], [2.], [1.]])).tolist() == [1., 4., 1.]
+    assert objective.numeric_func(np.array([[2.], [3.]])).tolist() == [4., 9.]
+    assert calls == [2, 1]
+    assert (objective.evaluations, objective.computations) == (5, 3)
+
+
+def test_parallel_evaluation() -> None:
+
+    """
+    Testing that the thread-safe function is called by several threads at once and the function which is not
+     thread-safe is called by one thread at a time
+    """
+
+    def slow_square(x: float) -> float:
+        nonlocal running, most_running
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return x ** 2
+
+    lock, points = threading.Lock(), np.arange(8.)[:, np.newaxis]
+    for thread_safe in [True, False]:
+        running = most_running = 0
+        with CallableObjective(slow_square, thread_safe=thread_safe, workers=4) as objective:
+            assert objective.numeric_func(points).tolist() == (points[:, 0] ** 2).tolist()
+        assert (most_running > 1) == thread_safe
+
+
+def test_command_objective() -> None:
+
+    """
+    Testing that the external command is minimized (the points of every grid of the k-section method are
+     calculated by the parallel commands) and its failures are reported
+    """
+
+    with CommandObjective(SQUARE_COMMAND, ["x"], workers=4) as objective:
+        results = ONE_DIM_MINIMIZATION_METHODS["K-Section Method"](objective, [0, 5], 1e-3)
+    assert results[0] == pytest.approx(2, abs=1e-3)
+    assert objective.computations <= results[METRICS_INDEX]["evaluations"]
+
+    failing = CommandObjective([sys.executable, "-c", "print('nothing')"], ["x"])
+    with pytest.raises(ObjectiveEvaluationError, match=ErrorMessage.ERROR_OBJECTIVE_EVALUATION_FAILED.value):
+        failing.subs(Symbol("x"), 1.)
+
+
+def test_objective_variables() -> None:
+
+    """
+    Testing that the variables are taken from the positional parameters without defaults and the function with
+     unknown variables is rejected
+    """
+
+    assert CallableObjective(lambda a, b, scale=2.: a * b).variables == (Symbol("a"), Symbol("b"))
+    assert CallableObjective(lambda *point: sum(point), variables=("u", "v")).variables == (Symbol("u"), Symbol("v"))
+    with pytest.raises(ValueError, match=ErrorMessage.ERROR_UNKNOWN_VARIABLES.value):
+        CallableObjective(lambda *point: sum(point))
+
+
+def test_wrapped_methods_with_objective() -> None:
+
+    """
+    Testing that the bracket search works with the black-box function and the analytic minimization leaves it
+     to the iterative method
+    """
+
+    method = ONE_DIM_MINIMIZATION_METHODS["Golden Ratio Method"]
+    method = Bracketing.bracketed(AnalyticMinimization.analytic_first(method))
+    results = method(CallableObjective(parabola), [10], ACCURACY)
+    assert results[0] == pytest.approx(2, abs=ACCURACY)
+    assert "analytic" not in results[METRICS_INDEX]
+    assert Objective.from_function(parse_expr("x**2")).vectorizable
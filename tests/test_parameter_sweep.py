@@ -0,0 +1,50 @@
+import pytest
+from backend.parameter_sweep import ParameterSweep, SweepProblem
+from backend.one_dimension_minimization import ONE_DIM_MINIMIZATION_METHODS
+
+
+@pytest.mark.parametrize('text, logarithmic, expected', [("0.1, 0.01; 0.001", False, [0.1, 0.01, 0.001]),
+                                                         ("0:1:3", False, [0., 0.5, 1.]),
+                                                         ("1e-1:1e-3:3", True, [1e-1, 1e-2, 1e-3])])
+def test_parse_values(text: str, logarithmic: bool, expected: list) -> None:
+
+    """
+    Testing reading of the lists and ranges of the sweep parameters
+    """
+
+    assert ParameterSweep.parse_values(text, logarithmic) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('text', ["", "1:2", "a, b"])
+def test_incorrect_values(text: str) -> None:
+    with pytest.raises(ValueError):
+        ParameterSweep.parse_values(text)
+
+
+def test_cartesian_product() -> None:
+
+    """
+    Testing that the sweep contains every combination of the parameters with correct intervals
+    """
+
+    methods = list(ONE_DIM_MINIMIZATION_METHODS.keys())
+    problems = ParameterSweep.make_problems("x**2", [0.1, 0.01], [-1, 2], [1, 3], methods)
+    # interval [2, 1] is skipped
+    assert len(problems) == len(methods) * 3 * 2
+    assert SweepProblem("x**2", [-1, 3], 0.01, methods[0]) in problems
+
+
+def test_solve_problem() -> None:
+
+    """
+    Testing solving of the sweep problems and reporting of their errors
+    """
+
+    result = ParameterSweep.solve_problem(SweepProblem("(x - 1)**2", [0, 3], 1e-4, "Golden Ratio Method"))
+    assert not result.error_msg
+    assert result.results[0] == pytest.approx(1., abs=1e-3)
+    assert result.results[2]  # intervals are sent back for the trajectory in the results history
+    assert result.wall_time > 0
+
+    assert ParameterSweep.solve_problem(SweepProblem("x**2", [0, 1, 2], 0.1, "Dichotomy Method")).error_msg
+    assert ParameterSweep.solve_problem(SweepProblem("x*y", [0, 1], 0.1, "Dichotomy Method")).error_msg
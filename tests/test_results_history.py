@@ -0,0 +1,71 @@
+from backend.results_history import ResultsHistory, ResultRecord, HISTORY_COLUMNS
+
+HISTORY_SIZE = 20000  # number of results of a long sweep session
+
+
+def test_history_is_columnar() -> None:
+
+    """
+    Testing that the results are stored by columns and restored without changes
+    """
+
+    history = ResultsHistory()
+    records = [ResultRecord("sin(x)", "[1, 2]", 10. ** -(index % 5), float(index), "Dichotomy Method")
+               for index in range(HISTORY_SIZE)]
+    history.append_records(records)
+
+    assert len(history) == HISTORY_SIZE
+    assert history.record(HISTORY_SIZE - 1) == records[-1]
+    assert history.value(7, HISTORY_COLUMNS.index("eps")) == records[7].eps
+
+
+def test_history_sort_and_filter() -> None:
+
+    """
+    Testing sorting of the results by numeric and text columns and filtering them by the value
+    """
+
+    history = ResultsHistory()
+    history.append_records([ResultRecord("x**2", "[0, 1]", 0.1, 3., "b"),
+                            ResultRecord("cos(x)", "[0, 1]", 0.01, 1., "a"),
+                            ResultRecord("x**4", "[0, 1]", 0.1, 2., "c")])
+    all_rows = list(range(len(history)))
+
+    assert history.sorted_rows(all_rows, HISTORY_COLUMNS.index("result")) == [1, 2, 0]
+    assert history.sorted_rows(all_rows, HISTORY_COLUMNS.index("method"), descending=True) == [2, 0, 1]
+    assert history.filtered_rows(HISTORY_COLUMNS.index("eps"), "0.1") == [0, 2]
+    assert history.filtered_rows(HISTORY_COLUMNS.index("function"), "X*") == [0, 2]
+    assert history.filtered_rows(HISTORY_COLUMNS.index("eps"), "not a number") == []
+
+
+def test_history_cache() -> None:
+
+    """
+    Testing that the last result of every problem is found by its key together with the trajectory
+    """
+
+    history = ResultsHistory()
+    trajectory = ResultRecord.trajectory_from_borders({1: (0., 0.6), 0: (0., 1.)})
+    history.append_records([ResultRecord("x**2", "[0, 1]", 0.1, 3., "a", 0.5, trajectory),
+                            ResultRecord("x**2", "[0, 1]", 0.1, 2., "a", 0.25)])
+
+    assert trajectory == [(0, 0., 1.), (1, 0., 0.6)]
+    assert history.cached_record(ResultRecord.problem_key("x**2", "[0, 1]", 0.1, "a")).result == 2.
+    assert history.cached_record(ResultRecord.problem_key("x**2", "[0, 1]", 0.01, "a")) is None
+    assert history.record(0).trajectory == trajectory
+    history.clear()
+    assert history.cached_record(ResultRecord.problem_key("x**2", "[0, 1]", 0.1, "a")) is None
+
+
+def test_problem_key_of_table_and_sweep() -> None:
+
+    """
+    Testing that the problem entered by the user and the same problem of the parameter sweep have the same key
+    """
+
+    history = ResultsHistory()
+    history.append_records([ResultRecord("x**2 ", "[1, 2]", 0.1, 3., "a")])
+    assert history.cached_record(ResultRecord.problem_key("x**2", [1., 2.], 0.1, "a")).result == 3.
+    assert ResultRecord.problem_key("x**2", str([1., 2.]), 1e-1, "a") == \
+        ResultRecord.problem_key("x**2", "[1,2]", "0.1", "a")
+    assert ResultRecord.problem_key("x", "[1, a]", "b", "a") == ("x", ("[1, a]",), "b", "a")
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+from backend.startup_profile import StartupProfile, REPORT_TITLE
+
+HEAVY_MODULES = ["sympy", "matplotlib", "scipy", "imageio"]  # modules which must not be imported before the window
+
+
+def test_startup_profile_report() -> None:
+
+    """
+    Testing that the phases of the start are measured and written in the report in their order
+    """
+
+    profile = StartupProfile()
+    with profile.phase("first phase"):
+        pass
+    profile.mark("window shown")
+
+    report = profile.report().splitlines()
+    assert report[0] == REPORT_TITLE
+    assert report[1].startswith("first phase") and report[2].startswith("window shown")
+    assert all(duration >= 0 for _, duration in profile.phases)
+
+
+def test_gui_import_defers_heavy_modules() -> None:
+
+    """
+    Testing that the import of the window module does not load the solver and rendering stacks
+    """
+
+    code = "import sys, front.gui; print(','.join(name for name in {} if name in sys.modules))".format(HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == ""
@@ -54,3 +54,54 @@ def test_fibonacci_method(test_example: Case) -> None:
                                                            test_example.interval,
                                                            test_example.accuracy)
     assert result_fibonacci[0] - test_example.expected < test_example.accuracy
+
+
+@pytest.mark.parametrize('test_example', ONE_DIM_MINIMIZATION_DATA, ids=str)
+def test_k_section_method(test_example: Case) -> None:
+
+    """
+    Testing K-Section Method
+    """
+
+    result_k_section = OneDimMinimization.k_section_method(parse_expr(test_example.func),
+                                                           test_example.interval,
+                                                           test_example.accuracy)
+    # values of the smooth function closer than about 1e-8 to its minimum are equal in the float precision
+    assert abs(result_k_section[0] - test_example.expected) < max(test_example.accuracy, 1e-7)
+
+
+@pytest.mark.parametrize('points_number', [2, 3, 8, 16])
+def test_k_section_rounds(points_number: int) -> None:
+
+    """
+    Testing that every iteration of K-Section Method evaluates not more than points_number new points and shrinks
+     the interval by the grid step, so it needs fewer rounds than Golden Ratio Method
+    """
+
+    func, interval, accuracy = parse_expr("sin(x)"), [3, 5], 1e-8
+    iterations = []
+    result = OneDimMinimization.k_section_method(func, interval, accuracy, points_number=points_number,
+                                                 on_iteration=lambda *iteration: iterations.append(iteration))
+    borders, metrics = result[2], result[3]
+    assert [iter_num for iter_num, _ in iterations] == sorted(borders.keys())[1:]
+    assert metrics["evaluations"] <= points_number * metrics["iterations"]
+    grid_size = points_number + 1 - points_number % 2
+    for iter_num in list(borders.keys())[2:]:
+        previous, current = borders[iter_num - 1], borders[iter_num]
+        assert (current[1] - current[0]) == pytest.approx(2 * (previous[1] - previous[0]) / (grid_size + 1))
+    assert metrics["iterations"] < max(OneDimMinimization.golden_ratio_method(func, interval, accuracy)[2].keys())
+
+
+@pytest.mark.parametrize('func, interval, expected', [("(x + 1)**2", [-3, 1], -1.), ("x**2", [-1, 1], 0.)])
+def test_neat_zero(func: str, interval: list, expected: float) -> None:
+
+    """
+    Testing that the negative point of minimum is kept and the point of minimum at zero is a "neat" zero
+    """
+
+    for method in [OneDimMinimization.golden_ratio_method, OneDimMinimization.dichotomy_method,
+                   OneDimMinimization.bisection_method, OneDimMinimization.fibonacci_method,
+                   OneDimMinimization.k_section_method]:
+        assert method(parse_expr(func), interval, 1e-6)[0] == pytest.approx(expected, abs=1e-6)
+    assert OneDimMinimization.interval_centre(-1e-17, 0.) == 0.
+    assert OneDimMinimization.interval_centre(-3., -1.) == -2.